@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Benchmark: the MCP server under concurrent load.
+
+Starts a stub upstream API in-process and the server in proxy mode against
+it, then drives a weighted mix of tools/list, tools/call and resources/read
+from many sessions at once:
+
+- stdio: one server process per session, as agents spawn it;
+- http: one server process, every session on the shared HTTP endpoint.
+
+Each session keeps ``--concurrency`` requests in flight for ``--duration``
+seconds. Reports throughput, p50/p95/p99 latency per method and the
+server's resident memory per session (Linux, from /proc).
+
+Usage:
+    python mcp-server/benchmarks/bench_load.py [--transport stdio|http|both]
+        [--sessions N] [--concurrency N] [--duration S]
+        [--mix tools/list=1,tools/call=4,resources/read=2] [--upstream-latency-ms MS]
+        [-- extra server.py options]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import socket
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiohttp import ClientSession, web  # noqa: E402
+
+from server import READY_LINE  # noqa: E402
+from stub_upstream import StubUpstream  # noqa: E402
+
+SERVER = Path(__file__).resolve().parent.parent / "server.py"
+
+TOOL_CALLS = [
+    ("health_question", {"question": "Is it safe to take ibuprofen with lisinopril?"}),
+    ("analyze_symptoms", {"symptoms": ["headache", "fatigue"], "duration": "3 days"}),
+    ("nutrition_analysis", {"food_items": ["oatmeal", "blueberries"], "meal_type": "breakfast"}),
+    ("health_risk_assessment", {"age": 52, "gender": "female", "conditions": ["type 2 diabetes"]}),
+]
+
+RESOURCE_URIS = [
+    "bondmcp://health/guidelines",
+    "bondmcp://health/conditions",
+    "bondmcp://health/medications",
+    "bondmcp://health/nutrition",
+]
+
+INITIALIZE_PARAMS = {"protocolVersion": "2024-11-05", "capabilities": {}, "clientInfo": {"name": "bench-load"}}
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        method, _, weight = part.partition("=")
+        if method not in ("tools/list", "tools/call", "resources/read"):
+            raise argparse.ArgumentTypeError(f"unsupported method {method!r}")
+        mix[method] = float(weight or 1)
+    return mix
+
+
+def make_params(method: str, rng: random.Random) -> Dict[str, Any]:
+    if method == "tools/call":
+        name, arguments = rng.choice(TOOL_CALLS)
+        return {"name": name, "arguments": arguments}
+    if method == "resources/read":
+        return {"uri": rng.choice(RESOURCE_URIS)}
+    return {}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def rss_bytes(pid: int) -> Optional[int]:
+    """Resident set size of a process, or None where /proc is unavailable"""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+class Results:
+    """Latency samples and error counts per method"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def record(self, method: str, seconds: float, ok: bool) -> None:
+        self.latencies.setdefault(method, []).append(seconds)
+        if not ok:
+            self.errors[method] = self.errors.get(method, 0) + 1
+
+
+def response_ok(response: Dict[str, Any]) -> bool:
+    result = response.get("result")
+    return "error" not in response and not (isinstance(result, dict) and result.get("isError"))
+
+
+class StdioSession:
+    """One server process spoken to over its stdin/stdout"""
+
+    def __init__(self, process: asyncio.subprocess.Process):
+        self.process = process
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader = asyncio.ensure_future(self._read())
+
+    @classmethod
+    async def start(cls, server_args: List[str]) -> "StdioSession":
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, str(SERVER), *server_args,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=16 * 1024 * 1024,
+        )
+        session = cls(process)
+        await session.call("initialize", INITIALIZE_PARAMS)
+        return session
+
+    async def _read(self) -> None:
+        async for line in self.process.stdout:
+            message = json.loads(line)
+            future = self._pending.pop(message.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(message)
+
+    async def call(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+        self.process.stdin.write(json.dumps(message).encode("utf-8") + b"\n")
+        await self.process.stdin.drain()
+        return await future
+
+    async def close(self) -> None:
+        self.process.stdin.close()
+        try:
+            await asyncio.wait_for(self.process.wait(), 10)
+        except asyncio.TimeoutError:
+            self.process.kill()
+        self._reader.cancel()
+
+
+class HTTPSession:
+    """One MCP session on a shared HTTP server"""
+
+    def __init__(self, client: ClientSession, url: str):
+        self.client = client
+        self.url = url
+        self.headers: Dict[str, str] = {}
+        self._ids = itertools.count(1)
+
+    async def initialize(self) -> None:
+        async with self.client.post(self.url, json=self._message("initialize", INITIALIZE_PARAMS)) as response:
+            self.headers["Mcp-Session-Id"] = response.headers["Mcp-Session-Id"]
+            await response.read()
+
+    def _message(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params}
+
+    async def call(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        async with self.client.post(self.url, json=self._message(method, params), headers=self.headers) as response:
+            if response.status != 200:
+                return {"error": {"code": response.status}}
+            return await response.json()
+
+
+async def drive(session, mix: Dict[str, float], concurrency: int, deadline: float, results: Results, seed: int) -> None:
+    """Keep ``concurrency`` requests in flight on ``session`` until ``deadline``"""
+    methods, weights = list(mix), list(mix.values())
+
+    async def worker(rng: random.Random) -> None:
+        while time.perf_counter() < deadline:
+            method = rng.choices(methods, weights)[0]
+            start = time.perf_counter()
+            try:
+                response = await session.call(method, make_params(method, rng))
+                ok = response_ok(response)
+            except Exception:
+                ok = False
+            results.record(method, time.perf_counter() - start, ok)
+
+    await asyncio.gather(*(worker(random.Random(seed * 1000 + i)) for i in range(concurrency)))
+
+
+async def run_stdio(args, server_args: List[str], results: Results) -> Tuple[float, List[int]]:
+    sessions = await asyncio.gather(*(StdioSession.start(server_args) for _ in range(args.sessions)))
+    try:
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*(
+            drive(session, args.mix, args.concurrency, deadline, results, seed)
+            for seed, session in enumerate(sessions)
+        ))
+        elapsed = time.perf_counter() - start
+        memory = [rss_bytes(session.process.pid) for session in sessions]
+    finally:
+        await asyncio.gather(*(session.close() for session in sessions))
+    return elapsed, [m for m in memory if m is not None]
+
+
+async def run_http(args, server_args: List[str], results: Results) -> Tuple[float, List[int]]:
+    port = free_port()
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, str(SERVER), *server_args,
+        "--transport", "http", "--port", str(port), "--notify-ready",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    try:
+        line = await asyncio.wait_for(process.stdout.readline(), 15)
+        if line.strip() != READY_LINE.encode("ascii"):
+            raise RuntimeError("HTTP server failed to start")
+        idle = rss_bytes(process.pid)
+        url = f"http://127.0.0.1:{port}/mcp"
+        async with ClientSession() as client:
+            sessions = [HTTPSession(client, url) for _ in range(args.sessions)]
+            await asyncio.gather(*(session.initialize() for session in sessions))
+            start = time.perf_counter()
+            deadline = start + args.duration
+            await asyncio.gather(*(
+                drive(session, args.mix, args.concurrency, deadline, results, seed)
+                for seed, session in enumerate(sessions)
+            ))
+            elapsed = time.perf_counter() - start
+            loaded = rss_bytes(process.pid)
+    finally:
+        process.terminate()
+        await process.wait()
+    if idle is None or loaded is None:
+        return elapsed, []
+    # Sessions share one process: attribute the growth under load to them
+    return elapsed, [max(0, loaded - idle) // args.sessions] * args.sessions
+
+
+def report(transport: str, args, elapsed: float, results: Results, memory: List[int]) -> None:
+    print(f"\n== {transport}: {args.sessions} sessions x {args.concurrency} in flight, {elapsed:.1f}s ==")
+    print(f"{'method':<16}{'count':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    everything: List[float] = []
+    for method, samples in sorted(results.latencies.items()):
+        everything.extend(samples)
+        print_row(method, samples, results.errors.get(method, 0))
+    print_row("all", everything, sum(results.errors.values()))
+    print(f"throughput: {len(everything) / elapsed:.0f} req/s")
+    if memory:
+        label = "RSS per session (server process)" if transport == "stdio" else "RSS growth per session"
+        print(f"{label}: {statistics.mean(memory) / 1024:.0f} KiB")
+
+
+def print_row(method: str, samples: List[float], errors: int) -> None:
+    if len(samples) >= 2:
+        cuts = statistics.quantiles(samples, n=100)
+        p50, p95, p99 = cuts[49] * 1000, cuts[94] * 1000, cuts[98] * 1000
+    else:
+        p50 = p95 = p99 = samples[0] * 1000 if samples else 0.0
+    print(f"{method:<16}{len(samples):>8}{errors:>8}{p50:>10.2f}{p95:>10.2f}{p99:>10.2f}")
+
+
+async def run(args, extra: List[str]) -> None:
+    stub = web.AppRunner(StubUpstream(latency=args.upstream_latency_ms / 1000).build_app())
+    await stub.setup()
+    stub_port = free_port()
+    await web.TCPSite(stub, "127.0.0.1", stub_port).start()
+    server_args = [
+        "--upstream", "--api-base-url", f"http://127.0.0.1:{stub_port}", "--config-poll", "0", *extra
+    ]
+    try:
+        transports = ["stdio", "http"] if args.transport == "both" else [args.transport]
+        for transport in transports:
+            results = Results()
+            runner = run_stdio if transport == "stdio" else run_http
+            elapsed, memory = await runner(args, server_args, results)
+            report(transport, args, elapsed, results, memory)
+    finally:
+        await stub.cleanup()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[1],
+        epilog="Options after -- are passed to every server process."
+    )
+    parser.add_argument("--transport", choices=["stdio", "http", "both"], default="both")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=4, help="Requests in flight per session")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load per transport")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=parse_mix("tools/list=1,tools/call=4,resources/read=2"),
+        help="Relative weights of the methods sent"
+    )
+    parser.add_argument("--upstream-latency-ms", type=float, default=20.0)
+    argv = sys.argv[1:]
+    extra: List[str] = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, extra = argv[:split], argv[split + 1:]
+    args = parser.parse_args(argv)
+    asyncio.run(run(args, extra))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cost of serializing typical MCP responses.
+
+Encodes a tools/list response, a resources/read response for a
+medication-sized resource and a tools/call result with every available
+JSON backend, plus the previous encoding (pretty-printed resource text via
+the stdlib) for reference. Reports microseconds per encode and bytes on the
+wire. Exits non-zero if the default backend exceeds the threshold on any
+payload, so it can gate CI.
+
+Usage:
+    python mcp-server/benchmarks/bench_serialization.py [--iterations N] [--threshold-us US]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from dataclasses import asdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import serialization  # noqa: E402
+from jsonrpc import make_response  # noqa: E402
+from server import DEFAULT_TOOLS  # noqa: E402
+
+MEDICATIONS = {
+    "type": "medications",
+    "data": [
+        {
+            "id": f"med-{i}",
+            "name": f"Medication {i}",
+            "class": "ACE inhibitor" if i % 2 else "NSAID",
+            "dosages_mg": [2.5, 5, 10, 20],
+            "interactions": [f"med-{(i + k) % 200}" for k in range(1, 6)],
+            "warnings": "Monitor renal function; avoid in pregnancy.",
+        }
+        for i in range(200)
+    ],
+}
+
+CALL_RESULT = {
+    "content": [{
+        "type": "text",
+        "text": "Based on consensus across 3 models, ibuprofen may reduce the effect of lisinopril. " * 4,
+    }],
+    "isError": False,
+}
+
+
+def resources_read(dumps, dumps_text):
+    """Full encode of a fetched resource: its text, then the response carrying it"""
+    text = dumps_text(MEDICATIONS)
+    return dumps(make_response(1, {
+        "contents": [{"uri": "bondmcp://health/medications", "mimeType": "application/json", "text": text}]
+    }))
+
+
+TOOLS_LIST = make_response(1, {"tools": [asdict(tool) for tool in DEFAULT_TOOLS]})
+TOOLS_CALL = make_response(1, CALL_RESULT)
+
+
+def stdlib_compact(obj):
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def encoders(dumps, pretty_resources=False):
+    """Encode functions per payload for one dumps implementation"""
+    if pretty_resources:
+        dumps_text = lambda data: json.dumps(data, indent=2)
+    else:
+        dumps_text = lambda data: dumps(data).decode("utf-8")
+    return {
+        "tools/list": lambda: dumps(TOOLS_LIST),
+        "resources/read": lambda: resources_read(dumps, dumps_text),
+        "tools/call": lambda: dumps(TOOLS_CALL),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--threshold-us", type=float, default=500.0)
+    args = parser.parse_args()
+
+    # "legacy" is the previous encoding: stdlib, indent=2 resource text
+    runs = {"legacy": encoders(stdlib_compact, pretty_resources=True)}
+    for name, dumps in serialization.BACKENDS.items():
+        if dumps is not None:
+            runs[name] = encoders(dumps)
+    print(f"default backend: {serialization.backend}\n")
+    print(f"{'payload':<16}{'encoder':<10}{'us/encode':>12}{'bytes':>10}")
+
+    failed = False
+    for payload in runs["legacy"]:
+        for label, funcs in runs.items():
+            encode = funcs[payload]
+            size = len(encode())
+            seconds = min(timeit.repeat(encode, number=args.iterations, repeat=5))
+            per_call_us = seconds / args.iterations * 1e6
+            marker = ""
+            if label == serialization.backend and per_call_us > args.threshold_us:
+                marker = "  <-- over threshold"
+                failed = True
+            print(f"{payload:<16}{label:<10}{per_call_us:>12.1f}{size:>10}{marker}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
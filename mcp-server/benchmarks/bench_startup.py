@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold start of the stdio MCP server.
+
+Spawns ``server.py`` the way an agent does (stdio transport), sends
+``initialize`` and measures wall time from process spawn to the response.
+The cost of starting a bare interpreter is measured the same way and
+subtracted, so the threshold applies to the server's own startup work and
+holds across machines. Exits non-zero if the median overhead exceeds the
+threshold, so it can gate CI.
+
+Usage:
+    python mcp-server/benchmarks/bench_startup.py [--runs N] [--threshold-ms MS]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SERVER = Path(__file__).resolve().parent.parent / "server.py"
+
+INITIALIZE = json.dumps({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {"protocolVersion": "2024-11-05", "capabilities": {}, "clientInfo": {"name": "bench"}},
+}).encode("utf-8") + b"\n"
+
+# Bare interpreter that answers one line, to subtract interpreter startup
+ECHO = "import sys; sys.stdin.buffer.readline(); sys.stdout.write('{}\\n'); sys.stdout.flush()"
+
+
+def time_first_response(command) -> float:
+    """Seconds from spawn until the first line arrives on stdout"""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    try:
+        process.stdin.write(INITIALIZE)
+        process.stdin.flush()
+        line = process.stdout.readline()
+        elapsed = time.perf_counter() - start
+    finally:
+        process.stdin.close()
+        process.wait(timeout=10)
+    if not line:
+        raise RuntimeError(f"No response from {command}")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--threshold-ms", type=float, default=150.0)
+    args = parser.parse_args()
+
+    if sys.flags.dont_write_bytecode:
+        print("note: bytecode caching is disabled, timings include compiling every module\n")
+
+    # One untimed run each warms the page cache and writes .pyc files
+    time_first_response([sys.executable, "-c", ECHO])
+    time_first_response([sys.executable, str(SERVER)])
+
+    baseline = [time_first_response([sys.executable, "-c", ECHO]) for _ in range(args.runs)]
+    server = [time_first_response([sys.executable, str(SERVER)]) for _ in range(args.runs)]
+
+    interpreter_ms = statistics.median(baseline) * 1000
+    server_ms = statistics.median(server) * 1000
+    overhead_ms = server_ms - interpreter_ms
+    print(f"{'interpreter (median)':<28}{interpreter_ms:>10.1f} ms")
+    print(f"{'spawn -> initialize (median)':<28}{server_ms:>10.1f} ms")
+    print(f"{'spawn -> initialize (min)':<28}{min(server) * 1000:>10.1f} ms")
+    print(f"{'server overhead':<28}{overhead_ms:>10.1f} ms")
+
+    if overhead_ms > args.threshold_ms:
+        print(f"FAIL: startup overhead exceeds {args.threshold_ms:g} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-call overhead of tool argument validation.
+
+Times the precompiled validators of every built-in tool against a typical
+valid payload and reports microseconds per call. Exits non-zero if any tool
+exceeds the threshold, so it can gate CI.
+
+Usage:
+    python mcp-server/benchmarks/bench_validation.py [--iterations N] [--threshold-us US]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from server import DEFAULT_TOOLS  # noqa: E402
+from validation import compile_schema  # noqa: E402
+
+SAMPLE_ARGUMENTS = {
+    "health_question": {
+        "question": "Is it safe to take ibuprofen with lisinopril?",
+        "context": "65-year-old with hypertension",
+    },
+    "analyze_symptoms": {
+        "symptoms": ["headache", "fatigue", "mild fever"],
+        "duration": "3 days",
+    },
+    "nutrition_analysis": {
+        "food_items": ["oatmeal", "blueberries", "almond milk"],
+        "meal_type": "breakfast",
+    },
+    "health_risk_assessment": {
+        "age": 52,
+        "gender": "female",
+        "conditions": ["type 2 diabetes"],
+        "lifestyle_factors": {"smoking": False, "exercise": "weekly"},
+    },
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=100_000)
+    parser.add_argument("--threshold-us", type=float, default=10.0)
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'tool':<26}{'us/call':>10}")
+    for tool in DEFAULT_TOOLS:
+        validator = compile_schema(tool.inputSchema)
+        arguments = SAMPLE_ARGUMENTS[tool.name]
+        validator(arguments)  # must be valid before timing
+
+        seconds = min(
+            timeit.repeat(lambda: validator(arguments), number=args.iterations, repeat=5)
+        )
+        per_call_us = seconds / args.iterations * 1e6
+        marker = "" if per_call_us <= args.threshold_us else "  <-- over threshold"
+        failed = failed or bool(marker)
+        print(f"{tool.name:<26}{per_call_us:>10.2f}{marker}")
+
+    compile_seconds = min(
+        timeit.repeat(
+            lambda: [compile_schema(dict(tool.inputSchema)) for tool in DEFAULT_TOOLS],
+            number=1000,
+            repeat=3,
+        )
+    )
+    print(f"\ncached compile lookup (all tools): {compile_seconds / 1000 * 1e6:.2f} us")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Bounded TTL + LRU cache for serialized MCP resource reads.
+
+Entries hold the already-encoded ``resources/read`` result, so a cache hit
+costs a dict lookup and no JSON work. Expired entries are kept (until
+evicted) so their ETag can be used to revalidate against the upstream API
+with If-None-Match instead of downloading the resource again.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from jsonrpc import RawJSON
+
+
+class CacheEntry:
+    """One cached resource body"""
+
+    __slots__ = ("uri", "text", "result", "etag", "expires_at")
+
+    def __init__(self, uri: str, text: str, result: RawJSON, etag: Optional[str], expires_at: float):
+        self.uri = uri
+        self.text = text
+        self.result = result
+        self.etag = etag
+        self.expires_at = expires_at
+
+
+class ResourceCache:
+    """Per-URI resource cache with TTL expiry and LRU eviction"""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            ttl: Seconds an entry is served without revalidation
+            clock: Monotonic time source (overridable in tests)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def get(self, uri: str) -> Optional[CacheEntry]:
+        """Return the entry for ``uri`` (fresh or stale) and mark it recently used"""
+        entry = self._entries.get(uri)
+        if entry is not None:
+            self._entries.move_to_end(uri)
+        return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return entry.expires_at > self.clock()
+
+    def put(self, uri: str, text: str, result: RawJSON, etag: Optional[str] = None) -> CacheEntry:
+        entry = CacheEntry(uri, text, result, etag, self.clock() + self.ttl)
+        self._entries[uri] = entry
+        self._entries.move_to_end(uri)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def touch(self, entry: CacheEntry) -> None:
+        """Extend a stale entry after the upstream confirmed it is unchanged"""
+        entry.expires_at = self.clock() + self.ttl
+        self.revalidations += 1
+
+    def invalidate(self, uri: str) -> bool:
+        return self._entries.pop(uri, None) is not None
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+        }
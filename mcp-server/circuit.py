@@ -0,0 +1,115 @@
+"""
+Circuit breakers for the upstream BondMCP API.
+
+One breaker per upstream endpoint counts consecutive failures. Once the
+threshold is reached the circuit opens and calls to that endpoint fail
+immediately instead of each waiting out a timeout. After ``reset_timeout``
+one probe call is let through (half-open): success closes the circuit,
+failure opens it again for another ``reset_timeout``.
+
+Breakers are plain counters driven from the event loop thread, so they need
+no locking.
+"""
+
+import time
+from typing import Callable, Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Failure counter and state machine for one endpoint"""
+
+    __slots__ = (
+        "failure_threshold", "reset_timeout", "clock",
+        "state", "failures", "opened_at", "_probing",
+    )
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+    def allow(self) -> bool:
+        """Whether a call may go out now; in half-open only one probe at a time"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN:
+            if self.clock() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = HALF_OPEN
+            self._probing = False
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def retry_after(self) -> float:
+        """Seconds until the next probe is allowed (0 unless open)"""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_timeout - self.clock())
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._probing = False
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = OPEN
+            self.opened_at = self.clock()
+
+    def release(self) -> None:
+        """Settle a call that ended without telling us anything (e.g. cancelled by its caller)"""
+        self._probing = False
+
+
+class CircuitBreakers:
+    """Breakers keyed by endpoint, created on first use with shared settings"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open a circuit
+            reset_timeout: Seconds an open circuit waits before a probe
+            clock: Monotonic time source (overridable in tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        # Calls failed fast because their circuit was open
+        self.rejected = 0
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._breakers[endpoint] = CircuitBreaker(
+                self.failure_threshold, self.reset_timeout, self.clock
+            )
+        return breaker
+
+    def open_count(self) -> int:
+        return sum(1 for breaker in self._breakers.values() if breaker.state != CLOSED)
+
+    def states(self) -> Dict[str, str]:
+        return {endpoint: breaker.state for endpoint, breaker in self._breakers.items()}
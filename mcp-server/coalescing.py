@@ -0,0 +1,72 @@
+"""
+In-flight request coalescing for the BondMCP MCP server.
+
+When several agents issue the same tool call or resource read at the same
+time, only the first one does the work; the rest wait on its result. N
+concurrent duplicates therefore cost one upstream round trip.
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+def canonical_arguments(arguments: Dict[str, Any]) -> Optional[str]:
+    """Order-independent key for a JSON arguments object, or None if unserializable"""
+    try:
+        return json.dumps(arguments, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+
+
+class _InFlight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    """
+    Share one running coroutine between concurrent callers with the same key.
+
+    The work runs in its own task. A caller that is cancelled stops waiting
+    without disturbing the others, and the shared task is only cancelled once
+    every waiter has gone. Callers receive the same result object, so results
+    must be treated as read-only.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, _InFlight] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._inflight.get(key)
+        if entry is None:
+            entry = _InFlight(asyncio.ensure_future(factory()))
+            self._inflight[key] = entry
+            entry.task.add_done_callback(lambda _: self._forget(key, entry))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+
+        entry.waiters += 1
+        try:
+            return await asyncio.shield(entry.task)
+        finally:
+            entry.waiters -= 1
+            if entry.waiters == 0 and not entry.task.done():
+                entry.task.cancel()
+
+    def _forget(self, key: Hashable, entry: _InFlight) -> None:
+        if self._inflight.get(key) is entry:
+            del self._inflight[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "inflight": len(self._inflight),
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+        }
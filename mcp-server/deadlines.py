@@ -0,0 +1,42 @@
+"""
+Request deadlines for the BondMCP MCP server.
+
+The deadline of the tool call being executed is kept in a context variable,
+so it follows the call into every task it spawns (coalesced executions,
+upstream requests) without being threaded through each signature. Upstream
+calls read it to cap their own timeout and to tell the API how long the
+caller is still willing to wait.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# Header carrying the caller's remaining budget, in milliseconds, to the upstream API
+DEADLINE_HEADER = "X-Request-Timeout-Ms"
+
+# Absolute deadline in event loop time, or None when unbounded
+current_deadline: ContextVar[Optional[float]] = ContextVar("bondmcp_deadline", default=None)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline, or None if there is none"""
+    deadline = current_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - asyncio.get_running_loop().time()
+
+
+@contextmanager
+def deadline_scope(timeout: float) -> Iterator[float]:
+    """Run the enclosed block under a deadline no later than the current one"""
+    deadline = asyncio.get_running_loop().time() + timeout
+    outer = current_deadline.get()
+    if outer is not None and outer < deadline:
+        deadline = outer
+    token = current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        current_deadline.reset(token)
@@ -0,0 +1,341 @@
+"""
+Streamable HTTP transport for the BondMCP MCP server.
+
+Implements the MCP "Streamable HTTP" shape on a single endpoint:
+
+- ``POST /mcp`` carries one JSON-RPC message or batch array. The reply is plain JSON, or an
+  SSE stream when the client accepts ``text/event-stream``; progress
+  notifications for that request are streamed ahead of the result.
+- ``GET /mcp`` opens a long-lived SSE stream for server-initiated messages on
+  the caller's session. The stream is optional: while none is open, such
+  messages (including progress for plain-JSON requests) are dropped.
+- ``DELETE /mcp`` ends a session; sessions idle for ``session_ttl`` with no
+  open stream are also expired.
+
+All connections share one event loop. A semaphore bounds how many requests
+are dispatched at once, and requests beyond ``max_pending`` are shed with
+503 instead of queueing without limit. Each session has a bounded outbound
+queue; messages for an SSE reader too slow to keep up are dropped rather
+than stalling whoever produced them or growing memory.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+try:
+    from aiohttp import web
+except ImportError:
+    raise ImportError("Please install required dependencies: pip install aiohttp")
+
+import serialization
+from jsonrpc import (
+    INVALID_REQUEST,
+    PARSE_ERROR,
+    JSONRPCDispatcher,
+    Notify,
+    RawJSON,
+    Response,
+    encode_message,
+    make_error,
+)
+
+SESSION_HEADER = "Mcp-Session-Id"
+SSE_CONTENT_TYPE = "text/event-stream"
+
+logger = logging.getLogger("bondmcp-server")
+
+
+def encode_sse(payload: Response) -> bytes:
+    return b"event: message\ndata: " + encode_message(payload) + b"\n\n"
+
+
+def json_response(
+    payload: Response, request: web.Request, headers: Dict[str, str]
+) -> web.Response:
+    """Encode a JSON-RPC reply, answering 304 when a cached catalog is still valid"""
+    result = payload.get("result") if isinstance(payload, dict) else None
+    if isinstance(result, RawJSON) and result.etag is not None:
+        etag = '"' + result.etag + '"'
+        headers["ETag"] = etag
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers=headers)
+    return web.Response(
+        body=encode_message(payload), content_type="application/json", headers=headers
+    )
+
+
+class HTTPSession:
+    """Server-side state for one MCP client session"""
+
+    def __init__(self, session_id: str, queue_size: int):
+        self.session_id = session_id
+        self.outbound: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        # Open GET streams reading ``outbound``
+        self.listeners = 0
+        self.dropped = 0
+        self.last_active = time.monotonic()
+
+    async def send(self, payload: Dict[str, Any]) -> None:
+        """Queue a server-initiated message for the GET stream; never waits"""
+        if not self.listeners:
+            return
+        try:
+            self.outbound.put_nowait(payload)
+        except asyncio.QueueFull:
+            if not self.dropped:
+                logger.warning("Session %s is not reading its stream; dropping messages", self.session_id)
+            self.dropped += 1
+
+
+class HTTPTransport:
+    """Serve a JSON-RPC dispatcher over streamable HTTP"""
+
+    def __init__(
+        self,
+        dispatcher: JSONRPCDispatcher,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        path: str = "/mcp",
+        max_concurrency: int = 64,
+        max_pending: int = 1024,
+        session_queue_size: int = 256,
+        session_ttl: float = 1800.0,
+        keepalive_timeout: float = 75.0,
+        sse_ping_interval: float = 15.0,
+        reuse_port: bool = False,
+    ):
+        """
+        Args:
+            dispatcher: Dispatcher shared by every connection
+            host: Interface to bind
+            port: TCP port to bind
+            path: URL path of the MCP endpoint
+            max_concurrency: Requests dispatched at the same time
+            max_pending: Requests admitted at once, running or waiting for
+                a dispatch slot; any more are shed with 503
+            session_queue_size: Outbound messages buffered per session
+            session_ttl: Seconds a session with no open stream may go
+                without a request before it is expired (0 = never)
+            keepalive_timeout: Seconds an idle HTTP keep-alive connection is kept
+            sse_ping_interval: Seconds between SSE keep-alive comments
+            reuse_port: Bind with SO_REUSEPORT so several worker processes
+                can share the port (see supervisor.py)
+        """
+        self.dispatcher = dispatcher
+        self.host = host
+        self.port = port
+        self.path = path
+        self.max_pending = max_pending
+        self.session_queue_size = session_queue_size
+        self.session_ttl = session_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.sse_ping_interval = sse_ping_interval
+        self.reuse_port = reuse_port
+
+        self.sessions: Dict[str, HTTPSession] = {}
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._pending = 0
+        metrics = dispatcher.server.metrics
+        self._requests, self._latency = metrics.for_transport("http")
+        self._queued = metrics.queue_depth.labels("http")
+        self._shed = metrics.requests_shed.labels("http_backlog")
+        self._runner: Optional[web.AppRunner] = None
+        self._sweeper: Optional[asyncio.Task] = None
+
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post(self.path, self._handle_post)
+        app.router.add_get(self.path, self._handle_get)
+        app.router.add_delete(self.path, self._handle_delete)
+        app.on_startup.append(self._start_sweeper)
+        app.on_cleanup.append(self._stop_sweeper)
+        return app
+
+    async def start(self) -> None:
+        self._runner = web.AppRunner(
+            self.build_app(), keepalive_timeout=self.keepalive_timeout
+        )
+        await self._runner.setup()
+        site = web.TCPSite(
+            self._runner, self.host, self.port, reuse_port=self.reuse_port or None
+        )
+        await site.start()
+        logger.info("Serving MCP over HTTP on %s:%s%s", self.host, self.port, self.path)
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def serve(self) -> None:
+        """Start serving and block until cancelled"""
+        await self.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.stop()
+
+    def expire_idle_sessions(self) -> int:
+        """Forget sessions idle past ``session_ttl`` with no open stream"""
+        cutoff = time.monotonic() - self.session_ttl
+        expired = [
+            session_id for session_id, session in self.sessions.items()
+            if not session.listeners and session.last_active < cutoff
+        ]
+        for session_id in expired:
+            del self.sessions[session_id]
+        return len(expired)
+
+    async def _start_sweeper(self, app: web.Application) -> None:
+        if self.session_ttl > 0:
+            self._sweeper = asyncio.ensure_future(self._sweep())
+
+    async def _stop_sweeper(self, app: web.Application) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    async def _sweep(self) -> None:
+        while True:
+            await asyncio.sleep(min(60.0, self.session_ttl / 4))
+            expired = self.expire_idle_sessions()
+            if expired:
+                logger.info("Expired %d idle HTTP session(s)", expired)
+
+    def _get_session(self, request: web.Request) -> Optional[HTTPSession]:
+        session_id = request.headers.get(SESSION_HEADER)
+        if session_id is None:
+            return None
+        session = self.sessions.get(session_id)
+        if session is not None:
+            session.last_active = time.monotonic()
+        return session
+
+    def _admit(self) -> None:
+        """Take a place in the backlog, or shed the request with 503"""
+        if self._pending >= self.max_pending:
+            self._shed.inc()
+            raise web.HTTPServiceUnavailable(headers={"Retry-After": "1"})
+        self._pending += 1
+        self._queued.inc()
+
+    def _release(self) -> None:
+        """Give back a place taken by _admit() before it reached a slot"""
+        self._queued.dec()
+        self._pending -= 1
+
+    async def _dispatch(
+        self,
+        message: Any,
+        session: Optional[HTTPSession],
+        notify: Optional[Notify] = None,
+    ) -> Optional[Response]:
+        """Run a request admitted by _admit() once a dispatch slot is free"""
+        queued = True
+        try:
+            async with self._slots:
+                self._queued.dec()
+                queued = False
+                start = time.perf_counter()
+                try:
+                    return await self.dispatcher.handle(message, session, notify)
+                finally:
+                    self._requests.inc()
+                    self._latency.observe(time.perf_counter() - start)
+        finally:
+            if queued:
+                self._release()
+            else:
+                self._pending -= 1
+
+    async def _handle_post(self, request: web.Request) -> web.StreamResponse:
+        try:
+            message = serialization.loads(await request.read())
+        except ValueError:
+            return web.json_response(make_error(None, PARSE_ERROR, "Parse error"))
+
+        headers = {}
+        session = self._get_session(request)
+        if isinstance(message, dict) and message.get("method") == "initialize":
+            session = HTTPSession(uuid.uuid4().hex, self.session_queue_size)
+            self.sessions[session.session_id] = session
+        elif SESSION_HEADER in request.headers and session is None:
+            raise web.HTTPNotFound(text="Unknown session")
+        if session is not None:
+            headers[SESSION_HEADER] = session.session_id
+
+        # Shed before any stream is opened: once an SSE reply's 200 has gone
+        # out, a 503 can no longer be sent
+        self._admit()
+        if SSE_CONTENT_TYPE not in request.headers.get("Accept", ""):
+            response = await self._dispatch(message, session)
+            if response is None:
+                return web.Response(status=202, headers=headers)
+            return json_response(response, request, headers)
+
+        try:
+            stream = await self._open_sse(request, headers)
+        except BaseException:
+            self._release()
+            raise
+
+        async def notify(payload: Dict[str, Any]) -> None:
+            await stream.write(encode_sse(payload))
+
+        response = await self._dispatch(message, session, notify)
+        if response is not None:
+            await stream.write(encode_sse(response))
+        await stream.write_eof()
+        return stream
+
+    async def _handle_get(self, request: web.Request) -> web.StreamResponse:
+        session = self._get_session(request)
+        if session is None:
+            return web.json_response(
+                make_error(None, INVALID_REQUEST, "Missing or unknown session"),
+                status=400,
+            )
+
+        stream = await self._open_sse(request, {SESSION_HEADER: session.session_id})
+        session.listeners += 1
+        try:
+            while session.session_id in self.sessions:
+                try:
+                    payload = await asyncio.wait_for(
+                        session.outbound.get(), timeout=self.sse_ping_interval
+                    )
+                except asyncio.TimeoutError:
+                    await stream.write(b": keep-alive\n\n")
+                    continue
+                # write() waits for the socket to drain, pacing this session only
+                await stream.write(encode_sse(payload))
+        finally:
+            session.listeners -= 1
+        return stream
+
+    async def _handle_delete(self, request: web.Request) -> web.Response:
+        session = self._get_session(request)
+        if session is None:
+            raise web.HTTPNotFound(text="Unknown session")
+        del self.sessions[session.session_id]
+        return web.Response(status=204)
+
+    async def _open_sse(
+        self, request: web.Request, headers: Dict[str, str]
+    ) -> web.StreamResponse:
+        stream = web.StreamResponse(
+            headers={
+                "Content-Type": SSE_CONTENT_TYPE,
+                "Cache-Control": "no-cache",
+                **headers,
+            }
+        )
+        await stream.prepare(request)
+        return stream
@@ -0,0 +1,322 @@
+"""
+JSON-RPC 2.0 dispatch for the BondMCP MCP server.
+
+Maps MCP method names onto BondMCPServer coroutines and builds the response
+envelopes. Transports own framing and I/O; this module only turns one decoded
+message (a request object or a batch array of them) into its response.
+"""
+
+import asyncio
+import logging
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple, Union
+
+import serialization
+
+JSONRPC_VERSION = "2.0"
+
+# Standard JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+logger = logging.getLogger("bondmcp-server")
+
+# Delivers a server-initiated message (notification) to the client
+Notify = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Reply to one message: a response object, or an array of them for a batch
+Response = Union[Dict[str, Any], List[Dict[str, Any]]]
+
+# Session of the request being handled, for per-client policy (see scheduling.py)
+current_session: ContextVar[Any] = ContextVar("bondmcp_session", default=None)
+
+
+class JSONRPCError(Exception):
+    """Raised by method handlers to produce a JSON-RPC error response"""
+
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+
+class RawJSON:
+    """Pre-serialized JSON value spliced verbatim into an outgoing message"""
+
+    __slots__ = ("data", "etag")
+
+    def __init__(self, data: bytes, etag: Optional[str] = None):
+        self.data = data
+        self.etag = etag
+
+
+def encode_message(payload: Response) -> bytes:
+    """Serialize a response, splicing in RawJSON results without re-encoding"""
+    if isinstance(payload, list):
+        return b"[" + b",".join(encode_message(item) for item in payload) + b"]"
+    result = payload.get("result")
+    if isinstance(result, RawJSON):
+        request_id = serialization.dumps(payload["id"])
+        return b'{"jsonrpc":"2.0","id":' + request_id + b',"result":' + result.data + b"}"
+    return serialization.dumps(payload)
+
+
+def make_response(request_id: Any, result: Any) -> Dict[str, Any]:
+    return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": result}
+
+
+def make_notification(method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    return {"jsonrpc": JSONRPC_VERSION, "method": method, "params": params}
+
+
+def make_error(request_id: Any, code: int, message: str, data: Any = None) -> Dict[str, Any]:
+    error: Dict[str, Any] = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "error": error}
+
+
+def _hashable_id(request_id: Any) -> Hashable:
+    # Ids are strings or numbers per the spec; tolerate anything else by repr
+    return request_id if isinstance(request_id, (str, int, float)) or request_id is None else repr(request_id)
+
+
+def progress_reporter(notify: Notify, token: Any) -> Callable[[Dict[str, Any]], Awaitable[None]]:
+    """
+    Turn partial tool content into MCP ``notifications/progress`` messages.
+
+    Each partial content item is carried in the notification (text items
+    also as its ``message``), so a client sees the first model's answer
+    without waiting for the final tools/call result.
+    """
+    count = 0
+
+    async def report(chunk: Dict[str, Any]) -> None:
+        nonlocal count
+        count += 1
+        params: Dict[str, Any] = {"progressToken": token, "progress": count, "content": [chunk]}
+        if chunk.get("type") == "text":
+            params["message"] = chunk.get("text")
+        await notify(make_notification("notifications/progress", params))
+
+    return report
+
+
+class JSONRPCDispatcher:
+    """
+    Routes JSON-RPC requests to a BondMCPServer.
+
+    One dispatcher is shared by every connection of a transport; it holds no
+    per-request state, so concurrent handle() calls are safe. Connection
+    state lives in the ``session`` object each transport passes in, which
+    must provide an async ``send(payload)`` for server-initiated messages.
+    Notifications tied to one request (progress) go to ``notify`` when the
+    transport passes one, e.g. the SSE stream answering that request, and
+    to the session otherwise.
+
+    Requests that arrive with a session run in their own task, tracked by
+    (session, id), so a ``notifications/cancelled`` from that session can
+    cancel the work. Cancelled requests get no response, per the MCP spec.
+
+    The members of a batch array are independent, so they are handled
+    concurrently and their responses returned together as one array.
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self._running: Dict[Tuple[Any, Hashable], asyncio.Task] = {}
+        self._cancelled: Set[Tuple[Any, Hashable]] = set()
+        self._methods: Dict[str, Callable[[Dict[str, Any], Any, Optional[Notify]], Awaitable[Any]]] = {
+            "initialize": self._initialize,
+            "ping": self._ping,
+            "tools/list": self._tools_list,
+            "tools/call": self._tools_call,
+            "resources/list": self._resources_list,
+            "resources/templates/list": self._resources_templates_list,
+            "resources/read": self._resources_read,
+            "resources/subscribe": self._resources_subscribe,
+            "resources/unsubscribe": self._resources_unsubscribe,
+        }
+
+    async def handle(
+        self, message: Any, session: Any = None, notify: Optional[Notify] = None
+    ) -> Optional[Response]:
+        """Handle one decoded message. Returns None when nothing needs a response."""
+        if isinstance(message, list):
+            return await self._handle_batch(message, session, notify)
+        return await self._handle_one(message, session, notify)
+
+    async def _handle_batch(
+        self, messages: List[Any], session: Any, notify: Optional[Notify]
+    ) -> Optional[Response]:
+        if not messages:
+            return make_error(None, INVALID_REQUEST, "Invalid Request")
+        responses = await asyncio.gather(
+            *(self._handle_one(message, session, notify) for message in messages)
+        )
+        # A batch of notifications only gets no response at all
+        return [response for response in responses if response is not None] or None
+
+    async def _handle_one(
+        self, message: Any, session: Any, notify: Optional[Notify]
+    ) -> Optional[Dict[str, Any]]:
+        if not isinstance(message, dict) or message.get("jsonrpc") != JSONRPC_VERSION:
+            return make_error(None, INVALID_REQUEST, "Invalid Request")
+
+        method = message.get("method")
+        if not isinstance(method, str):
+            return make_error(message.get("id"), INVALID_REQUEST, "Invalid Request")
+
+        if "id" not in message:
+            await self._notify(method, message.get("params") or {}, session)
+            return None
+
+        request_id = message["id"]
+        handler = self._methods.get(method)
+        if handler is None:
+            return make_error(request_id, METHOD_NOT_FOUND, "Method not found")
+
+        params = message.get("params") or {}
+        if not isinstance(params, dict):
+            return make_error(request_id, INVALID_PARAMS, "Invalid params")
+
+        if notify is None and session is not None:
+            notify = session.send
+        token = current_session.set(session)
+        try:
+            if session is None:
+                result = await handler(params, session, notify)
+            else:
+                result = await self._run_cancellable(
+                    session, request_id, handler(params, session, notify)
+                )
+        except asyncio.CancelledError:
+            if self._cancelled_by_client(session, request_id):
+                return None
+            raise
+        except JSONRPCError as e:
+            return make_error(request_id, e.code, e.message, e.data)
+        except Exception:
+            logger.exception("Unhandled error in %s", method)
+            return make_error(request_id, INTERNAL_ERROR, "Internal error")
+        finally:
+            current_session.reset(token)
+        return make_response(request_id, result)
+
+    async def _run_cancellable(self, session: Any, request_id: Any, work: Awaitable[Any]) -> Any:
+        key = (session, _hashable_id(request_id))
+        task = asyncio.ensure_future(work)
+        self._running[key] = task
+        try:
+            return await task
+        finally:
+            if self._running.get(key) is task:
+                del self._running[key]
+
+    def _cancelled_by_client(self, session: Any, request_id: Any) -> bool:
+        key = (session, _hashable_id(request_id))
+        if key in self._cancelled:
+            self._cancelled.discard(key)
+            return True
+        return False
+
+    async def _notify(self, method: str, params: Dict[str, Any], session: Any) -> None:
+        if method == "notifications/cancelled":
+            key = (session, _hashable_id(params.get("requestId")))
+            task = self._running.get(key)
+            if task is not None and not task.done():
+                logger.info("Cancelling request %s: %s", key[1], params.get("reason", ""))
+                self._cancelled.add(key)
+                task.cancel()
+            return
+        # notifications/initialized and friends need no action yet
+        logger.debug("Notification received: %s", method)
+
+    async def _initialize(
+        self, params: Dict[str, Any], session: Any, notify: Optional[Notify]
+    ) -> Dict[str, Any]:
+        self.server.open_session(session, params.get("clientInfo"))
+        capabilities = await self.server.get_capabilities()
+        server_info = capabilities["serverInfo"]
+        return {
+            "protocolVersion": server_info["protocol_version"],
+            "capabilities": {
+                "tools": {"listChanged": True},
+                "resources": {"subscribe": True, "listChanged": True},
+                "experimental": capabilities["capabilities"]["experimental"],
+            },
+            "serverInfo": {
+                "name": server_info["name"],
+                "version": server_info["version"],
+            },
+        }
+
+    async def _ping(
+        self, params: Dict[str, Any], session: Any, notify: Optional[Notify]
+    ) -> Dict[str, Any]:
+        return {}
+
+    async def _tools_list(
+        self, params: Dict[str, Any], session: Any, notify: Optional[Notify]
+    ) -> RawJSON:
+        return self.server.catalog.tools_result
+
+    async def _tools_call(
+        self, params: Dict[str, Any], session: Any, notify: Optional[Notify]
+    ) -> Dict[str, Any]:
+        name = params.get("name")
+        arguments = params.get("arguments") or {}
+        if not isinstance(name, str) or not isinstance(arguments, dict):
+            raise JSONRPCError(INVALID_PARAMS, "Invalid params")
+        meta = params.get("_meta")
+        token = meta.get("progressToken") if isinstance(meta, dict) else None
+        if token is None or notify is None:
+            return await self.server.call_tool(name, arguments)
+        return await self.server.call_tool(name, arguments, progress_reporter(notify, token))
+
+    async def _resources_list(
+        self, params: Dict[str, Any], session: Any, notify: Optional[Notify]
+    ) -> RawJSON:
+        cursor = params.get("cursor")
+        if cursor is not None and not isinstance(cursor, str):
+            raise JSONRPCError(INVALID_PARAMS, "Invalid params")
+        return self.server.resources_page(cursor)
+
+    async def _resources_templates_list(
+        self, params: Dict[str, Any], session: Any, notify: Optional[Notify]
+    ) -> RawJSON:
+        return self.server.catalog.templates_result
+
+    async def _resources_read(
+        self, params: Dict[str, Any], session: Any, notify: Optional[Notify]
+    ) -> Dict[str, Any]:
+        uri = params.get("uri")
+        if not isinstance(uri, str):
+            raise JSONRPCError(INVALID_PARAMS, "Invalid params")
+        # Resource failures surface as JSONRPCError subclasses from the server
+        return await self.server.read_resource(uri)
+
+    async def _resources_subscribe(
+        self, params: Dict[str, Any], session: Any, notify: Optional[Notify]
+    ) -> Dict[str, Any]:
+        uri = params.get("uri")
+        if not isinstance(uri, str):
+            raise JSONRPCError(INVALID_PARAMS, "Invalid params")
+        if session is None:
+            raise JSONRPCError(INVALID_REQUEST, "Subscriptions require a session")
+        self.server.subscribe(uri, session)
+        return {}
+
+    async def _resources_unsubscribe(
+        self, params: Dict[str, Any], session: Any, notify: Optional[Notify]
+    ) -> Dict[str, Any]:
+        uri = params.get("uri")
+        if not isinstance(uri, str):
+            raise JSONRPCError(INVALID_PARAMS, "Invalid params")
+        if session is not None:
+            self.server.unsubscribe(uri, session)
+        return {}
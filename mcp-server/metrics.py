@@ -0,0 +1,277 @@
+"""
+Prometheus-style metrics for the BondMCP MCP server.
+
+Metric children are created once per label set and then held by the code
+that records into them, so the hot path is an attribute increment or a
+bisect into a fixed bucket array with no per-call allocation. Nothing here
+records tool arguments or resource contents, so metrics are PHI-free by
+construction.
+
+Metrics are exposed in the Prometheus text format (0.0.4) by
+``MetricsServer`` on an optional local port.
+"""
+
+import asyncio
+import inspect
+import logging
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds, from sub-millisecond cache hits to slow consensus calls
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+logger = logging.getLogger("bondmcp-server")
+
+
+class Counter:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class Gauge:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(bounds)
+        # One slot per bucket plus the +Inf overflow slot
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricFamily:
+    """A named metric with zero or more labelled children"""
+
+    def __init__(self, name: str, help_text: str, kind: str, labelnames: Sequence[str], factory: Callable[[], object]):
+        self.name = name
+        self.help_text = help_text
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self._factory = factory
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def labels(self, *values: str):
+        """Return the child for a label set, creating it on first use"""
+        child = self._children.get(values)
+        if child is None:
+            child = self._children[values] = self._factory()
+        return child
+
+    def render(self, lines: List[str]) -> None:
+        lines.append(f"# HELP {self.name} {self.help_text}")
+        lines.append(f"# TYPE {self.name} {self.kind}")
+        for values, child in self._children.items():
+            labels = ",".join(f'{k}="{_escape(v)}"' for k, v in zip(self.labelnames, values))
+            if isinstance(child, Histogram):
+                cumulative = 0
+                for bound, count in zip(child.bounds + (float("inf"),), child.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    bucket_labels = f'{labels},le="{le}"' if labels else f'le="{le}"'
+                    lines.append(f"{self.name}_bucket{{{bucket_labels}}} {cumulative}")
+                suffix = f"{{{labels}}}" if labels else ""
+                lines.append(f"{self.name}_sum{suffix} {child.sum!r}")
+                lines.append(f"{self.name}_count{suffix} {child.count}")
+            else:
+                suffix = f"{{{labels}}}" if labels else ""
+                lines.append(f"{self.name}{suffix} {_format(child.value)}")
+
+
+class CallbackMetric:
+    """Single-value metric read from a callable at scrape time"""
+
+    def __init__(self, name: str, help_text: str, kind: str, read: Callable[[], float]):
+        self.name = name
+        self.help_text = help_text
+        self.kind = kind
+        self.read = read
+
+    def render(self, lines: List[str]) -> None:
+        lines.append(f"# HELP {self.name} {self.help_text}")
+        lines.append(f"# TYPE {self.name} {self.kind}")
+        lines.append(f"{self.name} {_format(self.read())}")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class MetricsRegistry:
+    """Ordered collection of metric families rendered together"""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+
+    def _add(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Duplicate metric: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> MetricFamily:
+        return self._add(MetricFamily(name, help_text, "counter", labelnames, Counter))
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> MetricFamily:
+        return self._add(MetricFamily(name, help_text, "gauge", labelnames, Gauge))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> MetricFamily:
+        return self._add(MetricFamily(name, help_text, "histogram", labelnames, lambda: Histogram(buckets)))
+
+    def callback(self, name: str, help_text: str, kind: str, read: Callable[[], float]) -> CallbackMetric:
+        return self._add(CallbackMetric(name, help_text, kind, read))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            metric.render(lines)
+        return "\n".join(lines) + "\n"
+
+
+class ToolMetrics:
+    """Pre-bound metric children for one tool"""
+
+    __slots__ = ("calls", "errors", "duration")
+
+    def __init__(self, calls: Counter, errors: Counter, duration: Histogram):
+        self.calls = calls
+        self.errors = errors
+        self.duration = duration
+
+
+class ResourceMetrics:
+    """Pre-bound metric children for one resource"""
+
+    __slots__ = ("reads", "duration")
+
+    def __init__(self, reads: Counter, duration: Histogram):
+        self.reads = reads
+        self.duration = duration
+
+
+class ServerMetrics:
+    """All metrics recorded by a BondMCPServer and its transports"""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry if registry is not None else MetricsRegistry()
+        r = self.registry
+        self.tool_calls = r.counter("bondmcp_tool_calls_total", "Tool calls executed", ["tool"])
+        self.tool_errors = r.counter("bondmcp_tool_errors_total", "Tool calls returning isError", ["tool"])
+        self.tool_duration = r.histogram("bondmcp_tool_duration_seconds", "Tool call latency", ["tool"])
+        self.unknown_tool_calls = r.counter("bondmcp_unknown_tool_calls_total", "Calls to unregistered tools").labels()
+        self.tools_in_flight = r.gauge("bondmcp_tool_calls_in_flight", "Tool calls currently executing").labels()
+        self.resource_reads = r.counter("bondmcp_resource_reads_total", "Resource reads", ["resource"])
+        self.resource_duration = r.histogram("bondmcp_resource_read_duration_seconds", "Resource read latency", ["resource"])
+        self.transport_requests = r.counter("bondmcp_transport_requests_total", "JSON-RPC messages handled", ["transport"])
+        self.transport_duration = r.histogram("bondmcp_transport_request_duration_seconds", "JSON-RPC message latency", ["transport"])
+        self.queue_depth = r.gauge("bondmcp_queue_depth", "Requests waiting for a dispatch slot", ["transport"])
+        self.requests_shed = r.counter("bondmcp_requests_shed_total", "Requests refused by admission control", ["reason"])
+        self._tools: Dict[str, ToolMetrics] = {}
+        self._resources: Dict[str, ResourceMetrics] = {}
+
+    def for_tool(self, name: str) -> ToolMetrics:
+        """Bound metrics for a registered tool name (created once, then cached)"""
+        bound = self._tools.get(name)
+        if bound is None:
+            bound = self._tools[name] = ToolMetrics(
+                self.tool_calls.labels(name),
+                self.tool_errors.labels(name),
+                self.tool_duration.labels(name),
+            )
+        return bound
+
+    def for_resource(self, label: str) -> ResourceMetrics:
+        """Bound metrics for a resource label (created once, then cached)"""
+        bound = self._resources.get(label)
+        if bound is None:
+            bound = self._resources[label] = ResourceMetrics(
+                self.resource_reads.labels(label),
+                self.resource_duration.labels(label),
+            )
+        return bound
+
+    def for_transport(self, transport: str) -> Tuple[Counter, Histogram]:
+        """Bound request counter and latency histogram for a transport"""
+        return (
+            self.transport_requests.labels(transport),
+            self.transport_duration.labels(transport),
+        )
+
+
+class MetricsServer:
+    """
+    Minimal HTTP endpoint serving the registry in Prometheus text format.
+
+    ``registry`` is anything with a ``render()`` returning the page text, or
+    an awaitable of it (supervisor.py aggregates workers asynchronously).
+    """
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9464):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        logger.info("Serving metrics on %s:%s", self.host, self.port)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            # Any request gets the metrics page; drain the request head first
+            while (await reader.readline()).strip():
+                pass
+            text = self.registry.render()
+            if inspect.isawaitable(text):
+                text = await text
+            body = text.encode("utf-8")
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                b"Content-Length: " + str(len(body)).encode("ascii") + b"\r\n"
+                b"Connection: close\r\n\r\n" + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
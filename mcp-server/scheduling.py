@@ -0,0 +1,225 @@
+"""
+Admission control and fair scheduling of tool calls.
+
+A shared HTTP server must not let one noisy agent starve the others, nor
+outrun the upstream API's quota. ``FairScheduler`` sits in front of tool
+execution and combines:
+
+- a token bucket per session: calls beyond a session's sustained rate and
+  burst are shed at once with a retry hint;
+- a bounded queue per session, so a flood from one client cannot occupy
+  every waiting slot;
+- start-time fair queuing across sessions: when calls have to wait for an
+  execution slot (``concurrency``) or for the global call rate (``rate``,
+  kept below the upstream quota so the API never has to answer 429), each
+  session gets capacity in proportion to its weight, however many calls
+  it has queued.
+
+Everything runs on the event loop thread, so no locking is needed.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens per second, holding at most ``burst``"""
+
+    __slots__ = ("rate", "burst", "tokens", "updated", "clock")
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.burst
+        self.clock = clock
+        self.updated = clock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self) -> bool:
+        """Consume one token if one is available"""
+        self._refill()
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+    def delay(self) -> float:
+        """Seconds until the next token is available"""
+        self._refill()
+        return max(0.0, (1.0 - self.tokens) / self.rate)
+
+
+class Shed(Exception):
+    """Raised when a call is refused admission"""
+
+    def __init__(self, reason: str, retry_after: float = 0.0):
+        super().__init__(f"Request shed ({reason})")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class _SessionState:
+    __slots__ = ("weight", "bucket", "queued", "finish")
+
+    def __init__(self, weight: float, bucket: Optional[TokenBucket]):
+        self.weight = weight
+        self.bucket = bucket
+        self.queued = 0
+        # Virtual finish time of this session's latest call
+        self.finish = 0.0
+
+
+class FairScheduler:
+    """Per-session rate limits plus a weighted fair queue for execution slots"""
+
+    def __init__(
+        self,
+        concurrency: int = 0,
+        rate: float = 0.0,
+        burst: Optional[float] = None,
+        session_rate: float = 0.0,
+        session_burst: Optional[float] = None,
+        session_queue: int = 16,
+        client_weights: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            concurrency: Calls executing at once (0 = unlimited)
+            rate: Calls started per second across all sessions (0 = unlimited)
+            burst: Calls the global rate allows back to back (default: rate)
+            session_rate: Sustained calls per second per session (0 = unlimited)
+            session_burst: Calls a session may make back to back (default: session_rate)
+            session_queue: Calls a session may have waiting before more are shed
+            client_weights: Share of capacity by MCP clientInfo name (default 1)
+            clock: Monotonic time source (overridable in tests)
+        """
+        self.concurrency = concurrency
+        self.session_rate = session_rate
+        self.session_burst = session_burst
+        self.session_queue = session_queue
+        self.client_weights = dict(client_weights or {})
+        self.clock = clock
+        self._bucket = TokenBucket(rate, burst, clock) if rate > 0 else None
+        self._sessions: "weakref.WeakKeyDictionary[Any, _SessionState]" = weakref.WeakKeyDictionary()
+        # Calls made without a session share one state
+        self._anonymous = self._new_state(1.0)
+        self._waiting: List[Tuple[float, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._virtual_time = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.running = 0
+
+    def _new_state(self, weight: float) -> _SessionState:
+        bucket = None
+        if self.session_rate > 0:
+            bucket = TokenBucket(self.session_rate, self.session_burst, self.clock)
+        return _SessionState(weight, bucket)
+
+    def _state(self, session: Any) -> _SessionState:
+        if session is None:
+            return self._anonymous
+        state = self._sessions.get(session)
+        if state is None:
+            state = self._sessions[session] = self._new_state(1.0)
+        return state
+
+    def identify(self, session: Any, client_name: Optional[str]) -> None:
+        """Apply the configured weight for an MCP client to its session"""
+        weight = self.client_weights.get(client_name) if client_name is not None else None
+        if weight is not None and session is not None:
+            self.set_weight(session, weight)
+
+    def set_weight(self, session: Any, weight: float) -> None:
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        self._state(session).weight = weight
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for entry in self._waiting if not entry[2].done())
+
+    async def acquire(self, session: Any = None) -> None:
+        """
+        Wait for an execution slot; raises Shed if the session is over its limits.
+
+        Every successful acquire() must be paired with release().
+        """
+        state = self._state(session)
+        if state.bucket is not None and not state.bucket.take():
+            raise Shed("session_rate", state.bucket.delay())
+        if state.queued >= self.session_queue:
+            raise Shed("session_queue")
+
+        # Start tag: a session that was idle starts at the current virtual
+        # time, a busy one queues behind its own earlier calls
+        start = max(self._virtual_time, state.finish)
+        state.finish = start + 1.0 / state.weight
+        if not self._waiting and self._has_slot():
+            self._start(start)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting, (start, next(self._sequence), future))
+        state.queued += 1
+        # The queue may only hold calls cancelled while waiting
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted as we were cancelled; hand it on
+                self.release()
+            raise
+        finally:
+            state.queued -= 1
+
+    def release(self) -> None:
+        self.running -= 1
+        self._dispatch()
+
+    def _has_slot(self) -> bool:
+        if self.concurrency and self.running >= self.concurrency:
+            return False
+        if self._bucket is not None and not self._bucket.take():
+            self._arm_timer()
+            return False
+        return True
+
+    def _start(self, start: float) -> None:
+        self.running += 1
+        self._virtual_time = max(self._virtual_time, start)
+
+    def _dispatch(self) -> None:
+        waiting = self._waiting
+        while waiting:
+            if waiting[0][2].done():
+                # Cancelled while queued
+                heapq.heappop(waiting)
+                continue
+            if not self._has_slot():
+                return
+            start, _, future = heapq.heappop(waiting)
+            self._start(start)
+            future.set_result(None)
+
+    def _arm_timer(self) -> None:
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._bucket.delay(), self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
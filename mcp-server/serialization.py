@@ -0,0 +1,63 @@
+"""
+JSON encoding backend for the BondMCP MCP server.
+
+Every response frame, catalog and resource body goes through ``dumps`` /
+``loads`` here. The backend is chosen once: orjson when it is installed
+(several times faster than the stdlib on the nested dicts MCP responses are
+made of), the stdlib ``json`` module otherwise. Both emit compact UTF-8 with
+no pretty-printing.
+
+``use()`` switches the backend, e.g. from the ``--json-backend`` option or
+to compare them in benchmarks/bench_serialization.py. Call through the
+module (``serialization.dumps(...)``) rather than importing the functions,
+so a switch takes effect everywhere.
+"""
+
+import json
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    try:
+        return orjson.dumps(obj)
+    except TypeError:
+        # orjson is stricter (non-str keys, ints beyond 64 bits); the stdlib
+        # decides what is serializable
+        return _stdlib_dumps(obj)
+
+
+BACKENDS: Dict[str, Optional[Callable[[Any], bytes]]] = {
+    "json": _stdlib_dumps,
+    "orjson": _orjson_dumps if orjson is not None else None,
+}
+
+_LOADS = {
+    "json": json.loads,
+    "orjson": orjson.loads if orjson is not None else None,
+}
+
+backend = "orjson" if orjson is not None else "json"
+dumps: Callable[[Any], bytes] = BACKENDS[backend]
+loads: Callable[[Any], Any] = _LOADS[backend]
+
+
+def use(name: str = "auto") -> str:
+    """Select the backend ("auto", "orjson" or "json"); returns the one in use"""
+    global backend, dumps, loads
+    if name == "auto":
+        name = "orjson" if orjson is not None else "json"
+    if BACKENDS.get(name) is None:
+        raise ValueError(f"JSON backend {name!r} is not available")
+    backend = name
+    dumps = BACKENDS[name]
+    loads = _LOADS[name]
+    return name
@@ -9,45 +9,862 @@ Currently operates in development mode due to API infrastructure not being deplo
 import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass
-from urllib.parse import urlparse
+import os
+import signal
+import time
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple, Union
+from dataclasses import asdict, dataclass, replace
+
+import serialization
+from deadlines import deadline_scope
+from metrics import ServerMetrics
+from jsonrpc import INTERNAL_ERROR, INVALID_PARAMS, JSONRPCError, RawJSON, current_session, make_notification
+
+# Needed only for tool calls, resource reads and CLI parsing; imported where
+# used so that answering initialize does not pay for them
+if TYPE_CHECKING:
+    import argparse
+    import re
+    from cache import CacheEntry, ResourceCache
+    from coalescing import RequestCoalescer
+    from scheduling import FairScheduler, Shed
+
+PROTOCOL_VERSION = "2024-11-05"
 
 # MCP Protocol types (simplified implementation)
-@dataclass
+@dataclass(frozen=True)
 class MCPResource:
     uri: str
     name: str
     description: str
     mimeType: str
 
-@dataclass
+@dataclass(frozen=True)
+class MCPResourceTemplate:
+    uriTemplate: str
+    name: str
+    description: str
+    mimeType: str
+
+@dataclass(frozen=True)
 class MCPTool:
     name: str
     description: str
     inputSchema: Dict[str, Any]
 
+@dataclass(frozen=True)
+class MCPCatalog:
+    """
+    Immutable snapshot of everything the server advertises.
+    
+    Built once and shared by every request. The list results are stored
+    pre-serialized so tools/list and resources/list never re-encode, and
+    ``version`` changes whenever the advertised content does, which lets
+    clients poll cheaply with ETag / If-None-Match.
+    
+    resources/list is served in pages of ``page_size``; page N+1 is
+    requested with the ``nextCursor`` of page N, which embeds the catalog
+    version so a cursor from a replaced catalog is rejected, not misread.
+    """
+    tools: Tuple[MCPTool, ...]
+    resources: Tuple[MCPResource, ...]
+    resource_templates: Tuple[MCPResourceTemplate, ...]
+    capabilities: Dict[str, Any]
+    resource_uris: FrozenSet[str]
+    version: str
+    tools_result: RawJSON
+    resource_pages: Tuple[RawJSON, ...]
+    templates_result: RawJSON
+    
+    @property
+    def resources_result(self) -> RawJSON:
+        """First (or only) page of resources/list"""
+        return self.resource_pages[0]
+
+# Resources per resources/list page
+DEFAULT_PAGE_SIZE = 100
+
+def build_catalog(
+    tools: Sequence[MCPTool],
+    resources: Sequence[MCPResource],
+    capabilities: Dict[str, Any],
+    templates: Sequence[MCPResourceTemplate] = (),
+    page_size: int = DEFAULT_PAGE_SIZE
+) -> MCPCatalog:
+    """Precompute the serialized list results and content version"""
+    import hashlib  # deferred: not needed before the first tools/list
+    
+    tools_json = serialization.dumps({"tools": [asdict(tool) for tool in tools]})
+    listed = [asdict(resource) for resource in resources]
+    templates_json = serialization.dumps(
+        {"resourceTemplates": [asdict(template) for template in templates]}
+    )
+    
+    digest = hashlib.sha256(tools_json)
+    digest.update(serialization.dumps(listed))
+    digest.update(templates_json)
+    digest.update(json.dumps(capabilities, sort_keys=True).encode("utf-8"))
+    version = digest.hexdigest()[:16]
+    
+    pages = []
+    for number, offset in enumerate(range(0, max(len(listed), 1), page_size)):
+        page: Dict[str, Any] = {"resources": listed[offset:offset + page_size]}
+        if offset + page_size < len(listed):
+            page["nextCursor"] = f"{version}:{number + 1}"
+        # Pages after the first get their own ETag so 304s never cross pages
+        etag = version if number == 0 else f"{version}-{number}"
+        pages.append(RawJSON(serialization.dumps(page), etag=etag))
+    
+    return MCPCatalog(
+        tools=tuple(tools),
+        resources=tuple(resources),
+        resource_templates=tuple(templates),
+        resource_uris=frozenset(resource.uri for resource in resources),
+        capabilities=capabilities,
+        version=version,
+        tools_result=RawJSON(tools_json, etag=version),
+        resource_pages=tuple(pages),
+        templates_result=RawJSON(templates_json, etag=version)
+    )
+
+# Healthcare resources advertised by the server
+# Note: These would connect to actual API endpoints when deployed
+DEFAULT_RESOURCES = (
+    MCPResource(
+        uri="bondmcp://health/guidelines",
+        name="Health Guidelines",
+        description="Evidence-based health guidelines and recommendations",
+        mimeType="application/json"
+    ),
+    MCPResource(
+        uri="bondmcp://health/conditions",
+        name="Medical Conditions",
+        description="Comprehensive medical condition database",
+        mimeType="application/json"
+    ),
+    MCPResource(
+        uri="bondmcp://health/medications",
+        name="Medication Database",
+        description="Drug information and interaction database",
+        mimeType="application/json"
+    ),
+    MCPResource(
+        uri="bondmcp://health/nutrition",
+        name="Nutrition Database",
+        description="Nutritional information and meal planning",
+        mimeType="application/json"
+    )
+)
+
+# Single entries of the large databases, so a lookup never reads a whole collection
+DEFAULT_RESOURCE_TEMPLATES = (
+    MCPResourceTemplate(
+        uriTemplate="bondmcp://health/conditions/{id}",
+        name="Medical Condition",
+        description="One condition from the medical condition database",
+        mimeType="application/json"
+    ),
+    MCPResourceTemplate(
+        uriTemplate="bondmcp://health/medications/{id}",
+        name="Medication",
+        description="Drug information and interactions for one medication",
+        mimeType="application/json"
+    ),
+    MCPResourceTemplate(
+        uriTemplate="bondmcp://health/nutrition/{id}",
+        name="Food Item",
+        description="Nutritional information for one food item",
+        mimeType="application/json"
+    )
+)
+
+# Healthcare tools advertised by the server
+DEFAULT_TOOLS = (
+    MCPTool(
+        name="health_question",
+        description="Ask health-related questions with AI consensus",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "question": {
+                    "type": "string",
+                    "description": "Health question to ask"
+                },
+                "context": {
+                    "type": "string",
+                    "description": "Additional context for the question",
+                    "default": ""
+                }
+            },
+            "required": ["question"]
+        }
+    ),
+    MCPTool(
+        name="analyze_symptoms",
+        description="Analyze symptoms and provide guidance",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symptoms": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of symptoms to analyze"
+                },
+                "duration": {
+                    "type": "string",
+                    "description": "How long symptoms have been present"
+                }
+            },
+            "required": ["symptoms"]
+        }
+    ),
+    MCPTool(
+        name="nutrition_analysis",
+        description="Analyze nutritional content and provide recommendations",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "food_items": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of food items to analyze"
+                },
+                "meal_type": {
+                    "type": "string",
+                    "enum": ["breakfast", "lunch", "dinner", "snack"],
+                    "description": "Type of meal"
+                }
+            },
+            "required": ["food_items"]
+        }
+    ),
+    MCPTool(
+        name="health_risk_assessment",
+        description="Assess health risks based on provided data",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "age": {"type": "integer"},
+                "gender": {"type": "string"},
+                "conditions": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Existing health conditions"
+                },
+                "lifestyle_factors": {
+                    "type": "object",
+                    "description": "Lifestyle factors (smoking, exercise, diet, etc.)"
+                }
+            },
+            "required": ["age", "gender"]
+        }
+    )
+)
+
+# Upstream API endpoint each tool proxies to when an UpstreamClient is configured
+UPSTREAM_ENDPOINTS = {
+    "health_question": "/api/v1/ask",
+    "analyze_symptoms": "/api/v1/symptoms",
+    "nutrition_analysis": "/api/v1/nutrition/analyze",
+    "health_risk_assessment": "/api/v1/risk-assessment"
+}
+
+# Endpoints streaming per-model answers (NDJSON) ahead of the consensus.
+# The API defines no streaming contract, so none is assumed: a tool streams
+# only when its config entry names a "streamEndpoint".
+UPSTREAM_STREAM_ENDPOINTS: Dict[str, str] = {}
+
+# Upstream API endpoint each resource is fetched from in proxy mode
+UPSTREAM_RESOURCE_ENDPOINTS = {
+    "bondmcp://health/guidelines": "/api/v1/resources/guidelines",
+    "bondmcp://health/conditions": "/api/v1/resources/conditions",
+    "bondmcp://health/medications": "/api/v1/resources/medications",
+    "bondmcp://health/nutrition": "/api/v1/resources/nutrition"
+}
+
+# Upstream path of each resource template; {variables} are URL-quoted
+UPSTREAM_RESOURCE_TEMPLATE_ENDPOINTS = {
+    "bondmcp://health/conditions/{id}": "/api/v1/resources/conditions/{id}",
+    "bondmcp://health/medications/{id}": "/api/v1/resources/medications/{id}",
+    "bondmcp://health/nutrition/{id}": "/api/v1/resources/nutrition/{id}"
+}
+
+# Resource bodies served in development mode
+DEVELOPMENT_RESOURCE_DATA = {
+    "bondmcp://health/guidelines": {
+        "type": "health_guidelines",
+        "data": "[DEVELOPMENT MODE] Health guidelines would be fetched from deployed API",
+        "note": "Once api.bondmcp.com is deployed, this will return actual evidence-based guidelines"
+    },
+    "bondmcp://health/conditions": {
+        "type": "medical_conditions",
+        "data": "[DEVELOPMENT MODE] Medical conditions database",
+        "note": "Will integrate with comprehensive medical condition database when deployed"
+    },
+    "bondmcp://health/medications": {
+        "type": "medications",
+        "data": "[DEVELOPMENT MODE] Medication database",
+        "note": "Will provide drug information and interactions when API is deployed"
+    },
+    "bondmcp://health/nutrition": {
+        "type": "nutrition",
+        "data": "[DEVELOPMENT MODE] Nutrition database", 
+        "note": "Will provide comprehensive nutritional data when API is available"
+    }
+}
+
+def compile_uri_template(template: str) -> "re.Pattern[str]":
+    """Regex matching a level-1 URI template: each {name} is one path segment"""
+    import re
+    pattern = "".join(
+        f"(?P<{part[1:-1]}>[^/?#]+)" if part.startswith("{") else re.escape(part)
+        for part in re.split(r"(\{[A-Za-z_][A-Za-z0-9_]*\})", template)
+    )
+    return re.compile(pattern + r"\Z")
+
+def encode_resource(uri: str, data: Any) -> Tuple[str, RawJSON]:
+    """Serialize a resource once into its (compact) text and its full resources/read result"""
+    text = serialization.dumps(data).decode("utf-8")
+    result = serialization.dumps(
+        {"contents": [{"uri": uri, "mimeType": "application/json", "text": text}]}
+    )
+    return text, RawJSON(result)
+
+# Seconds a server-initiated notification may wait on one session
+BROADCAST_TIMEOUT = 5.0
+
+# Catalog file loaded by main() and watched for changes
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mcp-config.json")
+
+@dataclass(frozen=True)
+class ServerConfig:
+    """Tool and resource definitions loaded from mcp-config.json"""
+    tools: Tuple[MCPTool, ...]
+    resources: Tuple[MCPResource, ...]
+    resource_templates: Tuple[MCPResourceTemplate, ...]
+    # Upstream paths declared per entry ("endpoint"), overriding the built-in tables
+    tool_endpoints: Dict[str, str]
+    resource_endpoints: Dict[str, str]
+    template_endpoints: Dict[str, str]
+    # NDJSON endpoints declared per tool entry ("streamEndpoint")
+    tool_stream_endpoints: Dict[str, str]
+
+def _config_entries(data: Dict[str, Any], section: str) -> List[Dict[str, Any]]:
+    entries = data.get(section, [])
+    if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+        raise ValueError(f"'{section}' must be a list of objects")
+    return entries
+
+def parse_config(data: Any) -> ServerConfig:
+    """Validate the tools and resources sections of an mcp-config.json document"""
+    if not isinstance(data, dict):
+        raise ValueError("config must be a JSON object")
+    from validation import check_schema
+    
+    tools, tool_endpoints, tool_stream_endpoints = [], {}, {}
+    for entry in _config_entries(data, "tools"):
+        name, schema = entry.get("name"), entry.get("inputSchema")
+        if not isinstance(name, str) or not isinstance(schema, dict):
+            raise ValueError(f"tool entries need a name and an inputSchema object: {entry.get('name')!r}")
+        try:
+            check_schema(schema)
+        except ValueError as e:
+            raise ValueError(f"tool {name!r} has an invalid inputSchema: {e}") from None
+        tools.append(MCPTool(name=name, description=str(entry.get("description", "")), inputSchema=schema))
+        if isinstance(entry.get("endpoint"), str):
+            tool_endpoints[name] = entry["endpoint"]
+        if isinstance(entry.get("streamEndpoint"), str):
+            tool_stream_endpoints[name] = entry["streamEndpoint"]
+    
+    resources, resource_endpoints = [], {}
+    for entry in _config_entries(data, "resources"):
+        uri = entry.get("uri")
+        if not isinstance(uri, str):
+            raise ValueError(f"resource entries need a uri: {entry!r}")
+        resources.append(MCPResource(
+            uri=uri,
+            name=str(entry.get("name", uri)),
+            description=str(entry.get("description", "")),
+            mimeType=str(entry.get("mimeType", "application/json"))
+        ))
+        if isinstance(entry.get("endpoint"), str):
+            resource_endpoints[uri] = entry["endpoint"]
+    
+    templates, template_endpoints = [], {}
+    for entry in _config_entries(data, "resourceTemplates"):
+        uri_template = entry.get("uriTemplate")
+        if not isinstance(uri_template, str):
+            raise ValueError(f"resource template entries need a uriTemplate: {entry!r}")
+        templates.append(MCPResourceTemplate(
+            uriTemplate=uri_template,
+            name=str(entry.get("name", uri_template)),
+            description=str(entry.get("description", "")),
+            mimeType=str(entry.get("mimeType", "application/json"))
+        ))
+        if isinstance(entry.get("endpoint"), str):
+            template_endpoints[uri_template] = entry["endpoint"]
+    
+    return ServerConfig(
+        tuple(tools), tuple(resources), tuple(templates),
+        tool_endpoints, resource_endpoints, template_endpoints, tool_stream_endpoints
+    )
+
+def load_config(path: str) -> ServerConfig:
+    with open(path, "rb") as f:
+        return parse_config(serialization.loads(f.read()))
+
+def config_signature(path: str) -> Optional[Tuple[int, int]]:
+    """Cheap change detector for the config file: (mtime_ns, size), None if missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+class ResourceError(JSONRPCError):
+    """Raised when a resource cannot be read"""
+    
+    def __init__(self, message: str, code: int = INVALID_PARAMS):
+        super().__init__(code, message)
+
+# A handler either returns the complete result, or is an async generator that
+# yields partial content items ({"type": "text", ...}) as they become
+# available. A streaming handler may finish by yielding a complete result
+# (a dict with "content"); otherwise the items it yielded become the result.
+ToolHandler = Callable[
+    [Dict[str, Any]], Union[Awaitable[Dict[str, Any]], AsyncIterator[Dict[str, Any]]]
+]
+ArgumentValidator = Callable[[Dict[str, Any]], None]
+# Receives each partial content item of a streaming call as it is produced
+ProgressCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Returned as-is for unknown tool names so the miss path never formats strings
+UNKNOWN_TOOL_RESULT = {
+    "content": [{
+        "type": "text",
+        "text": "Unknown tool"
+    }],
+    "isError": True
+}
+
+async def collect_stream(
+    chunks: AsyncIterator[Dict[str, Any]],
+    progress: Optional[ProgressCallback] = None
+) -> Dict[str, Any]:
+    """Drain a streaming handler into its final result, reporting each partial item"""
+    content: List[Dict[str, Any]] = []
+    try:
+        async for chunk in chunks:
+            if "content" in chunk:
+                return chunk
+            content.append(chunk)
+            if progress is not None:
+                await progress(chunk)
+    finally:
+        # Release the handler (and any upstream stream) on early exit or cancellation
+        await chunks.aclose()
+    return {"content": content, "isError": False}
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """Everything needed to execute one registered tool"""
+    tool: MCPTool
+    handler: ToolHandler
+    validator: Optional[ArgumentValidator] = None
+    timeout: Optional[float] = None
+    coalesce: bool = True
+    streaming: bool = False
+    # Async generator used instead of ``handler`` when the call has a progress sink
+    stream_handler: Optional[ToolHandler] = None
+
+class ToolRegistry:
+    """
+    Name -> ToolSpec dispatch table.
+    
+    Lookups are a single dict access, so dispatch cost does not grow with
+    the number of registered tools. Registration order is preserved for
+    tools/list.
+    """
+    
+    def __init__(self):
+        self._specs: Dict[str, ToolSpec] = {}
+        # Specs whose validator is compiled, i.e. ready to dispatch
+        self._ready: Dict[str, ToolSpec] = {}
+    
+    def register(
+        self,
+        tool: MCPTool,
+        handler: ToolHandler,
+        validator: Optional[ArgumentValidator] = None,
+        timeout: Optional[float] = None,
+        coalesce: bool = True,
+        stream_handler: Optional[ToolHandler] = None
+    ) -> ToolSpec:
+        """
+        Register (or replace) the handler for a tool.
+        
+        Unless a validator is given, the tool's inputSchema is compiled into
+        one on the first call, so startup never pays for compiling and calls
+        never pay for schema interpretation. Tools with side effects should
+        pass coalesce=False so identical concurrent calls each run. A
+        stream_handler, if given, serves only calls that have a progress sink.
+        """
+        from inspect import isasyncgenfunction
+        spec = ToolSpec(
+            tool=tool,
+            handler=handler,
+            validator=validator,
+            timeout=timeout,
+            coalesce=coalesce,
+            streaming=isasyncgenfunction(handler),
+            stream_handler=stream_handler
+        )
+        self._specs[tool.name] = spec
+        self._ready.pop(tool.name, None)
+        if validator is not None:
+            self._ready[tool.name] = spec
+        return spec
+    
+    def unregister(self, name: str) -> None:
+        self._specs.pop(name, None)
+        self._ready.pop(name, None)
+    
+    def get(self, name: str) -> Optional[ToolSpec]:
+        spec = self._ready.get(name)
+        if spec is None:
+            spec = self._specs.get(name)
+            if spec is not None:
+                from validation import compile_schema
+                spec = self._ready[name] = replace(
+                    spec, validator=compile_schema(spec.tool.inputSchema)
+                )
+        return spec
+    
+    def tools(self) -> Tuple[MCPTool, ...]:
+        return tuple(spec.tool for spec in self._specs.values())
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self._specs
+    
+    def __iter__(self) -> Iterator[ToolSpec]:
+        return iter(self._specs.values())
+    
+    def __len__(self) -> int:
+        return len(self._specs)
+
+class LastGoodResults:
+    """Small LRU of successful tool results keyed by (tool, canonical arguments)"""
+    
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._results: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+    
+    def get(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+        return result
+    
+    def put(self, key: Tuple[str, str], result: Dict[str, Any]) -> None:
+        self._results[key] = result
+        self._results.move_to_end(key)
+        while len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._results)
+
 class BondMCPServer:
     """
     BondMCP MCP Server Implementation
     
     Provides healthcare-specific Model Context Protocol capabilities.
-    Currently in development mode - will integrate with actual API once deployed.
+    Runs in development mode (mock responses) unless an UpstreamClient is
+    given, in which case tools proxy to the BondMCP API over its shared
+    connection pool. With a FairScheduler, tool calls pass per-session rate
+    limits and wait their fair turn for execution capacity.
+    
+    Given a ``config_path``, tools and resources are defined by that file
+    (mcp-config.json) instead of the built-in tables, and reload_config()
+    swaps in a new catalog while the server runs.
+    
+    Large collections are never read whole: single entries are addressed
+    through resource templates (``bondmcp://health/medications/{id}``) and a
+    collection read returns one upstream page, with the next one read as
+    ``<uri>?cursor=<nextCursor>``.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        upstream=None,
+        resource_cache: Optional["ResourceCache"] = None,
+        tool_timeout: float = 30.0,
+        metrics: Optional[ServerMetrics] = None,
+        fallback_cache_size: int = 256,
+        scheduler: Optional["FairScheduler"] = None,
+        config_path: Optional[str] = None,
+        resource_page_size: int = DEFAULT_PAGE_SIZE
+    ):
         self.name = "bondmcp-server"
         self.version = "1.0.0"
         self.description = "BondMCP Healthcare Model Context Protocol Server"
-        self.api_base_url = "https://api.bondmcp.com"  # Will be functional when deployed
+        self.upstream = upstream
+        # Deadline for tools registered without their own timeout
+        self.tool_timeout = tool_timeout
+        self.api_base_url = upstream.base_url if upstream is not None else "https://api.bondmcp.com"
         self.logger = self._setup_logging()
+        # Identical concurrent tool calls / resource reads share one execution;
+        # both this and the default resource cache are built on first use
+        self._coalescer: Optional["RequestCoalescer"] = None
+        self._resource_cache = resource_cache
+        self._subscribers: Dict[str, weakref.WeakSet] = {}
+        # Initialized sessions, told when the tool or resource lists change
+        self._sessions: weakref.WeakSet = weakref.WeakSet()
+        self._background: set = set()
+        self.scheduler = scheduler
+        self.metrics = metrics if metrics is not None else ServerMetrics()
+        self._register_metric_callbacks()
+        if upstream is not None:
+            from upstream import CircuitOpenError, StreamNotSupported, UpstreamError
+            self._upstream_errors = (UpstreamError, asyncio.TimeoutError)
+            self._circuit_open_error = CircuitOpenError
+            self._stream_not_supported = StreamNotSupported
+        # Last good upstream result per (tool, arguments), served while the API is unavailable
+        self._last_good = LastGoodResults(fallback_cache_size)
+        self.tools = ToolRegistry()
+        self.resource_page_size = resource_page_size
+        self._resources = DEFAULT_RESOURCES
+        self._tool_endpoints = dict(UPSTREAM_ENDPOINTS)
+        self._stream_endpoints = dict(UPSTREAM_STREAM_ENDPOINTS)
+        self._resource_endpoints = dict(UPSTREAM_RESOURCE_ENDPOINTS)
+        self._set_templates(DEFAULT_RESOURCE_TEMPLATES, UPSTREAM_RESOURCE_TEMPLATE_ENDPOINTS)
+        self.config_path = config_path
+        # Tools registered from the config file, removed again when dropped from it
+        self._config_tools: FrozenSet[str] = frozenset()
+        self._config_signature: Optional[Tuple[int, int]] = None
+        if config_path is None:
+            self._register_default_tools()
+        else:
+            self._config_signature = config_signature(config_path)
+            self._apply_config(load_config(config_path))
+        self._capabilities = self._build_capabilities()
+        self._catalog: Optional[MCPCatalog] = None
         
+    @property
+    def coalescer(self) -> "RequestCoalescer":
+        if self._coalescer is None:
+            from coalescing import RequestCoalescer
+            self._coalescer = RequestCoalescer()
+        return self._coalescer
+    
+    @property
+    def resource_cache(self) -> "ResourceCache":
+        if self._resource_cache is None:
+            from cache import ResourceCache
+            self._resource_cache = ResourceCache()
+        return self._resource_cache
+    
     def _setup_logging(self):
-        logging.basicConfig(level=logging.INFO)
+        # Handlers are configured by main(), never at import or construction
         return logging.getLogger("bondmcp-server")
     
-    async def get_capabilities(self) -> Dict[str, Any]:
-        """Return server capabilities following MCP spec"""
+    def _register_metric_callbacks(self):
+        registry = self.metrics.registry
+        # Read through the properties at scrape time: both are created lazily
+        registry.callback("bondmcp_calls_executed_total", "Tool calls and resource reads actually executed", "counter", lambda: self.coalescer.executed)
+        registry.callback("bondmcp_calls_coalesced_total", "Calls served by joining an identical in-flight call", "counter", lambda: self.coalescer.coalesced)
+        registry.callback("bondmcp_resource_cache_hits_total", "Resource reads served fresh from cache", "counter", lambda: self.resource_cache.hits)
+        registry.callback("bondmcp_resource_cache_misses_total", "Resource reads that fetched or revalidated", "counter", lambda: self.resource_cache.misses)
+        registry.callback("bondmcp_resource_cache_revalidations_total", "Stale resources confirmed unchanged upstream", "counter", lambda: self.resource_cache.revalidations)
+        registry.callback("bondmcp_resource_cache_evictions_total", "Resources evicted by LRU", "counter", lambda: self.resource_cache.evictions)
+        registry.callback("bondmcp_resource_cache_entries", "Resources currently cached", "gauge", lambda: len(self.resource_cache))
+        if self.upstream is not None:
+            breakers = self.upstream.breakers
+            registry.callback("bondmcp_upstream_open_circuits", "Upstream endpoints with an open or half-open circuit", "gauge", breakers.open_count)
+            registry.callback("bondmcp_upstream_rejected_total", "Upstream calls failed fast by an open circuit", "counter", lambda: breakers.rejected)
+        if self.scheduler is not None:
+            scheduler = self.scheduler
+            registry.callback("bondmcp_scheduler_running", "Tool calls holding a scheduler slot", "gauge", lambda: scheduler.running)
+            registry.callback("bondmcp_scheduler_waiting", "Tool calls queued for their fair share", "gauge", lambda: scheduler.waiting)
+    
+    def _builtin_handlers(self) -> Dict[str, ToolHandler]:
+        return {
+            "health_question": self._health_question,
+            "analyze_symptoms": self._analyze_symptoms,
+            "nutrition_analysis": self._nutrition_analysis,
+            "health_risk_assessment": self._health_risk_assessment
+        }
+    
+    def _register_default_tools(self):
+        handlers = self._builtin_handlers()
+        for tool in DEFAULT_TOOLS:
+            self._register(tool, handlers[tool.name])
+    
+    def _register(self, tool: MCPTool, handler: ToolHandler) -> None:
+        """Register a built-in or config tool, streaming it if a stream endpoint is configured"""
+        stream_handler = None
+        if tool.name in self._stream_endpoints:
+            stream_handler = self._stream_handler(tool.name, handler)
+        self.tools.register(tool, handler, stream_handler=stream_handler)
+    
+    def _apply_config(self, config: ServerConfig):
+        """Register the tools and resources of a config (no awaits: atomic on the loop)"""
+        self._tool_endpoints = {**UPSTREAM_ENDPOINTS, **config.tool_endpoints}
+        self._stream_endpoints = {**UPSTREAM_STREAM_ENDPOINTS, **config.tool_stream_endpoints}
+        self._resource_endpoints = {**UPSTREAM_RESOURCE_ENDPOINTS, **config.resource_endpoints}
+        self._set_templates(
+            config.resource_templates,
+            {**UPSTREAM_RESOURCE_TEMPLATE_ENDPOINTS, **config.template_endpoints}
+        )
+        
+        handlers = self._builtin_handlers()
+        registered = set()
+        for tool in config.tools:
+            handler = handlers.get(tool.name)
+            if handler is None and tool.name in config.tool_endpoints:
+                handler = self._endpoint_handler(tool.name)
+            if handler is None:
+                self.logger.warning("Tool %s has no handler or endpoint, not registering it", tool.name)
+                continue
+            self._register(tool, handler)
+            registered.add(tool.name)
+        for name in self._config_tools - registered:
+            self.tools.unregister(name)
+        self._config_tools = frozenset(registered)
+        
+        new_uris = {resource.uri for resource in config.resources}
+        for resource in self._resources:
+            if resource.uri not in new_uris and self._resource_cache is not None:
+                self._resource_cache.invalidate(resource.uri)
+        self._resources = config.resources
+    
+    def _set_templates(
+        self, templates: Sequence[MCPResourceTemplate], endpoints: Dict[str, str]
+    ):
+        self._templates = tuple(templates)
+        self._template_endpoints = endpoints
+        # (pattern, template, upstream path template) tried in order on reads,
+        # compiled by the first read that needs them
+        self._template_routes: Optional[List[Tuple["re.Pattern[str]", MCPResourceTemplate, Optional[str]]]] = None
+    
+    def _match_template(self, uri: str) -> Optional[Tuple[MCPResourceTemplate, Optional[str], Dict[str, str]]]:
+        """The template a URI instantiates, its upstream path and the variables, if any"""
+        if self._template_routes is None:
+            endpoints = self._template_endpoints
+            self._template_routes = [
+                (compile_uri_template(template.uriTemplate), template, endpoints.get(template.uriTemplate))
+                for template in self._templates
+            ]
+        for pattern, template, endpoint in self._template_routes:
+            match = pattern.match(uri)
+            if match is not None:
+                return template, endpoint, match.groupdict()
+        return None
+    
+    def _build_catalog(self) -> MCPCatalog:
+        return build_catalog(
+            self.tools.tools(), self._resources, self._capabilities,
+            self._templates, self.resource_page_size
+        )
+    
+    def _stream_handler(self, name: str, handler: ToolHandler) -> ToolHandler:
+        """Handler for calls with a progress sink: per-model answers ahead of the (slower) consensus"""
+        async def stream_handler(arguments: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+            if self.upstream is None or name not in self._stream_endpoints:
+                yield await handler(arguments)
+                return
+            chunks = self._proxy_stream(name, arguments)
+            try:
+                async for chunk in chunks:
+                    yield chunk
+            finally:
+                await chunks.aclose()
+        return stream_handler
+    
+    def _endpoint_handler(self, name: str) -> ToolHandler:
+        """Handler for a config-defined tool that maps straight onto an API endpoint"""
+        async def handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
+            if self.upstream is not None:
+                return await self._proxy(name, arguments)
+            return {
+                "content": [{
+                    "type": "text",
+                    "text": f"[DEVELOPMENT MODE] {name} would call {self._tool_endpoints[name]} on the BondMCP API"
+                }],
+                "isError": False
+            }
+        return handler
+    
+    async def reload_config(self) -> bool:
+        """
+        Re-read config_path and atomically publish the new catalog.
+        
+        An unreadable or invalid file is logged and the current catalog kept.
+        Initialized sessions get notifications/tools/list_changed and/or
+        notifications/resources/list_changed. Returns whether anything changed.
+        """
+        self._config_signature = config_signature(self.config_path)
+        try:
+            config = load_config(self.config_path)
+        except (OSError, ValueError) as e:
+            self.logger.error("Keeping current catalog, cannot load %s: %s", self.config_path, e)
+            return False
+        
+        old = self.catalog
+        self._apply_config(config)
+        new = self._catalog = self._build_catalog()
+        if new.version == old.version:
+            return False
+        self.logger.info("Catalog reloaded from %s (version %s)", self.config_path, new.version)
+        
+        # Sent in the background: a session that is not reading must not
+        # hold up the reload (or the watcher behind it)
+        if new.tools_result.data != old.tools_result.data:
+            self._in_background(self._broadcast(
+                self._sessions, make_notification("notifications/tools/list_changed", {})
+            ))
+        if (new.resources, new.resource_templates) != (old.resources, old.resource_templates):
+            self._in_background(self._broadcast(
+                self._sessions, make_notification("notifications/resources/list_changed", {})
+            ))
+        return True
+    
+    async def watch_config(self, interval: float = 2.0) -> None:
+        """Poll config_path for changes (mtime and size) and reload it, until cancelled"""
+        while True:
+            await asyncio.sleep(interval)
+            if config_signature(self.config_path) != self._config_signature:
+                await self.reload_config()
+    
+    @property
+    def catalog(self) -> MCPCatalog:
+        """Current catalog, built on first use (initialize does not need it)"""
+        catalog = self._catalog
+        if catalog is None:
+            catalog = self._catalog = self._build_catalog()
+        return catalog
+    
+    def _rebuild_catalog(self):
+        self._catalog = None
+    
+    def register_tool(
+        self,
+        tool: MCPTool,
+        handler: ToolHandler,
+        validator: Optional[ArgumentValidator] = None,
+        timeout: Optional[float] = None,
+        coalesce: bool = True
+    ) -> ToolSpec:
+        """Register a tool handler and republish the catalog"""
+        spec = self.tools.register(
+            tool, handler, validator=validator, timeout=timeout, coalesce=coalesce
+        )
+        self._rebuild_catalog()
+        return spec
+    
+    def _build_capabilities(self) -> Dict[str, Any]:
         return {
             "capabilities": {
                 "resources": True,
@@ -61,218 +878,474 @@ class BondMCPServer:
                 "name": self.name,
                 "version": self.version,
                 "description": self.description,
-                "protocol_version": "2024-11-05"
+                "protocol_version": PROTOCOL_VERSION
             }
         }
     
-    async def list_resources(self) -> List[MCPResource]:
+    def open_session(self, session: Any, client_info: Any) -> None:
+        """Track a session from its initialize request (list_changed, per-client weights)"""
+        if session is None:
+            return
+        self._sessions.add(session)
+        if self.scheduler is not None and isinstance(client_info, dict):
+            self.scheduler.identify(session, client_info.get("name"))
+    
+    async def get_capabilities(self) -> Dict[str, Any]:
+        """Return server capabilities following MCP spec (shared, do not mutate)"""
+        return self._capabilities
+    
+    def resources_page(self, cursor: Optional[str] = None) -> RawJSON:
+        """Pre-encoded resources/list page for a cursor (None for the first page)"""
+        catalog = self.catalog
+        if cursor is None:
+            return catalog.resources_result
+        version, _, number = cursor.partition(":")
+        if version == catalog.version and number.isdigit() and 0 < int(number) < len(catalog.resource_pages):
+            return catalog.resource_pages[int(number)]
+        raise JSONRPCError(INVALID_PARAMS, "Invalid or expired cursor")
+    
+    async def list_resources(self) -> Tuple[MCPResource, ...]:
         """List available healthcare resources"""
-        # Note: These would connect to actual API endpoints when deployed
-        return [
-            MCPResource(
-                uri="bondmcp://health/guidelines",
-                name="Health Guidelines",
-                description="Evidence-based health guidelines and recommendations",
-                mimeType="application/json"
-            ),
-            MCPResource(
-                uri="bondmcp://health/conditions",
-                name="Medical Conditions",
-                description="Comprehensive medical condition database",
-                mimeType="application/json"
-            ),
-            MCPResource(
-                uri="bondmcp://health/medications",
-                name="Medication Database",
-                description="Drug information and interaction database",
-                mimeType="application/json"
-            ),
-            MCPResource(
-                uri="bondmcp://health/nutrition",
-                name="Nutrition Database",
-                description="Nutritional information and meal planning",
-                mimeType="application/json"
-            )
-        ]
+        return self.catalog.resources
     
-    async def list_tools(self) -> List[MCPTool]:
+    async def list_tools(self) -> Tuple[MCPTool, ...]:
         """List available healthcare tools"""
-        return [
-            MCPTool(
-                name="health_question",
-                description="Ask health-related questions with AI consensus",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "question": {
-                            "type": "string",
-                            "description": "Health question to ask"
-                        },
-                        "context": {
-                            "type": "string",
-                            "description": "Additional context for the question",
-                            "default": ""
-                        }
-                    },
-                    "required": ["question"]
-                }
-            ),
-            MCPTool(
-                name="analyze_symptoms",
-                description="Analyze symptoms and provide guidance",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "symptoms": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of symptoms to analyze"
-                        },
-                        "duration": {
-                            "type": "string",
-                            "description": "How long symptoms have been present"
-                        }
-                    },
-                    "required": ["symptoms"]
-                }
-            ),
-            MCPTool(
-                name="nutrition_analysis",
-                description="Analyze nutritional content and provide recommendations",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "food_items": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of food items to analyze"
-                        },
-                        "meal_type": {
-                            "type": "string",
-                            "enum": ["breakfast", "lunch", "dinner", "snack"],
-                            "description": "Type of meal"
-                        }
-                    },
-                    "required": ["food_items"]
-                }
-            ),
-            MCPTool(
-                name="health_risk_assessment",
-                description="Assess health risks based on provided data",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "age": {"type": "integer"},
-                        "gender": {"type": "string"},
-                        "conditions": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Existing health conditions"
-                        },
-                        "lifestyle_factors": {
-                            "type": "object",
-                            "description": "Lifestyle factors (smoking, exercise, diet, etc.)"
-                        }
-                    },
-                    "required": ["age", "gender"]
-                }
-            )
-        ]
+        return self.catalog.tools
     
-    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a tool call - currently returns mock data due to API not being deployed"""
-        self.logger.info(f"Tool called: {name} with arguments: {arguments}")
+    async def call_tool(
+        self,
+        name: str,
+        arguments: Dict[str, Any],
+        progress: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute a tool call through the registry.
         
-        # Note: These would make actual API calls when infrastructure is deployed
-        if name == "health_question":
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": f"[DEVELOPMENT MODE] This would query the BondMCP API with: {arguments['question']}\n\nOnce api.bondmcp.com is deployed, this will provide real AI-powered health insights with multi-model consensus."
-                }],
-                "isError": False
-            }
+        Streaming handlers pass each partial content item to ``progress`` as
+        soon as it is produced; the return value is still the complete result.
+        """
+        spec = self.tools.get(name)
+        if spec is None:
+            self.metrics.unknown_tool_calls.inc()
+            return UNKNOWN_TOOL_RESULT
         
-        elif name == "analyze_symptoms":
-            return {
-                "content": [{
-                    "type": "text", 
-                    "text": f"[DEVELOPMENT MODE] Symptom analysis for: {arguments['symptoms']}\n\nOnce deployed, this will provide evidence-based symptom analysis and recommendations."
-                }],
-                "isError": False
-            }
+        scheduler = self.scheduler
+        if scheduler is not None:
+            from scheduling import Shed
+            try:
+                await self._admit(scheduler, spec)
+            except Shed as e:
+                self.metrics.requests_shed.labels(e.reason).inc()
+                return self._shed_result(name, e)
         
-        elif name == "nutrition_analysis":
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": f"[DEVELOPMENT MODE] Nutrition analysis for: {arguments['food_items']}\n\nOnce deployed, this will provide comprehensive nutritional analysis and recommendations."
-                }],
-                "isError": False
-            }
-        
-        elif name == "health_risk_assessment":
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": f"[DEVELOPMENT MODE] Risk assessment for {arguments['age']}-year-old {arguments['gender']}\n\nOnce deployed, this will provide personalized health risk assessments."
-                }],
-                "isError": False
+        tool_metrics = self.metrics.for_tool(name)
+        in_flight = self.metrics.tools_in_flight
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            result = await self._call_registered(spec, name, arguments, progress)
+        finally:
+            in_flight.dec()
+            tool_metrics.duration.observe(time.perf_counter() - start)
+            if scheduler is not None:
+                scheduler.release()
+        tool_metrics.calls.inc()
+        if result.get("isError"):
+            tool_metrics.errors.inc()
+        return result
+    
+    async def _admit(self, scheduler: "FairScheduler", spec: ToolSpec) -> None:
+        """Wait for the calling session's turn, shedding if it takes longer than the tool may run"""
+        from scheduling import Shed
+        timeout = spec.timeout if spec.timeout is not None else self.tool_timeout
+        try:
+            await asyncio.wait_for(scheduler.acquire(current_session.get()), timeout)
+        except asyncio.TimeoutError:
+            raise Shed("queue_timeout") from None
+    
+    def _shed_result(self, name: str, shed: "Shed") -> Dict[str, Any]:
+        return {
+            "content": [{
+                "type": "text",
+                "text": f"Tool {name} rejected: server busy ({shed.reason}), retry later"
+            }],
+            "isError": True,
+            "_meta": {
+                "bondmcp/shed": {
+                    "reason": shed.reason,
+                    "retryAfter": round(shed.retry_after, 3)
+                }
             }
+        }
+    
+    async def _call_registered(
+        self,
+        spec: ToolSpec,
+        name: str,
+        arguments: Dict[str, Any],
+        progress: Optional[ProgressCallback]
+    ) -> Dict[str, Any]:
+        if spec.validator is not None:
+            from validation import SchemaValidationError
+            try:
+                spec.validator(arguments)
+            except SchemaValidationError as e:
+                return {
+                    "content": [{
+                        "type": "text",
+                        "text": f"Invalid arguments for {name}: {e}"
+                    }],
+                    "isError": True
+                }
         
+        # Only the tool name is logged: arguments may contain PHI
+        self.logger.debug("Tool called: %s", name)
+        timeout = spec.timeout if spec.timeout is not None else self.tool_timeout
+        with deadline_scope(timeout) as deadline:
+            try:
+                return await asyncio.wait_for(
+                    self._execute(spec, name, arguments, progress),
+                    deadline - asyncio.get_running_loop().time()
+                )
+            except asyncio.TimeoutError:
+                self.logger.warning("Tool %s timed out after %ss", name, timeout)
+                return {
+                    "content": [{
+                        "type": "text",
+                        "text": f"Tool {name} timed out after {timeout:g}s"
+                    }],
+                    "isError": True
+                }
+    
+    async def _execute(
+        self,
+        spec: ToolSpec,
+        name: str,
+        arguments: Dict[str, Any],
+        progress: Optional[ProgressCallback]
+    ) -> Dict[str, Any]:
+        if progress is not None and spec.stream_handler is not None:
+            # Partial results belong to this caller, so it is never coalesced
+            return await collect_stream(spec.stream_handler(arguments), progress)
+        if spec.streaming:
+            if progress is not None:
+                # Partial results belong to this caller, so it is never coalesced
+                return await collect_stream(spec.handler(arguments), progress)
+            factory = lambda: collect_stream(spec.handler(arguments))
         else:
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": f"Unknown tool: {name}"
-                }],
-                "isError": True
-            }
+            factory = lambda: spec.handler(arguments)
+        if spec.coalesce:
+            from coalescing import canonical_arguments
+            key = canonical_arguments(arguments)
+            if key is not None:
+                # The shared execution runs under the first caller's deadline
+                return await self.coalescer.run(("tools/call", name, key), factory)
+        return await factory()
     
-    async def get_resource(self, uri: str) -> Dict[str, Any]:
-        """Get a specific resource - currently returns mock data"""
-        parsed = urlparse(uri)
+    async def _proxy(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Forward validated tool arguments to the upstream API"""
+        try:
+            data = await self.upstream.post(self._tool_endpoints[name], arguments)
+        except self._upstream_errors as e:
+            return self._upstream_failure(name, arguments, e)
+        return self._remember_result(name, arguments, self._proxy_result(data))
+    
+    async def _proxy_stream(self, name: str, arguments: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a tool call from the upstream API.
         
-        if parsed.scheme != "bondmcp":
-            return {"error": "Invalid URI scheme"}
+        Each model's answer is yielded as a partial text item the moment it
+        arrives; the consensus line becomes the final result. An endpoint
+        that turns out not to stream is dropped, and the call (and later
+        ones) go to the plain endpoint instead.
+        """
+        path = self._stream_endpoints[name]
+        events = self.upstream.stream(path, arguments)
+        try:
+            async for event in events:
+                if not isinstance(event, dict):
+                    continue
+                if event.get("event") == "consensus":
+                    yield self._remember_result(name, arguments, self._proxy_result(event))
+                    return
+                if event.get("event") == "model" and isinstance(event.get("answer"), str):
+                    yield {
+                        "type": "text",
+                        "text": f"[{event.get('model', 'model')}] {event['answer']}"
+                    }
+        except self._stream_not_supported as e:
+            self.logger.warning("%s; using %s for %s", e, self._tool_endpoints[name], name)
+            self._stream_endpoints.pop(name, None)
+            yield await self._proxy(name, arguments)
+            return
+        except self._upstream_errors as e:
+            yield self._upstream_failure(name, arguments, e)
+            return
+        finally:
+            await events.aclose()
+        yield self._upstream_failure(name, arguments, "stream ended before the consensus answer")
+    
+    def _remember_result(self, name: str, arguments: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep the latest good result per call, to answer with while the API is down"""
+        from coalescing import canonical_arguments
+        key = canonical_arguments(arguments)
+        if key is not None:
+            self._last_good.put((name, key), result)
+        return result
+    
+    def _upstream_failure(self, name: str, arguments: Dict[str, Any], error: Any) -> Dict[str, Any]:
+        if getattr(error, "unavailable", True):
+            from coalescing import canonical_arguments
+            key = canonical_arguments(arguments)
+            cached = self._last_good.get((name, key)) if key is not None else None
+            if cached is not None:
+                self.logger.warning("Upstream unavailable for %s, serving last good result: %s", name, error)
+                return {**cached, "_meta": {"bondmcp/fallback": "last-good"}}
         
-        # Mock data - would fetch from actual API when deployed
-        resource_data = {
-            "bondmcp://health/guidelines": {
-                "type": "health_guidelines",
-                "data": "[DEVELOPMENT MODE] Health guidelines would be fetched from deployed API",
-                "note": "Once api.bondmcp.com is deployed, this will return actual evidence-based guidelines"
-            },
-            "bondmcp://health/conditions": {
-                "type": "medical_conditions",
-                "data": "[DEVELOPMENT MODE] Medical conditions database",
-                "note": "Will integrate with comprehensive medical condition database when deployed"
-            },
-            "bondmcp://health/medications": {
-                "type": "medications",
-                "data": "[DEVELOPMENT MODE] Medication database",
-                "note": "Will provide drug information and interactions when API is deployed"
-            },
-            "bondmcp://health/nutrition": {
-                "type": "nutrition",
-                "data": "[DEVELOPMENT MODE] Nutrition database", 
-                "note": "Will provide comprehensive nutritional data when API is available"
+        self.logger.warning("Upstream call for %s failed: %s", name, error)
+        result = {
+            "content": [{
+                "type": "text",
+                "text": f"BondMCP API request failed: {error}"
+            }],
+            "isError": True
+        }
+        if isinstance(error, self._circuit_open_error):
+            result["_meta"] = {
+                "bondmcp/circuit": {
+                    "endpoint": error.endpoint,
+                    "state": "open",
+                    "retryAfter": round(error.retry_after, 3)
+                }
             }
+        return result
+    
+    def _proxy_result(self, data: Any) -> Dict[str, Any]:
+        if isinstance(data, dict):
+            text = data.get("answer") or data.get("analysis")
+        else:
+            text = None
+        if not isinstance(text, str):
+            text = serialization.dumps(data).decode("utf-8")
+        return {
+            "content": [{
+                "type": "text",
+                "text": text
+            }],
+            "isError": False
         }
-        
+    
+    # Tool handlers - return mock data unless proxying to the upstream API
+    
+    async def _health_question(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        if self.upstream is not None:
+            return await self._proxy("health_question", arguments)
+        return {
+            "content": [{
+                "type": "text",
+                "text": f"[DEVELOPMENT MODE] This would query the BondMCP API with: {arguments['question']}\n\nOnce api.bondmcp.com is deployed, this will provide real AI-powered health insights with multi-model consensus."
+            }],
+            "isError": False
+        }
+    
+    async def _analyze_symptoms(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        if self.upstream is not None:
+            return await self._proxy("analyze_symptoms", arguments)
+        return {
+            "content": [{
+                "type": "text", 
+                "text": f"[DEVELOPMENT MODE] Symptom analysis for: {arguments['symptoms']}\n\nOnce deployed, this will provide evidence-based symptom analysis and recommendations."
+            }],
+            "isError": False
+        }
+    
+    async def _nutrition_analysis(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        if self.upstream is not None:
+            return await self._proxy("nutrition_analysis", arguments)
+        return {
+            "content": [{
+                "type": "text",
+                "text": f"[DEVELOPMENT MODE] Nutrition analysis for: {arguments['food_items']}\n\nOnce deployed, this will provide comprehensive nutritional analysis and recommendations."
+            }],
+            "isError": False
+        }
+    
+    async def _health_risk_assessment(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        if self.upstream is not None:
+            return await self._proxy("health_risk_assessment", arguments)
+        return {
+            "content": [{
+                "type": "text",
+                "text": f"[DEVELOPMENT MODE] Risk assessment for {arguments['age']}-year-old {arguments['gender']}\n\nOnce deployed, this will provide personalized health risk assessments."
+            }],
+            "isError": False
+        }
+    
+    async def get_resource(self, uri: str) -> Dict[str, Any]:
+        """Get a specific resource, served from the resource cache when fresh"""
+        try:
+            entry = await self._load_resource(uri)
+        except ResourceError as e:
+            return {"error": e.message}
         return {
             "contents": [{
                 "uri": uri,
                 "mimeType": "application/json",
-                "text": json.dumps(resource_data.get(uri, {"error": "Resource not found"}), indent=2)
+                "text": entry.text
             }]
         }
-
-async def main():
-    """Main server entry point"""
-    server = BondMCPServer()
     
-    # Simple demo of server capabilities
+    async def read_resource(self, uri: str) -> RawJSON:
+        """Get a resource as its pre-encoded resources/read result"""
+        entry = await self._load_resource(uri)
+        return entry.result
+    
+    async def _load_resource(self, uri: str) -> "CacheEntry":
+        # Label by catalog URI or template only, so arbitrary client URIs can't grow the metric set
+        if uri in self.catalog.resource_uris:
+            label = uri
+        else:
+            matched = self._match_template(uri.partition("?")[0])
+            label = matched[0].uriTemplate if matched is not None else "other"
+        resource_metrics = self.metrics.for_resource(label)
+        resource_metrics.reads.inc()
+        start = time.perf_counter()
+        try:
+            return await self._lookup_resource(uri)
+        finally:
+            resource_metrics.duration.observe(time.perf_counter() - start)
+    
+    async def _lookup_resource(self, uri: str) -> "CacheEntry":
+        entry = self.resource_cache.get(uri)
+        if entry is not None and self.resource_cache.is_fresh(entry):
+            self.resource_cache.hits += 1
+            return entry
+        self.resource_cache.misses += 1
+        # Concurrent misses for the same URI share one fetch / revalidation
+        return await self.coalescer.run(
+            ("resources/read", uri), lambda: self._fetch_resource(uri, entry)
+        )
+    
+    def _upstream_resource_path(self, uri: str) -> Tuple[Optional[str], Any]:
+        """
+        Upstream path for a resource URI (None if it has none) and its
+        development-mode body.
+        
+        A ``cursor`` query parameter on a collection URI is forwarded, so a
+        large collection is read one upstream page at a time.
+        """
+        from urllib.parse import parse_qs, quote, urlparse
+        parsed = urlparse(uri)
+        base = uri.partition("?")[0]
+        
+        path = self._resource_endpoints.get(base)
+        development = DEVELOPMENT_RESOURCE_DATA.get(base)
+        if path is None and development is None:
+            matched = self._match_template(base)
+            if matched is not None:
+                template, endpoint, variables = matched
+                if endpoint is not None:
+                    path = endpoint.format(**{k: quote(v, safe="") for k, v in variables.items()})
+                development = {
+                    "type": template.name,
+                    **variables,
+                    "data": f"[DEVELOPMENT MODE] {template.name} entries will be served once the API is deployed"
+                }
+        
+        cursor = parse_qs(parsed.query).get("cursor")
+        if path is not None and cursor:
+            path += "?cursor=" + quote(cursor[0], safe="")
+        return path, development
+    
+    async def _fetch_resource(self, uri: str, stale: Optional["CacheEntry"]) -> "CacheEntry":
+        if not uri.startswith("bondmcp:"):
+            raise ResourceError("Invalid URI scheme")
+        
+        path, development = self._upstream_resource_path(uri)
+        if self.upstream is not None and path is not None:
+            # Revalidate (If-None-Match) only what is actually cached
+            known_etag = stale.etag if stale is not None else None
+            try:
+                data, etag = await self.upstream.conditional_get(path, etag=known_etag)
+            except self._upstream_errors as e:
+                if stale is not None:
+                    self.logger.warning("Revalidating %s failed, serving stale copy: %s", uri, e)
+                    return stale
+                if getattr(e, "status", 0) == 404:
+                    return self._resource_not_found(uri)
+                raise ResourceError(f"BondMCP API request failed: {e}", INTERNAL_ERROR)
+            
+            if data is None:
+                # 304 Not Modified: the cached body is still current
+                self.resource_cache.touch(stale)
+                return stale
+            
+            entry = self._cache_resource(uri, data, etag)
+            if stale is not None:
+                self._schedule_update_notification(uri)
+            return entry
+        
+        # Mock data - would fetch from actual API when deployed
+        if development is None:
+            return self._resource_not_found(uri)
+        return self._cache_resource(uri, development, None)
+    
+    def _resource_not_found(self, uri: str) -> "CacheEntry":
+        # Unknown URIs are answered but not cached, so they cannot evict real entries
+        from cache import CacheEntry
+        text, result = encode_resource(uri, {"error": "Resource not found"})
+        return CacheEntry(uri, text, result, None, 0.0)
+    
+    def _cache_resource(self, uri: str, data: Any, etag: Optional[str]) -> "CacheEntry":
+        text, result = encode_resource(uri, data)
+        return self.resource_cache.put(uri, text, result, etag)
+    
+    def subscribe(self, uri: str, session: Any) -> None:
+        """Send notifications/resources/updated for ``uri`` to ``session``"""
+        self._subscribers.setdefault(uri, weakref.WeakSet()).add(session)
+    
+    def unsubscribe(self, uri: str, session: Any) -> None:
+        sessions = self._subscribers.get(uri)
+        if sessions is not None:
+            sessions.discard(session)
+    
+    async def invalidate_resource(self, uri: str) -> None:
+        """Drop the cached copy of ``uri`` and notify its subscribers"""
+        self.resource_cache.invalidate(uri)
+        await self._notify_updated(uri)
+    
+    def _schedule_update_notification(self, uri: str) -> None:
+        # Don't hold up the read that noticed the change on slow subscribers
+        self._in_background(self._notify_updated(uri))
+    
+    def _in_background(self, work) -> None:
+        task = asyncio.ensure_future(work)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+    
+    async def _notify_updated(self, uri: str) -> None:
+        sessions = self._subscribers.get(uri)
+        if sessions:
+            await self._broadcast(
+                sessions, make_notification("notifications/resources/updated", {"uri": uri})
+            )
+    
+    async def _broadcast(self, sessions: weakref.WeakSet, notification: Dict[str, Any]) -> None:
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(session.send(notification), BROADCAST_TIMEOUT)
+                for session in list(sessions)
+            ),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, asyncio.TimeoutError):
+                self.logger.warning("Gave up sending %s to a session not reading", notification["method"])
+            elif isinstance(result, Exception):
+                self.logger.warning("Failed to send %s: %s", notification["method"], result)
+
+async def demo(server: BondMCPServer):
+    """Print a summary of the server capabilities"""
     print("BondMCP Server - Healthcare Model Context Protocol")
     print("=" * 50)
     print(f"Name: {server.name}")
@@ -302,5 +1375,291 @@ async def main():
     print("Once api.bondmcp.com is deployed, it will provide full functionality.")
     print("See ACTUAL_API_STATUS.md for current deployment status.")
 
+def parse_client_weight(value: str) -> Tuple[str, float]:
+    name, _, weight = value.rpartition("=")
+    try:
+        parsed = float(weight)
+    except ValueError:
+        parsed = 0.0
+    if not name or parsed <= 0:
+        import argparse
+        raise argparse.ArgumentTypeError(f"expected NAME=WEIGHT with a positive weight, got {value!r}")
+    return name, parsed
+
+def build_scheduler(args: "argparse.Namespace") -> Optional["FairScheduler"]:
+    """FairScheduler for the configured limits, or None when none are set"""
+    if not (args.tool_concurrency or args.tool_rate or args.session_rate or args.client_weight):
+        return None
+    from scheduling import FairScheduler
+    return FairScheduler(
+        concurrency=args.tool_concurrency,
+        rate=args.tool_rate,
+        session_rate=args.session_rate,
+        session_burst=args.session_burst,
+        session_queue=args.session_queue,
+        client_weights=dict(args.client_weight)
+    )
+
+def parse_args(argv: Optional[List[str]] = None) -> "argparse.Namespace":
+    import argparse
+    parser = argparse.ArgumentParser(description="BondMCP Model Context Protocol server")
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "http"],
+        default="stdio",
+        help="Transport used to serve MCP traffic (default: stdio)"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP bind address")
+    parser.add_argument("--port", type=int, default=8000, help="HTTP bind port")
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=64,
+        help="Maximum tool/resource requests dispatched at once over HTTP"
+    )
+    parser.add_argument(
+        "--upstream",
+        action="store_true",
+        help="Proxy tool calls to the BondMCP API instead of returning mock data"
+    )
+    parser.add_argument(
+        "--api-base-url",
+        default=os.getenv("BONDMCP_PUBLIC_API_BASE_URL", "https://api.bondmcp.com"),
+        help="Upstream API base URL (default: $BONDMCP_PUBLIC_API_BASE_URL)"
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=100,
+        help="Maximum pooled upstream connections"
+    )
+    parser.add_argument(
+        "--per-host-limit",
+        type=int,
+        default=0,
+        help="Maximum pooled upstream connections per host (0 = unlimited)"
+    )
+    parser.add_argument(
+        "--config",
+        default=DEFAULT_CONFIG_PATH,
+        help="Catalog file defining tools and resources (default: mcp-config.json next to server.py, '' for the built-in catalog)"
+    )
+    parser.add_argument(
+        "--config-poll",
+        type=float,
+        default=2.0,
+        help="Seconds between checks of --config for changes to hot-reload (0 = never)"
+    )
+    parser.add_argument(
+        "--tool-concurrency",
+        type=int,
+        default=0,
+        help="Tool calls executing at once, shared fairly between sessions (0 = unlimited)"
+    )
+    parser.add_argument(
+        "--tool-rate",
+        type=float,
+        default=0.0,
+        help="Tool calls started per second across all sessions; keep below the API quota (0 = unlimited)"
+    )
+    parser.add_argument(
+        "--session-rate",
+        type=float,
+        default=0.0,
+        help="Sustained tool calls per second per session before calls are shed (0 = unlimited)"
+    )
+    parser.add_argument(
+        "--session-burst",
+        type=float,
+        default=None,
+        help="Tool calls a session may make back to back (default: --session-rate)"
+    )
+    parser.add_argument(
+        "--session-queue",
+        type=int,
+        default=16,
+        help="Tool calls a session may have waiting before more are shed"
+    )
+    parser.add_argument(
+        "--client-weight",
+        type=parse_client_weight,
+        action="append",
+        default=[],
+        metavar="NAME=WEIGHT",
+        help="Share of tool capacity for sessions whose clientInfo.name is NAME (default 1, repeatable)"
+    )
+    parser.add_argument(
+        "--breaker-failures",
+        type=int,
+        default=5,
+        help="Consecutive upstream failures that open an endpoint's circuit"
+    )
+    parser.add_argument(
+        "--breaker-reset",
+        type=float,
+        default=30.0,
+        help="Seconds an open circuit fails fast before probing the endpoint again"
+    )
+    parser.add_argument(
+        "--resource-ttl",
+        type=float,
+        default=300.0,
+        help="Seconds a cached resource is served before revalidation"
+    )
+    parser.add_argument(
+        "--resource-page-size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help="Resources per resources/list page"
+    )
+    parser.add_argument(
+        "--resource-cache-size",
+        type=int,
+        default=256,
+        help="Maximum number of cached resources"
+    )
+    parser.add_argument(
+        "--tool-timeout",
+        type=float,
+        default=30.0,
+        help="Default per-tool deadline in seconds"
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus metrics on this local port (disabled by default)"
+    )
+    parser.add_argument(
+        "--reuse-port",
+        action="store_true",
+        help="Bind the HTTP port with SO_REUSEPORT so worker processes can share it"
+    )
+    parser.add_argument(
+        "--notify-ready",
+        action="store_true",
+        help=argparse.SUPPRESS  # used by supervisor.py to detect worker readiness
+    )
+    parser.add_argument(
+        "--json-backend",
+        choices=["auto", "orjson", "json"],
+        default="auto",
+        help="JSON encoder for the wire (default: orjson when installed)"
+    )
+    parser.add_argument(
+        "--demo",
+        action="store_true",
+        help="Print server capabilities and exit instead of serving"
+    )
+    return parser.parse_args(argv)
+
+# Printed on stdout once the HTTP listener is bound (with --notify-ready)
+READY_LINE = "BONDMCP_READY"
+
+async def serve_until_terminated(work: Awaitable[Any]):
+    """Run ``work`` until it finishes or the process receives SIGTERM"""
+    task = asyncio.ensure_future(work)
+    terminated = False
+    
+    def terminate():
+        nonlocal terminated
+        terminated = True
+        task.cancel()
+    
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGTERM, terminate)
+    except (NotImplementedError, RuntimeError):
+        pass  # No signal handlers on this platform/thread; default SIGTERM applies
+    try:
+        await task
+    except asyncio.CancelledError:
+        if not terminated:
+            raise
+    finally:
+        try:
+            loop.remove_signal_handler(signal.SIGTERM)
+        except (NotImplementedError, RuntimeError):
+            pass
+
+async def serve(server: BondMCPServer, args: "argparse.Namespace"):
+    """Serve MCP traffic on the selected transport until EOF or cancellation"""
+    from jsonrpc import JSONRPCDispatcher
+    dispatcher = JSONRPCDispatcher(server)
+    
+    if args.transport == "http":
+        from http_transport import HTTPTransport
+        transport = HTTPTransport(
+            dispatcher,
+            host=args.host,
+            port=args.port,
+            max_concurrency=args.max_concurrency,
+            reuse_port=args.reuse_port
+        )
+        await transport.start()
+        if args.notify_ready:
+            print(READY_LINE, flush=True)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            # Stops accepting, then drains in-flight requests
+            await transport.stop()
+        return
+    
+    from stdio_transport import StdioTransport
+    # stdout carries protocol frames, so everything else must go to stderr
+    await StdioTransport(dispatcher).serve()
+
+async def main(argv: Optional[List[str]] = None):
+    """Main server entry point"""
+    args = parse_args(argv)
+    serialization.use(args.json_backend)
+    # Logs go to stderr; with the stdio transport stdout carries protocol frames
+    logging.basicConfig(level=logging.INFO)
+    upstream = None
+    if args.upstream:
+        from circuit import CircuitBreakers
+        from upstream import UpstreamClient
+        upstream = UpstreamClient(
+            base_url=args.api_base_url,
+            api_key=os.getenv("BONDMCP_PUBLIC_API_KEY"),
+            pool_size=args.pool_size,
+            per_host_limit=args.per_host_limit,
+            breakers=CircuitBreakers(args.breaker_failures, args.breaker_reset)
+        )
+    from cache import ResourceCache
+    server = BondMCPServer(
+        upstream=upstream,
+        resource_cache=ResourceCache(max_entries=args.resource_cache_size, ttl=args.resource_ttl),
+        tool_timeout=args.tool_timeout,
+        scheduler=build_scheduler(args),
+        config_path=args.config or None,
+        resource_page_size=args.resource_page_size
+    )
+    
+    if args.demo:
+        await demo(server)
+        return
+    
+    metrics_server = None
+    if args.metrics_port is not None:
+        from metrics import MetricsServer
+        metrics_server = MetricsServer(server.metrics.registry, port=args.metrics_port)
+        await metrics_server.start()
+    
+    watcher = None
+    if server.config_path is not None and args.config_poll > 0:
+        watcher = asyncio.ensure_future(server.watch_config(args.config_poll))
+    
+    try:
+        await serve_until_terminated(serve(server, args))
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+        if metrics_server is not None:
+            await metrics_server.stop()
+        if upstream is not None:
+            await upstream.close()
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -0,0 +1,132 @@
+"""
+Stdio transport for the BondMCP MCP server.
+
+Messages are newline-delimited JSON-RPC 2.0 objects (or batch arrays of
+them), as used by MCP clients that spawn the server as a subprocess. Every
+request is dispatched on its own asyncio task, so a slow tool call never
+blocks other requests on the same connection; responses are written as soon
+as they are ready and matched to their request by id. A line longer than
+STREAM_LIMIT is discarded and answered with a parse error.
+"""
+
+import asyncio
+import sys
+import time
+from typing import Any, Dict, Optional, Set
+
+import serialization
+from jsonrpc import PARSE_ERROR, JSONRPCDispatcher, encode_message, make_error
+
+# Generous line limit so large resource payloads are not rejected by the reader
+STREAM_LIMIT = 16 * 1024 * 1024
+
+
+class _BlockingWriter:
+    """StreamWriter stand-in for outputs that are not pipes (e.g. files)"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, data: bytes) -> None:
+        self.stream.write(data)
+
+    async def drain(self) -> None:
+        self.stream.flush()
+
+
+class StdioTransport:
+    """Serve a JSON-RPC dispatcher over a pair of asyncio streams"""
+
+    def __init__(
+        self,
+        dispatcher: JSONRPCDispatcher,
+        reader: Optional[asyncio.StreamReader] = None,
+        writer: Optional[Any] = None,
+    ):
+        self.dispatcher = dispatcher
+        self.reader = reader
+        self.writer = writer
+        self._write_lock = asyncio.Lock()
+        self._tasks: Set[asyncio.Task] = set()
+        self._requests, self._latency = dispatcher.server.metrics.for_transport("stdio")
+
+    async def _connect_stdio(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        reader = asyncio.StreamReader(limit=STREAM_LIMIT)
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+        )
+
+        self.reader = reader
+        try:
+            transport, protocol = await loop.connect_write_pipe(
+                asyncio.streams.FlowControlMixin, sys.stdout
+            )
+        except ValueError:
+            # stdout redirected to a regular file cannot be driven by the loop
+            self.writer = _BlockingWriter(sys.stdout.buffer)
+        else:
+            self.writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+
+    async def serve(self) -> None:
+        """Read messages until EOF, then wait for in-flight requests to finish"""
+        if self.reader is None or self.writer is None:
+            await self._connect_stdio()
+
+        while True:
+            line = await self._readline()
+            if line is None:
+                await self.send(make_error(None, PARSE_ERROR, "Parse error"))
+                continue
+            if not line:
+                break
+            if not line.strip():
+                continue
+            task = asyncio.create_task(self._handle_line(line))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _readline(self) -> Optional[bytes]:
+        """Next line (b"" at EOF), or None if it exceeded the limit and was skipped"""
+        try:
+            return await self.reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            return e.partial
+        except asyncio.LimitOverrunError as e:
+            consumed = e.consumed
+
+        # Drop the oversized line up to and including its newline (or EOF)
+        while True:
+            await self.reader.readexactly(consumed)
+            try:
+                await self.reader.readuntil(b"\n")
+                return None
+            except asyncio.IncompleteReadError:
+                return None
+            except asyncio.LimitOverrunError as e:
+                consumed = e.consumed
+
+    async def _handle_line(self, line: bytes) -> None:
+        start = time.perf_counter()
+        try:
+            message = serialization.loads(line)
+        except ValueError:
+            response = make_error(None, PARSE_ERROR, "Parse error")
+        else:
+            response = await self.dispatcher.handle(message, self)
+
+        if response is not None:
+            await self.send(response)
+        self._requests.inc()
+        self._latency.observe(time.perf_counter() - start)
+
+    async def send(self, payload: Dict[str, Any]) -> None:
+        """Write one message frame to the client"""
+        data = encode_message(payload) + b"\n"
+        async with self._write_lock:
+            self.writer.write(data)
+            await self.writer.drain()
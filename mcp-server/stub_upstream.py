@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for api.bondmcp.com.
+
+Serves canned responses for the endpoints the MCP server proxies to, so
+proxy mode can be exercised in tests and benchmarks without network access.
+Every request is recorded on the StubUpstream for assertions.
+
+Usage:
+    python mcp-server/stub_upstream.py --port 9000 [--latency-ms 50]
+    python mcp-server/server.py --upstream --api-base-url http://127.0.0.1:9000
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+from typing import Any, Dict, List, Set, Tuple
+
+from aiohttp import web
+
+CANNED_RESPONSES: Dict[str, Dict[str, Any]] = {
+    "/api/v1/ask": {
+        "id": "stub-answer",
+        "answer": "Stub consensus answer",
+        "trustScore": 0.9,
+        "sources": ["stub"],
+    },
+    "/api/v1/symptoms": {
+        "analysis": "Stub symptom analysis",
+        "severity": "low",
+        "recommendations": ["rest"],
+    },
+    "/api/v1/nutrition/analyze": {"analysis": "Stub nutrition analysis"},
+    "/api/v1/risk-assessment": {"analysis": "Stub risk assessment", "risk": "low"},
+}
+
+# Per-model answers streamed by /api/v1/ask/stream before the consensus line
+STUB_MODELS = ("stub-model-a", "stub-model-b", "stub-model-c")
+
+STUB_RESOURCES: Dict[str, Dict[str, Any]] = {
+    name: {"type": name, "data": f"Stub {name} data"}
+    for name in ("guidelines", "conditions", "medications", "nutrition")
+}
+
+# Entries of the collection resources, listed STUB_PAGE_SIZE at a time
+STUB_PAGE_SIZE = 2
+STUB_ITEMS: Dict[str, List[Dict[str, Any]]] = {
+    name: [{"id": f"{name}-{i}", "name": f"Stub {name} entry {i}"} for i in range(5)]
+    for name in ("conditions", "medications", "nutrition")
+}
+
+
+class StubUpstream:
+    """Canned BondMCP API that records every request it receives"""
+
+    def __init__(self, latency: float = 0.0, fail_status: int = 0):
+        """
+        Args:
+            latency: Seconds to wait before answering each request
+            fail_status: When non-zero, tool endpoints answer with this status
+                (simulates an outage)
+        """
+        self.latency = latency
+        self.fail_status = fail_status
+        self.requests: List[Tuple[str, str, Any, Dict[str, str]]] = []
+        self.peers: Set[Any] = set()
+        self.resources = {name: dict(body) for name, body in STUB_RESOURCES.items()}
+        self.items = {name: list(items) for name, items in STUB_ITEMS.items()}
+
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        for path in CANNED_RESPONSES:
+            app.router.add_post(path, self._handle)
+        app.router.add_post("/api/v1/ask/stream", self._handle_stream)
+        app.router.add_get("/api/v1/resources/{name}", self._handle_resource)
+        app.router.add_get("/api/v1/resources/{name}/{item_id}", self._handle_item)
+        return app
+
+    @staticmethod
+    def etag(body: Any) -> str:
+        encoded = json.dumps(body, sort_keys=True).encode("utf-8")
+        return '"' + hashlib.sha1(encoded).hexdigest() + '"'
+
+    def _conditional(self, request: web.Request, body: Any) -> web.Response:
+        etag = self.etag(body)
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.json_response(body, headers={"ETag": etag})
+
+    async def _handle_resource(self, request: web.Request) -> web.Response:
+        """A resource; collections carry one page of items and the cursor of the next"""
+        name = request.match_info["name"]
+        self.requests.append((request.method, request.path_qs, None, dict(request.headers)))
+        if name not in self.resources:
+            raise web.HTTPNotFound()
+        body = dict(self.resources[name])
+        items = self.items.get(name)
+        if items is not None:
+            cursor = request.query.get("cursor", "0")
+            offset = int(cursor) if cursor.isdigit() else 0
+            body["items"] = items[offset:offset + STUB_PAGE_SIZE]
+            if offset + STUB_PAGE_SIZE < len(items):
+                body["nextCursor"] = str(offset + STUB_PAGE_SIZE)
+        return self._conditional(request, body)
+
+    async def _handle_item(self, request: web.Request) -> web.Response:
+        name, item_id = request.match_info["name"], request.match_info["item_id"]
+        self.requests.append((request.method, request.path, None, dict(request.headers)))
+        for item in self.items.get(name, ()):
+            if item["id"] == item_id:
+                return self._conditional(request, item)
+        raise web.HTTPNotFound()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        body = await request.json() if request.can_read_body else None
+        self.requests.append((request.method, request.path, body, dict(request.headers)))
+        self.peers.add(request.transport.get_extra_info("peername"))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.fail_status:
+            return web.json_response({"error": "stub outage"}, status=self.fail_status)
+        return web.json_response(CANNED_RESPONSES[request.path])
+
+    async def _handle_stream(self, request: web.Request) -> web.StreamResponse:
+        """NDJSON: one line per model answer, then the consensus line"""
+        body = await request.json()
+        self.requests.append((request.method, request.path, body, dict(request.headers)))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.fail_status:
+            return web.json_response({"error": "stub outage"}, status=self.fail_status)
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+        for model in STUB_MODELS:
+            event = {"event": "model", "model": model, "answer": f"Stub answer from {model}"}
+            await response.write(json.dumps(event).encode("utf-8") + b"\n")
+        consensus = {"event": "consensus", **CANNED_RESPONSES["/api/v1/ask"]}
+        await response.write(json.dumps(consensus).encode("utf-8") + b"\n")
+        await response.write_eof()
+        return response
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stub BondMCP API for local testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    web.run_app(StubUpstream(args.latency_ms / 1000).build_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Multi-process launcher for the BondMCP MCP server.
+
+One event loop uses one core. The supervisor starts N worker processes,
+each running server.py with its own BondMCPServer and event loop on the
+HTTP transport, all bound to the same port with SO_REUSEPORT so the kernel
+spreads incoming connections across them.
+
+- SIGHUP restarts the workers one at a time: a replacement is started and
+  must report ready before the worker it replaces is sent SIGTERM, stops
+  accepting and drains its in-flight requests.
+- A worker that exits unexpectedly is replaced.
+- SIGTERM / SIGINT stop every worker gracefully.
+- ``--metrics-port`` serves the sum of every worker's metrics.
+
+Usage:
+    python mcp-server/supervisor.py --workers 4 --port 8000 [server options]
+
+Options the supervisor does not know are passed to every worker.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from metrics import MetricsServer
+from server import READY_LINE
+
+SERVER_SCRIPT = str(Path(__file__).resolve().parent / "server.py")
+
+logger = logging.getLogger("bondmcp-supervisor")
+
+
+def aggregate_metrics(pages: Sequence[str]) -> str:
+    """
+    Sum Prometheus text pages sample by sample.
+
+    Counters and histogram buckets add up exactly; gauges (in-flight calls,
+    queue depth, cache entries) become totals across workers.
+    """
+    families: Dict[str, Tuple[List[str], Dict[str, float]]] = {}
+    for page in pages:
+        family = None
+        for line in page.splitlines():
+            if line.startswith("# "):
+                family = families.setdefault(line.split(" ", 3)[2], ([], {}))
+                if line not in family[0]:
+                    family[0].append(line)
+            elif line and family is not None:
+                key, _, value = line.rpartition(" ")
+                try:
+                    family[1][key] = family[1].get(key, 0.0) + float(value)
+                except ValueError:
+                    logger.debug("Skipping malformed sample: %s", line)
+
+    lines: List[str] = []
+    for comments, samples in families.values():
+        lines.extend(comments)
+        for key, value in samples.items():
+            lines.append(f"{key} {int(value) if value.is_integer() else repr(value)}")
+    return "\n".join(lines) + "\n"
+
+
+async def scrape(port: int, host: str = "127.0.0.1", timeout: float = 2.0) -> str:
+    """Fetch one worker's metrics page"""
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    try:
+        writer.write(b"GET /metrics HTTP/1.1\r\nHost: " + host.encode("ascii") + b"\r\n\r\n")
+        raw = await asyncio.wait_for(reader.read(), timeout)
+    finally:
+        writer.close()
+    return raw.partition(b"\r\n\r\n")[2].decode("utf-8")
+
+
+class Worker:
+    """One server process"""
+
+    def __init__(self, slot: int, bank: int, metrics_port: Optional[int], process: asyncio.subprocess.Process):
+        self.slot = slot
+        # Which of the two metrics port banks this worker uses; a replacement takes the other
+        self.bank = bank
+        self.metrics_port = metrics_port
+        self.process = process
+        self.retiring = False
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+
+class Supervisor:
+    """Run and supervise ``workers`` server processes sharing one HTTP port"""
+
+    def __init__(
+        self,
+        workers: int,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        server_args: Sequence[str] = (),
+        worker_metrics_port: Optional[int] = None,
+        ready_timeout: float = 15.0,
+        drain_timeout: float = 30.0,
+        respawn_delay: float = 1.0,
+    ):
+        """
+        Args:
+            workers: Number of worker processes
+            host: Interface every worker binds
+            port: TCP port every worker binds with SO_REUSEPORT
+            server_args: Extra server.py options passed to each worker
+            worker_metrics_port: First per-worker metrics port; worker metrics
+                are disabled when None. Ports up to 2 * workers above it are used.
+            ready_timeout: Seconds a new worker has to bind its port
+            drain_timeout: Seconds a retiring worker has to finish in-flight
+                requests before it is killed
+            respawn_delay: Seconds to wait before replacing a crashed worker
+        """
+        self.size = workers
+        self.host = host
+        self.port = port
+        self.server_args = list(server_args)
+        self.worker_metrics_port = worker_metrics_port
+        self.ready_timeout = ready_timeout
+        self.drain_timeout = drain_timeout
+        self.respawn_delay = respawn_delay
+        self.workers: List[Optional[Worker]] = [None] * workers
+        self._restart_lock = asyncio.Lock()
+        self._stopping = False
+        self._watchers: set = set()
+
+    def _command(self, metrics_port: Optional[int]) -> List[str]:
+        command = [
+            sys.executable, SERVER_SCRIPT,
+            "--transport", "http",
+            "--host", self.host,
+            "--port", str(self.port),
+            "--reuse-port",
+            "--notify-ready",
+        ]
+        if metrics_port is not None:
+            command += ["--metrics-port", str(metrics_port)]
+        return command + self.server_args
+
+    async def _spawn(self, slot: int, bank: int) -> Worker:
+        """Start a worker and wait until it is accepting connections"""
+        metrics_port = None
+        if self.worker_metrics_port is not None:
+            metrics_port = self.worker_metrics_port + slot + bank * self.size
+        process = await asyncio.create_subprocess_exec(
+            *self._command(metrics_port), stdout=asyncio.subprocess.PIPE
+        )
+        try:
+            line = await asyncio.wait_for(process.stdout.readline(), self.ready_timeout)
+        except asyncio.TimeoutError:
+            line = b""
+        if line.strip() != READY_LINE.encode("ascii"):
+            await self._stop_process(process, 0)
+            raise RuntimeError(f"Worker {slot} failed to start")
+        worker = Worker(slot, bank, metrics_port, process)
+        self.workers[slot] = worker
+        watcher = asyncio.ensure_future(self._watch(worker))
+        self._watchers.add(watcher)
+        watcher.add_done_callback(self._watchers.discard)
+        logger.info("Worker %d ready (pid %d)", slot, worker.pid)
+        return worker
+
+    async def _watch(self, worker: Worker) -> None:
+        # Keep emptying stdout so a worker that prints after READY never
+        # blocks on a full pipe
+        while await worker.process.stdout.read(65536):
+            pass
+        code = await worker.process.wait()
+        if self._stopping or worker.retiring:
+            return
+        logger.warning("Worker %d (pid %d) exited with %s; replacing it", worker.slot, worker.pid, code)
+        while not self._stopping:
+            await asyncio.sleep(self.respawn_delay)
+            try:
+                await self._spawn(worker.slot, 1 - worker.bank)
+                return
+            except RuntimeError as e:
+                logger.error("%s; retrying", e)
+
+    async def _stop_process(self, process: asyncio.subprocess.Process, timeout: float) -> None:
+        """SIGTERM, then SIGKILL if the process has not exited within ``timeout``"""
+        if process.returncode is None:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+
+    async def _retire(self, worker: Worker) -> None:
+        worker.retiring = True
+        await self._stop_process(worker.process, self.drain_timeout)
+        logger.info("Worker %d (pid %d) stopped", worker.slot, worker.pid)
+
+    async def start(self) -> None:
+        """Start every worker; if any fails, stop the ones that did start"""
+        results = await asyncio.gather(
+            *(self._spawn(slot, 0) for slot in range(self.size)), return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            await self.stop()
+            raise errors[0]
+
+    async def rolling_restart(self) -> None:
+        """Replace each worker in turn while the others keep serving"""
+        async with self._restart_lock:
+            for slot in range(self.size):
+                old = self.workers[slot]
+                await self._spawn(slot, 1 - old.bank if old is not None else 0)
+                if old is not None:
+                    await self._retire(old)
+
+    async def stop(self) -> None:
+        self._stopping = True
+        await asyncio.gather(
+            *(self._retire(worker) for worker in self.workers if worker is not None)
+        )
+
+    async def render(self) -> str:
+        """Aggregated metrics page of every live worker"""
+        ports = [w.metrics_port for w in self.workers if w is not None and w.metrics_port is not None]
+        pages = await asyncio.gather(*(scrape(port) for port in ports), return_exceptions=True)
+        pages = [page for page in pages if isinstance(page, str)]
+        return (
+            "# HELP bondmcp_workers Worker processes reporting metrics\n"
+            "# TYPE bondmcp_workers gauge\n"
+            f"bondmcp_workers {len(pages)}\n"
+        ) + aggregate_metrics(pages)
+
+    async def run(self, metrics_port: Optional[int] = None) -> None:
+        """Start the workers and supervise them until SIGTERM or SIGINT"""
+        loop = asyncio.get_running_loop()
+        stopped = asyncio.Event()
+        restarts: set = set()
+        metrics_server = None
+
+        def restarted(task: asyncio.Task) -> None:
+            restarts.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                logger.error("Rolling restart failed: %s", task.exception())
+
+        def restart():
+            task = asyncio.ensure_future(self.rolling_restart())
+            restarts.add(task)
+            task.add_done_callback(restarted)
+
+        try:
+            await self.start()
+            if metrics_port is not None:
+                metrics_server = MetricsServer(self, port=metrics_port)
+                await metrics_server.start()
+
+            loop.add_signal_handler(signal.SIGHUP, restart)
+            loop.add_signal_handler(signal.SIGTERM, stopped.set)
+            loop.add_signal_handler(signal.SIGINT, stopped.set)
+            logger.info("Supervising %d workers on %s:%s", self.size, self.host, self.port)
+            await stopped.wait()
+        finally:
+            for task in restarts:
+                task.cancel()
+            if metrics_server is not None:
+                await metrics_server.stop()
+            await self.stop()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> Tuple[argparse.Namespace, List[str]]:
+    parser = argparse.ArgumentParser(
+        description="Run BondMCP MCP server workers on one HTTP port",
+        epilog="Unrecognised options are passed to every worker (see server.py --help)."
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP bind address")
+    parser.add_argument("--port", type=int, default=8000, help="HTTP bind port shared by all workers")
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve metrics aggregated across workers on this local port (disabled by default)"
+    )
+    parser.add_argument(
+        "--worker-metrics-port",
+        type=int,
+        default=9500,
+        help="First local port for per-worker metrics when --metrics-port is set"
+    )
+    parser.add_argument("--ready-timeout", type=float, default=15.0, help="Seconds a worker has to start")
+    parser.add_argument(
+        "--drain-timeout",
+        type=float,
+        default=30.0,
+        help="Seconds a stopping worker has to finish in-flight requests"
+    )
+    args, server_args = parser.parse_known_args(argv)
+    if not hasattr(socket, "SO_REUSEPORT"):
+        parser.error("SO_REUSEPORT is not supported on this platform")
+    return args, server_args
+
+
+async def main(argv: Optional[List[str]] = None) -> None:
+    args, server_args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    supervisor = Supervisor(
+        args.workers,
+        host=args.host,
+        port=args.port,
+        server_args=server_args,
+        worker_metrics_port=args.worker_metrics_port if args.metrics_port is not None else None,
+        ready_timeout=args.ready_timeout,
+        drain_timeout=args.drain_timeout,
+    )
+    await supervisor.run(metrics_port=args.metrics_port)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
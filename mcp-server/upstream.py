@@ -0,0 +1,289 @@
+"""
+Upstream BondMCP API client used by the MCP server in proxy mode.
+
+One UpstreamClient owns one aiohttp session, and so one keep-alive
+connection pool, shared by every tool call on the event loop. The pool is
+bounded overall and per host, so a burst of agent traffic reuses warm
+connections instead of opening a TCP+TLS handshake per call.
+
+aiohttp speaks HTTP/1.1 only; multiplexing comes from the pool size and
+keep-alive rather than HTTP/2 streams.
+
+``stream`` reads newline-delimited JSON responses incrementally, so tools
+can forward each upstream model's answer before the consensus is ready. An
+endpoint that is missing or answers with anything but NDJSON raises
+StreamNotSupported, so callers can fall back to the plain endpoint.
+
+Requests made under a deadline (see deadlines.py) are capped at the time
+remaining and forward it in the X-Request-Timeout-Ms header, so expired
+work releases its pooled connection immediately.
+
+Every endpoint sits behind a circuit breaker (see circuit.py). While the
+API is failing, calls raise CircuitOpenError at once instead of waiting out
+their timeout.
+"""
+
+import asyncio
+import logging
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+
+try:
+    import aiohttp
+except ImportError:
+    raise ImportError("Please install required dependencies: pip install aiohttp")
+
+import serialization
+from circuit import CircuitBreaker, CircuitBreakers
+from deadlines import DEADLINE_HEADER, remaining
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+logger = logging.getLogger("bondmcp-server")
+
+
+class UpstreamError(Exception):
+    """Raised when the upstream API fails or returns an error status"""
+
+    def __init__(self, message: str, status: int = 0, body: Any = None):
+        super().__init__(message)
+        self.status = status
+        self.body = body
+
+    @property
+    def unavailable(self) -> bool:
+        """True when the API itself failed, as opposed to rejecting the request"""
+        return self.status == 0 or self.status == 429 or self.status >= 500
+
+
+class StreamNotSupported(UpstreamError):
+    """Raised when a streaming endpoint is missing or answers with something other than NDJSON"""
+
+
+class CircuitOpenError(UpstreamError):
+    """Raised without contacting the API while an endpoint's circuit is open"""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(f"circuit open for {endpoint}, retry in {retry_after:.0f}s", 503)
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+class UpstreamClient:
+    """Async client for api.bondmcp.com backed by a shared connection pool"""
+
+    def __init__(
+        self,
+        base_url: str = "https://api.bondmcp.com",
+        api_key: Optional[str] = None,
+        pool_size: int = 100,
+        per_host_limit: int = 0,
+        keepalive_timeout: float = 30.0,
+        timeout: float = 30.0,
+        breakers: Optional[CircuitBreakers] = None,
+    ):
+        """
+        Args:
+            base_url: Root URL of the BondMCP API
+            api_key: API key sent as X-API-Key
+            pool_size: Maximum open connections across all hosts
+            per_host_limit: Maximum open connections per host (0 = no limit)
+            keepalive_timeout: Seconds an idle pooled connection is kept open
+            timeout: Default total timeout per request in seconds
+            breakers: Per-endpoint circuit breakers (default settings if None)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.pool_size = pool_size
+        self.per_host_limit = per_host_limit
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.breakers = breakers if breakers is not None else CircuitBreakers()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the pooled session (must run inside the event loop)"""
+        if self._session is None or self._session.closed:
+            headers = {
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "User-Agent": "bondmcp-mcp-server/1.0.0",
+            }
+            if self.api_key:
+                headers["X-API-Key"] = self.api_key
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.per_host_limit,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                headers=headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    @contextmanager
+    def _guard(self, path: str) -> Iterator[CircuitBreaker]:
+        """Fail fast while ``path`` is open; otherwise record how the call went"""
+        breaker = self.breakers.get(path)
+        if not breaker.allow():
+            self.breakers.rejected += 1
+            raise CircuitOpenError(path, breaker.retry_after())
+        try:
+            yield breaker
+        except UpstreamError as e:
+            if e.unavailable:
+                breaker.record_failure()
+            else:
+                breaker.record_success()  # the API answered; the request was at fault
+            raise
+        except asyncio.TimeoutError:
+            breaker.record_failure()
+            raise
+        except GeneratorExit:
+            # A streaming consumer stopped early after getting what it needed
+            breaker.record_success()
+            raise
+        except asyncio.CancelledError:
+            left = remaining()
+            if left is not None and left <= 0:
+                breaker.record_failure()  # cut off by the tool deadline
+            else:
+                breaker.release()
+            raise
+        else:
+            breaker.record_success()
+
+    def _request_options(self, headers: Optional[Dict[str, str]]) -> Dict[str, Any]:
+        """Per-request headers and timeout derived from the current deadline"""
+        left = remaining()
+        if left is None:
+            # Omit timeout entirely so the session default applies
+            return {"headers": headers}
+        if left <= 0:
+            raise UpstreamError("Deadline exceeded before upstream call")
+        headers = dict(headers) if headers else {}
+        headers[DEADLINE_HEADER] = str(int(left * 1000))
+        return {
+            "headers": headers,
+            "timeout": aiohttp.ClientTimeout(total=min(left, self.timeout)),
+        }
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Send a request and return the decoded JSON body"""
+        options = self._request_options(headers)
+        with self._guard(path):
+            session = self._get_session()
+            try:
+                async with session.request(
+                    method,
+                    self.base_url + path,
+                    data=serialization.dumps(json) if json is not None else None,
+                    params=params,
+                    **options
+                ) as response:
+                    if response.status >= 400:
+                        body = await response.text()
+                        raise UpstreamError(
+                            f"Upstream returned {response.status}", response.status, body
+                        )
+                    return await response.json(content_type=None, loads=serialization.loads)
+            except aiohttp.ClientError as e:
+                raise UpstreamError(f"Upstream request failed: {e}") from e
+            except ValueError as e:
+                raise UpstreamError(f"Malformed upstream response: {e}") from e
+
+    async def conditional_get(
+        self, path: str, etag: Optional[str] = None
+    ) -> Tuple[Any, Optional[str]]:
+        """
+        GET ``path``, revalidating with If-None-Match when an ETag is known.
+        A 304 to a GET sent without an ETag raises UpstreamError.
+
+        Returns:
+            (body, etag), with body None when the upstream answered 304
+        """
+        options = self._request_options({"If-None-Match": etag} if etag else None)
+        with self._guard(path):
+            session = self._get_session()
+            try:
+                async with session.get(self.base_url + path, **options) as response:
+                    if response.status == 304:
+                        if not etag:
+                            # Nothing was cached to be "not modified"
+                            raise UpstreamError("Upstream returned 304 to an unconditional GET", 304)
+                        return None, etag
+                    if response.status >= 400:
+                        body = await response.text()
+                        raise UpstreamError(
+                            f"Upstream returned {response.status}", response.status, body
+                        )
+                    return (
+                        await response.json(content_type=None, loads=serialization.loads),
+                        response.headers.get("ETag"),
+                    )
+            except aiohttp.ClientError as e:
+                raise UpstreamError(f"Upstream request failed: {e}") from e
+            except ValueError as e:
+                raise UpstreamError(f"Malformed upstream response: {e}") from e
+
+    async def stream(
+        self, path: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[Any]:
+        """POST ``payload`` and yield each object of an NDJSON response as it arrives"""
+        headers = dict(headers) if headers else {}
+        headers["Accept"] = NDJSON_CONTENT_TYPE
+        options = self._request_options(headers)
+        with self._guard(path):
+            session = self._get_session()
+            try:
+                async with session.post(
+                    self.base_url + path, data=serialization.dumps(payload), **options
+                ) as response:
+                    if response.status in (404, 406, 415):
+                        raise StreamNotSupported(
+                            f"{path} does not stream (status {response.status})", response.status
+                        )
+                    if response.status >= 400:
+                        body = await response.text()
+                        raise UpstreamError(
+                            f"Upstream returned {response.status}", response.status, body
+                        )
+                    if response.content_type != NDJSON_CONTENT_TYPE:
+                        raise StreamNotSupported(
+                            f"{path} does not stream ({response.content_type})", response.status
+                        )
+                    async for line in response.content:
+                        line = line.strip()
+                        if line:
+                            yield serialization.loads(line)
+            except aiohttp.ClientError as e:
+                raise UpstreamError(f"Upstream request failed: {e}") from e
+            except ValueError as e:
+                raise UpstreamError(f"Malformed upstream stream: {e}") from e
+
+    async def post(self, path: str, payload: Dict[str, Any], **kwargs: Any) -> Any:
+        return await self.request("POST", path, json=payload, **kwargs)
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        return await self.request("GET", path, params=params, **kwargs)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "UpstreamClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
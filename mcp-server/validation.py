@@ -0,0 +1,220 @@
+"""
+Precompiled argument validation for MCP tool input schemas.
+
+Tool ``inputSchema`` documents are compiled once into nested closures, so a
+call only pays for the checks its schema actually declares. Compiled
+validators are cached by a digest of the canonical schema, which means a
+tool whose schema changes gets a fresh validator while unchanged tools keep
+sharing theirs. The cache is a small LRU so repeated config reloads cannot
+grow it without bound.
+
+Supports the JSON Schema subset used by the BondMCP tool catalog: ``type``,
+``properties``, ``required``, ``additionalProperties``, ``items``, ``enum``,
+``const``, ``minLength``/``maxLength``, ``minimum``/``maximum`` and
+``minItems``/``maxItems``. Annotation keywords (``description``,
+``default``, ...) are ignored.
+"""
+
+import json
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple
+
+Check = Callable[[Any, str], None]
+Validator = Callable[[Dict[str, Any]], None]
+
+_TYPES: Dict[str, Tuple[type, ...]] = {
+    "object": (dict,),
+    "array": (list, tuple),
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "null": (type(None),),
+}
+
+# Compiled validators kept across config reloads (least recently used evicted)
+CACHE_SIZE = 256
+_cache: "OrderedDict[str, Validator]" = OrderedDict()
+
+
+class SchemaValidationError(ValueError):
+    """Raised when arguments do not match a tool's input schema"""
+
+    def __init__(self, message: str, path: str = ""):
+        super().__init__(f"{path}: {message}" if path else message)
+        self.path = path
+        self.reason = message
+
+
+def _type_check(names: List[str]) -> Check:
+    accepted = tuple(t for name in names for t in _TYPES[name])
+    # bool is a subclass of int; only accept it where "boolean" is declared
+    reject_bool = "boolean" not in names
+    expected = " or ".join(names)
+
+    def check(value: Any, path: str) -> None:
+        if not isinstance(value, accepted) or (reject_bool and isinstance(value, bool)):
+            raise SchemaValidationError(f"expected {expected}", path)
+
+    return check
+
+
+def _compile(schema: Dict[str, Any]) -> Check:
+    checks: List[Check] = []
+
+    declared = schema.get("type")
+    if declared is not None:
+        checks.append(_type_check([declared] if isinstance(declared, str) else list(declared)))
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+
+        def check_enum(value: Any, path: str) -> None:
+            if value not in allowed:
+                raise SchemaValidationError(f"must be one of {allowed}", path)
+
+        checks.append(check_enum)
+
+    if "const" in schema:
+        constant = schema["const"]
+
+        def check_const(value: Any, path: str) -> None:
+            if value != constant:
+                raise SchemaValidationError(f"must equal {constant!r}", path)
+
+        checks.append(check_const)
+
+    for keyword, limit_ok, describe in (
+        ("minLength", lambda v, n: len(v) >= n, "shorter than"),
+        ("maxLength", lambda v, n: len(v) <= n, "longer than"),
+    ):
+        if keyword in schema:
+            checks.append(_bounded(str, schema[keyword], limit_ok, f"is {describe} {schema[keyword]}"))
+    for keyword, limit_ok, describe in (
+        ("minimum", lambda v, n: v >= n, "below"),
+        ("maximum", lambda v, n: v <= n, "above"),
+    ):
+        if keyword in schema:
+            checks.append(_bounded((int, float), schema[keyword], limit_ok, f"is {describe} {schema[keyword]}"))
+    for keyword, limit_ok, describe in (
+        ("minItems", lambda v, n: len(v) >= n, "fewer than"),
+        ("maxItems", lambda v, n: len(v) <= n, "more than"),
+    ):
+        if keyword in schema:
+            checks.append(_bounded((list, tuple), schema[keyword], limit_ok, f"has {describe} {schema[keyword]} items"))
+
+    properties = {
+        name: _compile(subschema)
+        for name, subschema in schema.get("properties", {}).items()
+    }
+    required = tuple(schema.get("required", ()))
+    additional = schema.get("additionalProperties", True)
+    additional_check = _compile(additional) if isinstance(additional, dict) else None
+
+    if properties or required or additional is not True:
+
+        def check_object(value: Any, path: str) -> None:
+            if not isinstance(value, dict):
+                return
+            for name in required:
+                if name not in value:
+                    raise SchemaValidationError(f"'{name}' is required", path)
+            for name, item in value.items():
+                child = properties.get(name)
+                if child is not None:
+                    child(item, f"{path}.{name}" if path else name)
+                elif additional is False:
+                    raise SchemaValidationError(f"unexpected property '{name}'", path)
+                elif additional_check is not None:
+                    additional_check(item, f"{path}.{name}" if path else name)
+
+        checks.append(check_object)
+
+    if isinstance(schema.get("items"), dict):
+        item_check = _compile(schema["items"])
+
+        def check_items(value: Any, path: str) -> None:
+            if not isinstance(value, (list, tuple)):
+                return
+            for index, item in enumerate(value):
+                item_check(item, f"{path}[{index}]")
+
+        checks.append(check_items)
+
+    if not checks:
+        return lambda value, path: None
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value: Any, path: str) -> None:
+        for check in checks:
+            check(value, path)
+
+    return check_all
+
+
+def _bounded(applies_to: Any, limit: Any, limit_ok: Callable[[Any, Any], bool], message: str) -> Check:
+    def check(value: Any, path: str) -> None:
+        if isinstance(value, applies_to) and not isinstance(value, bool) and not limit_ok(value, limit):
+            raise SchemaValidationError(message, path)
+
+    return check
+
+
+def check_schema(schema: Any, path: str = "") -> None:
+    """
+    Reject schema documents the compiler cannot handle.
+
+    Raises ValueError for a non-object schema or an unknown ``type`` name, so
+    a bad tool definition fails at config load instead of on its first call.
+    """
+    if not isinstance(schema, dict):
+        raise ValueError(f"{path or 'schema'}: must be an object")
+    declared = schema.get("type")
+    if declared is not None:
+        names = [declared] if isinstance(declared, str) else declared
+        if not isinstance(names, list) or not names:
+            raise ValueError(f"{path or 'schema'}: type must be a name or a list of names")
+        for name in names:
+            if name not in _TYPES:
+                raise ValueError(f"{path or 'schema'}: unknown type {name!r}")
+    properties = schema.get("properties", {})
+    if not isinstance(properties, dict):
+        raise ValueError(f"{path or 'schema'}: properties must be an object")
+    for name, subschema in properties.items():
+        check_schema(subschema, f"{path}.{name}" if path else name)
+    if isinstance(schema.get("additionalProperties"), dict):
+        check_schema(schema["additionalProperties"], path)
+    if isinstance(schema.get("items"), dict):
+        check_schema(schema["items"], f"{path}[]")
+
+
+def schema_fingerprint(schema: Dict[str, Any]) -> str:
+    """Stable digest of a schema, used as the validator cache key"""
+    import hashlib  # deferred so importing this module stays cheap at startup
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def compile_schema(schema: Dict[str, Any]) -> Validator:
+    """
+    Return a validator for ``schema``, compiling it on first use.
+
+    The validator raises SchemaValidationError for invalid arguments and
+    returns None otherwise.
+    """
+    key = schema_fingerprint(schema)
+    validator = _cache.get(key)
+    if validator is not None:
+        _cache.move_to_end(key)
+        return validator
+
+    check = _compile(schema)
+
+    def validator(arguments: Dict[str, Any]) -> None:
+        check(arguments, "")
+
+    _cache[key] = validator
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return validator
@@ -13,10 +13,12 @@ __license__ = "MIT"
 # Re-export the canonical client implementation
 from .client import (
     BondMCPClient,
+    AsyncBondMCPClient,
     BondMCPAPIError,
     BondMCPNetworkError,
     BondMCPError,
     Client,
+    AsyncClient,
     APIError,
     NetworkError,
     Error,
@@ -32,10 +34,12 @@ from .client import (
 
 __all__ = [
     "BondMCPClient",
+    "AsyncBondMCPClient",
     "BondMCPAPIError",
     "BondMCPNetworkError",
     "BondMCPError",
     "Client",
+    "AsyncClient",
     "APIError",
     "NetworkError",
     "Error",
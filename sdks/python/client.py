@@ -1,14 +1,86 @@
+import asyncio
 import json
 import time
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Awaitable, Dict, Generic, List, Optional, Protocol, TypeVar, Union
 
 import requests
 
+try:
+    import aiohttp
+except ImportError:  # AsyncBondMCPClient is unavailable without it
+    aiohttp = None
+
 # Disclaimer: This SDK is provided for informational purposes only and does not
 # constitute medical advice.
 
 
+def _default_headers(api_key: str, keep_alive: bool = True) -> Dict[str, str]:
+    headers = {
+        "X-API-Key": api_key,
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        "User-Agent": "bondmcp-python/1.0.0",
+    }
+    if not keep_alive:
+        headers["Connection"] = "close"
+    return headers
+
+
+# What a client's request() returns: a Dict for BondMCPClient, an awaitable
+# of one for AsyncBondMCPClient. Resource methods return the same.
+Result = TypeVar("Result")
+_Result_co = TypeVar("_Result_co", covariant=True)
+
+
+class _Requester(Protocol[_Result_co]):
+    def request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+    ) -> _Result_co:
+        ...
+
+
+class _Resource(Generic[Result]):
+    """Base of the API resources, shared by the sync and async clients"""
+
+    def __init__(self, client: _Requester[Result]):
+        self.client = client
+
+
+def _attach_resources(client: Any) -> None:
+    client.health = HealthResource(client)
+    client.labs = LabsResource(client)
+    client.supplements = SupplementsResource(client)
+    client.wearables = WearablesResource(client)
+    client.medical_records = MedicalRecordsResource(client)
+    client.ask = AskResource(client)
+    client.insights = InsightsResource(client)
+    client.api_keys = APIKeysResource(client)
+    client.payments = PaymentsResource(client)
+    client.orchestrate = OrchestrateResource(client)
+    client.tools = ToolsResource(client)
+    client.imports = ImportResource(client)
+    client.chat = ChatResource(client)
+
+
 class BondMCPClient:
+    health: "HealthResource[Dict]"
+    labs: "LabsResource[Dict]"
+    supplements: "SupplementsResource[Dict]"
+    wearables: "WearablesResource[Dict]"
+    medical_records: "MedicalRecordsResource[Dict]"
+    ask: "AskResource[Dict]"
+    insights: "InsightsResource[Dict]"
+    api_keys: "APIKeysResource[Dict]"
+    payments: "PaymentsResource[Dict]"
+    orchestrate: "OrchestrateResource[Dict]"
+    tools: "ToolsResource[Dict]"
+    imports: "ImportResource[Dict]"
+    chat: "ChatResource[Dict]"
+
     def __init__(
         self,
         api_key: str,
@@ -16,37 +88,79 @@ class BondMCPClient:
         timeout: int = 30,
         max_retries: int = 0,
         retry_delay: float = 1.0,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        session: Optional["requests.Session"] = None,
     ):
         """
         Initialize the BondMCP API client.
 
+        Requests go through one pooled ``requests.Session``, so connections
+        (and their TLS handshakes) are reused across calls. Close the client,
+        or use it as a context manager, to release them.
+
         Args:
             api_key: Your BondMCP API key
             base_url: The base URL for the BondMCP API
             timeout: Request timeout in seconds
             max_retries: Number of retry attempts for rate limited requests
             retry_delay: Base delay in seconds before retries (exponential backoff)
+            pool_connections: Number of hosts to keep connection pools for
+            pool_maxsize: Connections kept open per host
+            pool_block: Wait for a free connection once a host has pool_maxsize
+                in use, instead of opening extra ones that are not kept
+            keep_alive: Keep connections open between requests
+            session: Use this session instead of creating one; the caller
+                keeps ownership and close() leaves it open
         """
         self.api_key = api_key
         self.base_url = base_url
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-
-        # Initialize API resources
-        self.health = HealthResource(self)
-        self.labs = LabsResource(self)
-        self.supplements = SupplementsResource(self)
-        self.wearables = WearablesResource(self)
-        self.medical_records = MedicalRecordsResource(self)
-        self.ask = AskResource(self)
-        self.insights = InsightsResource(self)
-        self.api_keys = APIKeysResource(self)
-        self.payments = PaymentsResource(self)
-        self.orchestrate = OrchestrateResource(self)
-        self.tools = ToolsResource(self)
-        self.imports = ImportResource(self)
-        self.chat = ChatResource(self)
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self._session = session
+        self._owns_session = session is None
+
+        _attach_resources(self)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Headers sent with every request"""
+        return _default_headers(self.api_key, self.keep_alive)
+
+    @property
+    def session(self) -> "requests.Session":
+        """The pooled HTTP session, created on first use"""
+        if self._session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                pool_block=self.pool_block,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(self.headers)
+            self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """Close pooled connections (the session is recreated if used again)"""
+        if self._session is not None and self._owns_session:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> "BondMCPClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def request(
         self,
@@ -73,31 +187,18 @@ class BondMCPClient:
             BondMCPError: For other errors
         """
         url = f"{self.base_url}{path}"
-        headers = {
-            "X-API-Key": self.api_key,
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "bondmcp-python/1.0.0",
-        }
+        session = self.session
 
         for attempt in range(self.max_retries + 1):
             try:
                 if method.lower() == "get":
-                    response = requests.get(
-                        url, headers=headers, params=params, timeout=self.timeout
-                    )
+                    response = session.get(url, params=params, timeout=self.timeout)
                 elif method.lower() == "post":
-                    response = requests.post(
-                        url, headers=headers, json=data, timeout=self.timeout
-                    )
+                    response = session.post(url, json=data, timeout=self.timeout)
                 elif method.lower() == "put":
-                    response = requests.put(
-                        url, headers=headers, json=data, timeout=self.timeout
-                    )
+                    response = session.put(url, json=data, timeout=self.timeout)
                 elif method.lower() == "delete":
-                    response = requests.delete(
-                        url, headers=headers, json=data, timeout=self.timeout
-                    )
+                    response = session.delete(url, json=data, timeout=self.timeout)
                 else:
                     raise BondMCPError(f"Unsupported HTTP method: {method}")
 
@@ -142,11 +243,203 @@ class BondMCPClient:
         raise BondMCPError("Exceeded maximum retry attempts")
 
 
-class HealthResource:
-    def __init__(self, client: BondMCPClient):
-        self.client = client
+class AsyncBondMCPClient:
+    """
+    asyncio client for the BondMCP API, with the same resources as BondMCPClient.
+
+    Resource methods return awaitables here::
+
+        async with AsyncBondMCPClient(api_key) as client:
+            answer = await client.ask.query("Is magnesium safe with lisinopril?")
+
+    All requests share one aiohttp connection pool, so many calls can be in
+    flight at once on a single event loop. Requires aiohttp.
+    """
+
+    health: "HealthResource[Awaitable[Dict]]"
+    labs: "LabsResource[Awaitable[Dict]]"
+    supplements: "SupplementsResource[Awaitable[Dict]]"
+    wearables: "WearablesResource[Awaitable[Dict]]"
+    medical_records: "MedicalRecordsResource[Awaitable[Dict]]"
+    ask: "AskResource[Awaitable[Dict]]"
+    insights: "InsightsResource[Awaitable[Dict]]"
+    api_keys: "APIKeysResource[Awaitable[Dict]]"
+    payments: "PaymentsResource[Awaitable[Dict]]"
+    orchestrate: "OrchestrateResource[Awaitable[Dict]]"
+    tools: "ToolsResource[Awaitable[Dict]]"
+    imports: "ImportResource[Awaitable[Dict]]"
+    chat: "ChatResource[Awaitable[Dict]]"
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.bondmcp.com/api",
+        timeout: int = 30,
+        max_retries: int = 0,
+        retry_delay: float = 1.0,
+        pool_maxsize: int = 100,
+        pool_per_host: int = 0,
+        keep_alive: bool = True,
+        keepalive_timeout: float = 15.0,
+        session: Optional["aiohttp.ClientSession"] = None,
+    ):
+        """
+        Initialize the async BondMCP API client.
+
+        Args:
+            api_key: Your BondMCP API key
+            base_url: The base URL for the BondMCP API
+            timeout: Request timeout in seconds
+            max_retries: Number of retry attempts for rate limited requests
+            retry_delay: Base delay in seconds before retries (exponential backoff)
+            pool_maxsize: Connections open at once across all hosts (0 = unlimited);
+                further requests wait for a free connection
+            pool_per_host: Connections open at once per host (0 = unlimited)
+            keep_alive: Keep connections open between requests
+            keepalive_timeout: Seconds an idle connection is kept open
+            session: Use this session instead of creating one; the caller
+                keeps ownership and aclose() leaves it open
+        """
+        if aiohttp is None:
+            raise BondMCPError(
+                "AsyncBondMCPClient requires aiohttp: pip install aiohttp"
+            )
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.pool_maxsize = pool_maxsize
+        self.pool_per_host = pool_per_host
+        self.keep_alive = keep_alive
+        self.keepalive_timeout = keepalive_timeout
+        self._session = session
+        self._owns_session = session is None
+
+        _attach_resources(self)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Headers sent with every request"""
+        return _default_headers(self.api_key, self.keep_alive)
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """
+        The pooled HTTP session, created on first use.
+
+        Must be used from the event loop the client runs on.
+        """
+        if self._session is None or self._session.closed:
+            if self.keep_alive:
+                connector = aiohttp.TCPConnector(
+                    limit=self.pool_maxsize,
+                    limit_per_host=self.pool_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                )
+            else:
+                connector = aiohttp.TCPConnector(
+                    limit=self.pool_maxsize,
+                    limit_per_host=self.pool_per_host,
+                    force_close=True,
+                )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close pooled connections (the session is recreated if used again)"""
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncBondMCPClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+    ) -> Dict:
+        """
+        Make a request to the BondMCP API.
+
+        Args:
+            method: HTTP method (get, post, put, delete)
+            path: API endpoint path
+            data: Request body for POST/PUT requests
+            params: Query parameters for GET requests
+
+        Returns:
+            API response as a dictionary
+
+        Raises:
+            BondMCPAPIError: If the API returns an error
+            BondMCPNetworkError: If there's a network error
+            BondMCPError: For other errors
+        """
+        method = method.lower()
+        if method not in ("get", "post", "put", "delete"):
+            raise BondMCPError(f"Unsupported HTTP method: {method}")
+        url = f"{self.base_url}{path}"
+        if method == "get":
+            options = {"params": params}
+        else:
+            options = {"json": data}
+        session = self.session
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with session.request(method.upper(), url, **options) as response:
+                    if response.status == 429 and attempt < self.max_retries:
+                        retry_after = response.headers.get("Retry-After")
+                        delay = (
+                            float(retry_after)
+                            if retry_after
+                            else self.retry_delay * (2**attempt)
+                        )
+                    elif response.status >= 400:
+                        raise await _async_api_error(response)
+                    else:
+                        return await response.json(content_type=None)
+            except BondMCPError:
+                raise
+            except asyncio.TimeoutError:
+                raise BondMCPNetworkError("Network error: Request timed out")
+            except aiohttp.ClientConnectionError:
+                raise BondMCPNetworkError("Network error: Failed to connect to API")
+            except aiohttp.ClientError as e:
+                raise BondMCPNetworkError(f"Network error: {str(e)}")
+            except Exception as e:
+                raise BondMCPError(f"Unexpected error: {str(e)}")
+            await asyncio.sleep(delay)
+
+        raise BondMCPError("Exceeded maximum retry attempts")
+
+
+async def _async_api_error(response: "aiohttp.ClientResponse") -> "BondMCPAPIError":
+    try:
+        error = (await response.json(content_type=None)).get("error", {})
+        return BondMCPAPIError(
+            error.get("message", "API request failed"),
+            response.status,
+            error.get("code", "api_error"),
+            error.get("details", {}),
+        )
+    except (ValueError, AttributeError):
+        return BondMCPAPIError(f"{response.status} {response.reason}", response.status)
+
 
-    def check(self) -> Dict:
+class HealthResource(_Resource[Result]):
+    def check(self) -> Result:
         """
         Check the operational status of the API.
 
@@ -156,13 +449,10 @@ class HealthResource:
         return self.client.request("get", "/health")
 
 
-class LabsResource:
-    def __init__(self, client: BondMCPClient):
-        self.client = client
-
+class LabsResource(_Resource[Result]):
     def interpret(
         self, lab_results: List[Dict], patient_context: Optional[Dict] = None
-    ) -> Dict:
+    ) -> Result:
         """
         Interpret lab results with AI-powered analysis.
 
@@ -181,10 +471,7 @@ class LabsResource:
         return self.client.request("post", "/labs/interpret", data=data)
 
 
-class SupplementsResource:
-    def __init__(self, client: BondMCPClient):
-        self.client = client
-
+class SupplementsResource(_Resource[Result]):
     def recommend(
         self,
         health_goals: List[str],
@@ -192,7 +479,7 @@ class SupplementsResource:
         current_supplements: Optional[List[str]] = None,
         dietary_restrictions: Optional[List[str]] = None,
         patient_context: Optional[Dict] = None,
-    ) -> Dict:
+    ) -> Result:
         """
         Get personalized supplement recommendations based on health goals and lab results.
 
@@ -224,7 +511,7 @@ class SupplementsResource:
 
     def check_interactions(
         self, supplements: List[str], medications: Optional[List[str]] = None
-    ) -> Dict:
+    ) -> Result:
         """
         Check for potential interactions between supplements and medications.
 
@@ -243,17 +530,14 @@ class SupplementsResource:
         return self.client.request("post", "/supplement/interactions", data=data)
 
 
-class WearablesResource:
-    def __init__(self, client: BondMCPClient):
-        self.client = client
-
+class WearablesResource(_Resource[Result]):
     def analyze(
         self,
         wearable_data: Dict,
         wearable_type: str,
         timeframe: Optional[str] = None,
         metrics: Optional[List[str]] = None,
-    ) -> Dict:
+    ) -> Result:
         """
         Analyze wearable device data for health insights.
 
@@ -277,16 +561,13 @@ class WearablesResource:
         return self.client.request("post", "/v1/wearable-data-insights", data=data)
 
 
-class MedicalRecordsResource:
-    def __init__(self, client: BondMCPClient):
-        self.client = client
-
+class MedicalRecordsResource(_Resource[Result]):
     def analyze(
         self,
         medical_record_text: str,
         extract_entities: bool = True,
         confidence_threshold: Optional[float] = None,
-    ) -> Dict:
+    ) -> Result:
         """
         Analyze medical record text for insights and entity extraction.
 
@@ -309,11 +590,8 @@ class MedicalRecordsResource:
         return self.client.request("post", "/v1/analyze-medical-record", data=data)
 
 
-class AskResource:
-    def __init__(self, client: BondMCPClient):
-        self.client = client
-
-    def query(self, query: str, conversation_id: Optional[str] = None) -> Dict:
+class AskResource(_Resource[Result]):
+    def query(self, query: str, conversation_id: Optional[str] = None) -> Result:
         """Query the LLM using the /ask endpoint.
 
         Args:
@@ -330,11 +608,8 @@ class AskResource:
         return self.client.request("post", "/ask", data=data)
 
 
-class InsightsResource:
-    def __init__(self, client: BondMCPClient):
-        self.client = client
-
-    def generate(self, payload: Dict, insight_type: Optional[str] = None) -> Dict:
+class InsightsResource(_Resource[Result]):
+    def generate(self, payload: Dict, insight_type: Optional[str] = None) -> Result:
         """Generate health insights.
 
         Args:
@@ -348,15 +623,12 @@ class InsightsResource:
         return self.client.request("post", path, data=payload)
 
 
-class APIKeysResource:
-    def __init__(self, client: BondMCPClient):
-        self.client = client
-
-    def list(self) -> Dict:
+class APIKeysResource(_Resource[Result]):
+    def list(self) -> Result:
         """List API keys for the authenticated user."""
         return self.client.request("get", "/api-keys")
 
-    def create(self, name: str, scopes: Optional[List[str]] = None) -> Dict:
+    def create(self, name: str, scopes: Optional[List[str]] = None) -> Result:
         """Create a new API key.
 
         Args:
@@ -373,7 +645,7 @@ class APIKeysResource:
         key_id: str,
         name: Optional[str] = None,
         scopes: Optional[List[str]] = None,
-    ) -> Dict:
+    ) -> Result:
         """Update an existing API key."""
         data: Dict[str, Any] = {}
         if name:
@@ -382,18 +654,15 @@ class APIKeysResource:
             data["scopes"] = scopes
         return self.client.request("put", f"/api-keys/{key_id}", data=data)
 
-    def revoke(self, key_id: str) -> Dict:
+    def revoke(self, key_id: str) -> Result:
         """Revoke (delete) an API key."""
         return self.client.request("delete", f"/api-keys/{key_id}")
 
 
-class PaymentsResource:
-    def __init__(self, client: BondMCPClient):
-        self.client = client
-
+class PaymentsResource(_Resource[Result]):
     def create_intent(
         self, amount: int, currency: str, metadata: Optional[Dict[str, Any]] = None
-    ) -> Dict:
+    ) -> Result:
         """Create a payment intent."""
         data = {"amount": amount, "currency": currency}
         if metadata:
@@ -401,11 +670,8 @@ class PaymentsResource:
         return self.client.request("post", "/payments/create-intent", data=data)
 
 
-class OrchestrateResource:
-    def __init__(self, client: BondMCPClient):
-        self.client = client
-
-    def run(self, steps: List[Dict], conversation_id: Optional[str] = None) -> Dict:
+class OrchestrateResource(_Resource[Result]):
+    def run(self, steps: List[Dict], conversation_id: Optional[str] = None) -> Result:
         """Orchestrate multiple tool invocations."""
         data: Dict[str, Any] = {"steps": steps}
         if conversation_id:
@@ -413,30 +679,21 @@ class OrchestrateResource:
         return self.client.request("post", "/orchestrate", data=data)
 
 
-class ToolsResource:
-    def __init__(self, client: BondMCPClient):
-        self.client = client
-
-    def call(self, tool: str, payload: Dict) -> Dict:
+class ToolsResource(_Resource[Result]):
+    def call(self, tool: str, payload: Dict) -> Result:
         """Call a specific tool by name."""
         data = {"tool": tool, "payload": payload}
         return self.client.request("post", "/tools/call", data=data)
 
 
-class ImportResource:
-    def __init__(self, client: BondMCPClient):
-        self.client = client
-
-    def oura(self, data: Dict) -> Dict:
+class ImportResource(_Resource[Result]):
+    def oura(self, data: Dict) -> Result:
         """Import Oura data."""
         return self.client.request("post", "/import/oura", data=data)
 
 
-class ChatResource:
-    def __init__(self, client: BondMCPClient):
-        self.client = client
-
-    def upload_health_data(self, conversation_id: str, data: Dict) -> Dict:
+class ChatResource(_Resource[Result]):
+    def upload_health_data(self, conversation_id: str, data: Dict) -> Result:
         """Upload health data to a conversation."""
         path = f"/v1/chat/conversation/{conversation_id}/health-data"
         return self.client.request("post", path, data=data)
@@ -472,6 +729,7 @@ class BondMCPNetworkError(BondMCPError):
 
 # Module exports
 Client = BondMCPClient
+AsyncClient = AsyncBondMCPClient
 APIError = BondMCPAPIError
 NetworkError = BondMCPNetworkError
 Error = BondMCPError
@@ -4,8 +4,11 @@ Enhanced BondMCP Python SDK with async support, comprehensive error handling, an
 
 import asyncio
 import json
+import random
 import time
-from typing import Dict, List, Optional, Union, Any, Callable
+import uuid
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Union, Any, AsyncIterator, Callable, Iterable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import logging
@@ -32,7 +35,9 @@ class AuthenticationError(BondMCPError):
 
 class RateLimitError(BondMCPError):
     """Raised when rate limit is exceeded."""
-    pass
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class ValidationError(BondMCPError):
@@ -62,6 +67,176 @@ class APIResponse:
         return 200 <= self.status_code < 300
 
 
+@dataclass
+class BulkRequest:
+    """One request in a bulk run (see EnhancedBondMCPClient.async_bulk)."""
+    method: str
+    path: str
+    data: Optional[Dict] = None
+    params: Optional[Dict] = None
+
+
+@dataclass
+class BulkResult:
+    """Outcome of one bulk request: its response, or the error it raised."""
+    index: int
+    request: BulkRequest
+    response: Optional[APIResponse] = None
+    error: Optional[Exception] = None
+    
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryBudget:
+    """
+    Client-wide cap on retries as a fraction of requests.
+    
+    Every request deposits ``ratio`` tokens and every retry spends one, up to
+    ``capacity`` saved. While the API is healthy this allows bursts of
+    retries; during an outage retries fall to ``ratio`` of traffic instead of
+    multiplying it.
+    """
+    
+    def __init__(self, ratio: float = 0.2, capacity: float = 20.0):
+        self.ratio = ratio
+        self.capacity = capacity
+        self.tokens = capacity
+    
+    def deposit(self) -> None:
+        self.tokens = min(self.capacity, self.tokens + self.ratio)
+    
+    def withdraw(self) -> bool:
+        """Spend one retry if the budget allows it."""
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+    
+    - Authentication and validation errors are never retried.
+    - 429 is always retried, after Retry-After when the API sends one. A
+      Retry-After longer than ``max_delay`` gives up instead of retrying early.
+    - Other statuses in ``retry_statuses``, connection errors and timeouts
+      are retried only for idempotent requests: GET, HEAD, OPTIONS, PUT and
+      DELETE, plus requests sent with an Idempotency-Key.
+    - Keys are only safe if the API deduplicates requests by the key, so
+      none are sent unless the caller passes ``idempotency_key=`` or turns
+      on ``idempotency_keys``. With it on, every POST/PATCH gets a key that
+      stays the same across its attempts.
+    - Delays use full jitter (uniform between 0 and the exponential backoff),
+      so clients failing together do not retry in lockstep.
+    - A shared RetryBudget bounds retries across all requests.
+    
+    Subclass and override ``is_retryable`` or ``backoff`` to customise.
+    """
+    
+    IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+    RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+    
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        respect_retry_after: bool = True,
+        idempotency_keys: bool = False,
+        budget: Optional[RetryBudget] = None
+    ):
+        """
+        Args:
+            max_retries: Retries per request after the first attempt
+            base_delay: Backoff ceiling for the first retry, doubling per retry
+            max_delay: Longest wait before any retry; a longer Retry-After
+                ends the retries
+            retry_statuses: HTTP statuses worth retrying
+            respect_retry_after: Wait as long as the API's Retry-After asks
+            idempotency_keys: Send an Idempotency-Key with non-idempotent
+                requests; only for APIs that deduplicate on it
+            budget: Retry budget shared by every request (default: RetryBudget())
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.idempotency_keys = idempotency_keys
+        self.budget = budget if budget is not None else RetryBudget()
+    
+    def prepare(self, method: str, headers: Dict[str, str], idempotency_key: Optional[str] = None) -> bool:
+        """
+        Called once per request before the first attempt; returns whether
+        retries are safe.
+        
+        An explicit ``idempotency_key`` is sent with any method; one is
+        generated for non-idempotent methods when ``idempotency_keys`` is on.
+        """
+        self.budget.deposit()
+        if idempotency_key is None and self.idempotency_keys and method not in self.IDEMPOTENT_METHODS:
+            idempotency_key = str(uuid.uuid4())
+        if idempotency_key is not None:
+            headers['Idempotency-Key'] = idempotency_key
+        return method in self.IDEMPOTENT_METHODS or 'Idempotency-Key' in headers
+    
+    def is_retryable(self, error: Exception, idempotent: bool) -> bool:
+        """Classify a failed attempt."""
+        if isinstance(error, (AuthenticationError, ValidationError)):
+            return False
+        if isinstance(error, RateLimitError):
+            # The request was refused, not processed: always safe to repeat
+            return True
+        if not idempotent:
+            return False
+        if isinstance(error, APIError):
+            return error.status_code in self.retry_statuses
+        return isinstance(error, (
+            requests.ConnectionError, requests.Timeout,
+            aiohttp.ClientConnectionError, asyncio.TimeoutError
+        ))
+    
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Seconds to wait before retry number ``attempt + 1``, or None when the
+        API's Retry-After asks for longer than ``max_delay``.
+        """
+        if retry_after is not None and self.respect_retry_after:
+            return retry_after if retry_after <= self.max_delay else None
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+    
+    def retry_delay(self, attempt: int, error: Exception, idempotent: bool) -> Optional[float]:
+        """Seconds to wait before retrying, or None to give up and raise ``error``."""
+        if attempt >= self.max_retries or not self.is_retryable(error, idempotent):
+            return None
+        delay = self.backoff(attempt, getattr(error, 'retry_after', None))
+        if delay is None:
+            logger.warning("Retry-After exceeds max_delay (%ss); not retrying", self.max_delay)
+            return None
+        if not self.budget.withdraw():
+            logger.warning("Retry budget exhausted; not retrying")
+            return None
+        return delay
+
+
 class ModelPreference(Enum):
     """Available model preferences for AI requests."""
     CONSENSUS = "consensus"
@@ -89,7 +264,8 @@ class EnhancedBondMCPClient:
         max_retries: int = 3,
         retry_delay: float = 1.0,
         enable_logging: bool = False,
-        user_tier: UserTier = UserTier.DEVELOPER
+        user_tier: UserTier = UserTier.DEVELOPER,
+        retry_policy: Optional[RetryPolicy] = None
     ):
         """
         Initialize the enhanced BondMCP API client.
@@ -99,9 +275,10 @@ class EnhancedBondMCPClient:
             base_url: The base URL for the BondMCP API
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retry attempts in seconds
+            retry_delay: Base delay between retry attempts in seconds
             enable_logging: Enable detailed logging
             user_tier: User tier for endpoint access control
+            retry_policy: Retry rules (default: RetryPolicy(max_retries, retry_delay))
         """
         if not api_key:
             raise AuthenticationError("API key is required")
@@ -112,6 +289,7 @@ class EnhancedBondMCPClient:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.user_tier = user_tier
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries, base_delay=retry_delay)
         
         if enable_logging:
             logging.basicConfig(level=logging.INFO)
@@ -181,7 +359,9 @@ class EnhancedBondMCPClient:
         if response.status_code == 401:
             raise AuthenticationError("Invalid API key")
         elif response.status_code == 429:
-            raise RateLimitError("Rate limit exceeded")
+            raise RateLimitError(
+                "Rate limit exceeded", parse_retry_after(response.headers.get('Retry-After'))
+            )
         elif response.status_code == 422:
             raise ValidationError(f"Validation error: {response.text}")
         elif not api_response.success:
@@ -209,24 +389,32 @@ class EnhancedBondMCPClient:
         path: str,
         data: Optional[Dict] = None,
         params: Optional[Dict] = None,
+        idempotency_key: Optional[str] = None,
         **kwargs
     ) -> APIResponse:
         """
-        Make a synchronous API request with retry logic.
+        Make a synchronous API request, retrying as ``retry_policy`` allows.
         
         Args:
             method: HTTP method (GET, POST, etc.)
             path: API endpoint path
             data: Request body data
             params: Query parameters
+            idempotency_key: Idempotency-Key to send; makes the request
+                safe to retry (default: generated only if the policy's
+                idempotency_keys is on)
             **kwargs: Additional request parameters
             
         Returns:
             APIResponse object with structured response data
         """
         url = f"{self.base_url}{path}"
+        method = method.upper()
+        headers = dict(kwargs.pop('headers', None) or {})
+        idempotent = self.retry_policy.prepare(method, headers, idempotency_key)
+        attempt = 0
         
-        for attempt in range(self.max_retries + 1):
+        while True:
             try:
                 start_time = time.time()
                 
@@ -237,6 +425,7 @@ class EnhancedBondMCPClient:
                     url=url,
                     json=data,
                     params=params,
+                    headers=headers,
                     timeout=self.timeout,
                     **kwargs
                 )
@@ -250,13 +439,15 @@ class EnhancedBondMCPClient:
                 
                 return api_response
                 
-            except (requests.RequestException, APIError) as e:
-                if attempt == self.max_retries:
-                    logger.error(f"Request failed after {self.max_retries + 1} attempts: {e}")
+            except (requests.RequestException, BondMCPError) as e:
+                delay = self.retry_policy.retry_delay(attempt, e, idempotent)
+                if delay is None:
+                    logger.error(f"Request failed after {attempt + 1} attempts: {e}")
                     raise
                 
-                logger.warning(f"Request attempt {attempt + 1} failed: {e}. Retrying in {self.retry_delay}s...")
-                time.sleep(self.retry_delay * (2 ** attempt))  # Exponential backoff
+                logger.warning(f"Request attempt {attempt + 1} failed: {e}. Retrying in {delay:.2f}s...")
+                time.sleep(delay)
+                attempt += 1
     
     async def async_request(
         self,
@@ -264,25 +455,33 @@ class EnhancedBondMCPClient:
         path: str,
         data: Optional[Dict] = None,
         params: Optional[Dict] = None,
+        idempotency_key: Optional[str] = None,
         **kwargs
     ) -> APIResponse:
         """
-        Make an asynchronous API request with retry logic.
+        Make an asynchronous API request, retrying as ``retry_policy`` allows.
         
         Args:
             method: HTTP method (GET, POST, etc.)
             path: API endpoint path
             data: Request body data
             params: Query parameters
+            idempotency_key: Idempotency-Key to send; makes the request
+                safe to retry (default: generated only if the policy's
+                idempotency_keys is on)
             **kwargs: Additional request parameters
             
         Returns:
             APIResponse object with structured response data
         """
         url = f"{self.base_url}{path}"
+        method = method.upper()
+        headers = dict(kwargs.pop('headers', None) or {})
+        idempotent = self.retry_policy.prepare(method, headers, idempotency_key)
         session = await self._get_async_session()
+        attempt = 0
         
-        for attempt in range(self.max_retries + 1):
+        while True:
             try:
                 start_time = time.time()
                 
@@ -293,6 +492,7 @@ class EnhancedBondMCPClient:
                     url=url,
                     json=data,
                     params=params,
+                    headers=headers,
                     **kwargs
                 ) as response:
                     response_time = time.time() - start_time
@@ -311,27 +511,32 @@ class EnhancedBondMCPClient:
                     if response.status == 401:
                         raise AuthenticationError("Invalid API key")
                     elif response.status == 429:
-                        raise RateLimitError("Rate limit exceeded")
+                        raise RateLimitError(
+                            "Rate limit exceeded", parse_retry_after(response.headers.get('Retry-After'))
+                        )
                     elif response.status == 422:
                         text = await response.text()
                         raise ValidationError(f"Validation error: {text}")
                     elif not api_response.success:
+                        text = await response.text()
                         try:
-                            error_data = await response.json()
+                            error_data = json.loads(text)
+                        except ValueError:
+                            error_data = None
+                        if isinstance(error_data, dict):
                             raise APIError(
                                 error_data.get('message', 'API request failed'),
                                 response.status,
                                 error_data
                             )
-                        except:
-                            text = await response.text()
-                            raise APIError(f"API request failed: {text}", response.status)
+                        raise APIError(f"API request failed: {text}", response.status)
                     
                     # Parse response data
+                    text = await response.text()
                     try:
-                        api_response.data = await response.json()
-                    except:
-                        api_response.data = await response.text()
+                        api_response.data = json.loads(text)
+                    except ValueError:
+                        api_response.data = text
                     
                     # Update usage tracking
                     self.request_count += 1
@@ -340,13 +545,89 @@ class EnhancedBondMCPClient:
                     
                     return api_response
                     
-            except (aiohttp.ClientError, APIError) as e:
-                if attempt == self.max_retries:
-                    logger.error(f"Async request failed after {self.max_retries + 1} attempts: {e}")
+            except (aiohttp.ClientError, asyncio.TimeoutError, BondMCPError) as e:
+                delay = self.retry_policy.retry_delay(attempt, e, idempotent)
+                if delay is None:
+                    logger.error(f"Async request failed after {attempt + 1} attempts: {e}")
                     raise
                 
-                logger.warning(f"Async request attempt {attempt + 1} failed: {e}. Retrying in {self.retry_delay}s...")
-                await asyncio.sleep(self.retry_delay * (2 ** attempt))  # Exponential backoff
+                logger.warning(f"Async request attempt {attempt + 1} failed: {e}. Retrying in {delay:.2f}s...")
+                await asyncio.sleep(delay)
+                attempt += 1
+    
+    async def _bulk_one(self, index: int, item: Union[BulkRequest, Tuple]) -> BulkResult:
+        request = item
+        try:
+            if not isinstance(request, BulkRequest):
+                request = BulkRequest(*item)
+            response = await self.async_request(
+                request.method, request.path, data=request.data, params=request.params
+            )
+            return BulkResult(index, request, response=response)
+        except Exception as e:
+            return BulkResult(index, request, error=e)
+    
+    async def async_bulk_iter(
+        self,
+        bulk_requests: Iterable[Union[BulkRequest, Tuple]],
+        concurrency: int = 10
+    ) -> AsyncIterator[BulkResult]:
+        """
+        Run many requests through async_request, yielding results as they complete.
+        
+        At most ``concurrency`` requests are in flight. ``bulk_requests`` is
+        read lazily, so it can be a generator over thousands of items. A failed
+        request yields a BulkResult holding the error, and the rest of the run
+        carries on.
+        
+        Args:
+            bulk_requests: BulkRequest objects or (method, path, data, params) tuples
+            concurrency: Maximum number of requests in flight
+            
+        Yields:
+            BulkResult per request, in completion order (``index`` is its input position)
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        
+        pending = enumerate(bulk_requests)
+        running = set()
+        
+        def fill():
+            while len(running) < concurrency:
+                try:
+                    index, item = next(pending)
+                except StopIteration:
+                    return
+                running.add(asyncio.ensure_future(self._bulk_one(index, item)))
+        
+        try:
+            fill()
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                running.difference_update(done)
+                # Keep the pipeline full while the caller handles these
+                fill()
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in running:
+                task.cancel()
+    
+    async def async_bulk(
+        self,
+        bulk_requests: Iterable[Union[BulkRequest, Tuple]],
+        concurrency: int = 10
+    ) -> List[BulkResult]:
+        """
+        Run many requests through async_request and return every result in input order.
+        
+        Same as async_bulk_iter, but collected into a list; check
+        ``result.success`` / ``result.error`` per item.
+        """
+        results = [result async for result in self.async_bulk_iter(bulk_requests, concurrency)]
+        results.sort(key=lambda result: result.index)
+        return results
     
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get client usage statistics."""
@@ -506,6 +787,37 @@ class LabsResource(BaseResource):
             data['patient_context'] = patient_context
         
         return await self.client.async_request('POST', '/labs/interpret', data=data)
+    
+    async def async_bulk_interpret(
+        self,
+        lab_panels: Iterable[Dict[str, Any]],
+        patient_context: Optional[str] = None,
+        include_recommendations: bool = True,
+        concurrency: int = 10
+    ) -> List[BulkResult]:
+        """
+        Interpret many lab panels concurrently (see EnhancedBondMCPClient.async_bulk).
+        
+        Args:
+            lab_panels: Lab results of each panel, as passed to interpret
+            patient_context: Optional patient context applied to every panel
+            include_recommendations: Whether to include recommendations
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            BulkResult per panel, in input order
+        """
+        def bulk_requests():
+            for lab_results in lab_panels:
+                data = {
+                    'lab_results': lab_results,
+                    'include_recommendations': include_recommendations
+                }
+                if patient_context:
+                    data['patient_context'] = patient_context
+                yield BulkRequest('POST', '/labs/interpret', data=data)
+        
+        return await self.client.async_bulk(bulk_requests(), concurrency)
 
 
 class SupplementsResource(BaseResource):
@@ -927,6 +1239,11 @@ __all__ = [
     'BondMCPClient', 
     'Client',
     'APIResponse',
+    'BulkRequest',
+    'BulkResult',
+    'RetryPolicy',
+    'RetryBudget',
+    'parse_retry_after',
     'BondMCPError',
     'AuthenticationError',
     'RateLimitError',
@@ -1060,52 +1377,90 @@ class WebhookResource:
 
 
 class BatchResource:
-    """Batch processing resource for high-volume operations."""
+    """
+    Batch processing resource for high-volume operations.
+    
+    Records are streamed to the API in size-bounded chunks, each submitted
+    as its own batch (``{batch_id}-{n}``) with a bounded number of uploads in
+    flight, so large inputs never become one giant request body. The chunk
+    batches are then polled until they reach a terminal status, backing off
+    while nothing changes, and their results are assembled in input order.
+    """
+    
+    TERMINAL_STATUSES = ("completed", "failed", "cancelled")
     
     def __init__(self, client):
         self.client = client
     
     async def process_labs(
         self,
-        lab_results: List[Dict[str, Any]],
-        batch_id: Optional[str] = None
+        lab_results: Iterable[Dict[str, Any]],
+        batch_id: Optional[str] = None,
+        chunk_size: int = 500,
+        max_chunk_bytes: int = 1024 * 1024,
+        concurrency: int = 4,
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        timeout: Optional[float] = None
     ) -> Dict[str, Any]:
         """
-        Process multiple lab results in a single batch.
+        Process lab results in chunked batches.
         
         Args:
-            lab_results: List of lab result data
-            batch_id: Optional batch identifier
+            lab_results: Lab result data; any iterable, read lazily
+            batch_id: Optional batch identifier (chunks get ``{batch_id}-{n}``)
+            chunk_size: Maximum records per chunk
+            max_chunk_bytes: Maximum JSON size of a chunk's records
+            concurrency: Chunk uploads (and status polls) in flight at once
+            wait: Poll until every chunk finishes and collect its results
+            poll_interval: Initial seconds between status polls
+            max_poll_interval: Cap for the poll interval as it backs off
+            timeout: Seconds to wait for completion (None = no limit); on
+                expiry the summary has status "timeout" and lists every
+                chunk's batch_id, so polling can be resumed with get_status
             
         Returns:
-            Batch processing results
+            Batch summary: batch_id, status, chunks, results and errors
         """
-        data = {
-            "lab_results": lab_results,
-            "batch_id": batch_id or f"batch_{int(time.time())}"
-        }
-        return await self.client.request("POST", "/api/v1/batch/labs", data=data)
+        return await self._process(
+            "/api/v1/batch/labs", "lab_results", lab_results, {}, batch_id,
+            chunk_size, max_chunk_bytes, concurrency, wait,
+            poll_interval, max_poll_interval, timeout
+        )
     
     async def analyze_health_data(
         self,
-        health_records: List[Dict[str, Any]],
-        analysis_type: str = "comprehensive"
+        health_records: Iterable[Dict[str, Any]],
+        analysis_type: str = "comprehensive",
+        batch_id: Optional[str] = None,
+        chunk_size: int = 500,
+        max_chunk_bytes: int = 1024 * 1024,
+        concurrency: int = 4,
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        timeout: Optional[float] = None
     ) -> Dict[str, Any]:
         """
-        Analyze multiple health records in batch.
+        Analyze health records in chunked batches.
         
         Args:
-            health_records: List of health record data
+            health_records: Health record data; any iterable, read lazily
             analysis_type: Type of analysis to perform
+            batch_id: Optional batch identifier (chunks get ``{batch_id}-{n}``)
+            
+        The remaining arguments are as for process_labs.
             
         Returns:
-            Batch analysis results
+            Batch summary: batch_id, status, chunks, results and errors
         """
-        data = {
-            "health_records": health_records,
-            "analysis_type": analysis_type
-        }
-        return await self.client.request("POST", "/api/v1/batch/analyze", data=data)
+        return await self._process(
+            "/api/v1/batch/analyze", "health_records", health_records,
+            {"analysis_type": analysis_type}, batch_id,
+            chunk_size, max_chunk_bytes, concurrency, wait,
+            poll_interval, max_poll_interval, timeout
+        )
     
     async def get_status(self, batch_id: str) -> Dict[str, Any]:
         """
@@ -1117,7 +1472,165 @@ class BatchResource:
         Returns:
             Batch status and progress
         """
-        return await self.client.request("GET", f"/api/v1/batch/status/{batch_id}")
+        response = await self.client.async_request("GET", f"/api/v1/batch/status/{batch_id}")
+        return response.data
+    
+    @staticmethod
+    def chunk(
+        records: Iterable[Dict[str, Any]],
+        chunk_size: int = 500,
+        max_chunk_bytes: int = 1024 * 1024
+    ) -> Iterable[List[Dict[str, Any]]]:
+        """
+        Split records into chunks of at most ``chunk_size`` records and
+        ``max_chunk_bytes`` of JSON (a single larger record gets a chunk of its own).
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        chunk: List[Dict[str, Any]] = []
+        size = 0
+        for record in records:
+            record_size = len(json.dumps(record)) + 1
+            if chunk and (len(chunk) >= chunk_size or size + record_size > max_chunk_bytes):
+                yield chunk
+                chunk, size = [], 0
+            chunk.append(record)
+            size += record_size
+        if chunk:
+            yield chunk
+    
+    async def _process(
+        self,
+        path: str,
+        field: str,
+        records: Iterable[Dict[str, Any]],
+        options: Dict[str, Any],
+        batch_id: Optional[str],
+        chunk_size: int,
+        max_chunk_bytes: int,
+        concurrency: int,
+        wait: bool,
+        poll_interval: float,
+        max_poll_interval: float,
+        timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        batch_id = batch_id or f"batch_{int(time.time())}"
+        chunks: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        
+        def uploads():
+            for n, records_chunk in enumerate(self.chunk(records, chunk_size, max_chunk_bytes)):
+                chunks.append({"batch_id": f"{batch_id}-{n}", "records": len(records_chunk), "status": "pending"})
+                data = dict(options)
+                data[field] = records_chunk
+                data["batch_id"] = chunks[n]["batch_id"]
+                yield BulkRequest("POST", path, data=data)
+        
+        # Chunks are produced as uploads start, so at most ``concurrency``
+        # of them are held in memory at once
+        async for result in self.client.async_bulk_iter(uploads(), concurrency):
+            chunk = chunks[result.index]
+            if result.success:
+                submitted = result.response.data if isinstance(result.response.data, dict) else {}
+                chunk["batch_id"] = submitted.get("batch_id", chunk["batch_id"])
+                chunk["response"] = submitted
+                self._update(chunk, result.index, dict(submitted, status=submitted.get("status", "submitted")), errors)
+            else:
+                chunk["status"] = "failed"
+                errors.append({"chunk": result.index, "batch_id": chunk["batch_id"], "error": str(result.error)})
+        
+        if wait:
+            await self._wait(chunks, errors, concurrency, poll_interval, max_poll_interval, timeout)
+        
+        results: List[Any] = []
+        for chunk in chunks:
+            results.extend(chunk.pop("results", None) or [])
+        
+        statuses = {chunk["status"] for chunk in chunks}
+        if not statuses <= set(self.TERMINAL_STATUSES):
+            # Unfinished chunks keep their batch_id so the caller can resume
+            status = "timeout" if wait else "submitted"
+        elif not errors:
+            status = "completed"
+        else:
+            status = "failed" if statuses <= {"failed", "cancelled"} else "partial"
+        
+        return {
+            "batch_id": batch_id,
+            "status": status,
+            "chunks": chunks,
+            "results": results,
+            "errors": errors
+        }
+    
+    async def _wait(
+        self,
+        chunks: List[Dict[str, Any]],
+        errors: List[Dict[str, Any]],
+        concurrency: int,
+        poll_interval: float,
+        max_poll_interval: float,
+        timeout: Optional[float]
+    ) -> None:
+        """
+        Poll unfinished chunks until all are terminal or ``timeout`` passes,
+        backing off while none change. A failed poll says nothing about the
+        batch itself, so its chunk is simply polled again.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        interval = poll_interval
+        
+        while True:
+            pending = [
+                (index, chunk) for index, chunk in enumerate(chunks)
+                if chunk["status"] not in self.TERMINAL_STATUSES
+            ]
+            if not pending:
+                return
+            delay = interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                delay = min(interval, remaining)
+            await asyncio.sleep(delay)
+            
+            polls = [BulkRequest("GET", f"/api/v1/batch/status/{chunk['batch_id']}") for _, chunk in pending]
+            changed = False
+            for result in await self.client.async_bulk(polls, concurrency):
+                index, chunk = pending[result.index]
+                if not result.success:
+                    chunk["poll_error"] = str(result.error)
+                    continue
+                chunk.pop("poll_error", None)
+                status = result.response.data if isinstance(result.response.data, dict) else {}
+                if self._update(chunk, index, status, errors):
+                    changed = True
+            
+            # Poll again soon while work is moving, back off while it is not
+            interval = poll_interval if changed else min(interval * 2, max_poll_interval)
+    
+    def _update(
+        self,
+        chunk: Dict[str, Any],
+        index: int,
+        status: Dict[str, Any],
+        errors: List[Dict[str, Any]]
+    ) -> bool:
+        """Apply a submit or status response to a chunk; returns whether it changed."""
+        new_status = status.get("status", chunk["status"])
+        changed = new_status != chunk["status"] or status.get("progress") != chunk.get("progress")
+        chunk["status"] = new_status
+        chunk["progress"] = status.get("progress")
+        if new_status == "completed":
+            chunk["results"] = status.get("results", [])
+        elif new_status in self.TERMINAL_STATUSES:
+            errors.append({
+                "chunk": index,
+                "batch_id": chunk["batch_id"],
+                "error": status.get("error", f"Batch {new_status}")
+            })
+        return changed
 
 
 class IntegrationsResource:
@@ -1343,16 +1856,19 @@ test_result = await client.webhooks.test(webhook["id"])
 BATCH_EXAMPLE = """
 # Batch Processing Example
 
-# Process multiple lab results
+# Process lab results in chunked batches and wait for the results
 lab_results = [
     {"test_type": "CBC", "values": {...}},
     {"test_type": "CMP", "values": {...}},
 ]
 
-batch_result = await client.batch.process_labs(lab_results)
+batch_result = await client.batch.process_labs(lab_results, chunk_size=500)
+for error in batch_result["errors"]:
+    print(error["batch_id"], error["error"])
 
-# Check batch status
-status = await client.batch.get_status(batch_result["batch_id"])
+# Or submit without waiting and check a chunk's status later
+batch_result = await client.batch.process_labs(lab_results, wait=False)
+status = await client.batch.get_status(batch_result["chunks"][0]["batch_id"])
 """
 
 INTEGRATION_EXAMPLE = """
@@ -2,13 +2,51 @@ import sys
 import types
 
 class _Exc:
-    HTTPError = type("HTTPError", (Exception,), {})
-    ConnectionError = type("ConnectionError", (Exception,), {})
-    Timeout = type("Timeout", (Exception,), {})
     RequestException = type("RequestException", (Exception,), {})
+    HTTPError = type("HTTPError", (RequestException,), {})
+    ConnectionError = type("ConnectionError", (RequestException,), {})
+    Timeout = type("Timeout", (RequestException,), {})
+
+class _HTTPAdapter:
+    def __init__(self, pool_connections=10, pool_maxsize=10, max_retries=0, pool_block=False):
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+
+
+class _Session:
+    def __init__(self):
+        self.headers = {}
+        self.adapters = {}
+        self.closed = False
+
+    def mount(self, prefix, adapter):
+        self.adapters[prefix] = adapter
+
+    def get_adapter(self, url):
+        for prefix in sorted(self.adapters, key=len, reverse=True):
+            if url.lower().startswith(prefix.lower()):
+                return self.adapters[prefix]
+        raise _Exc.RequestException(f"No connection adapters were found for {url!r}")
+
+    def close(self):
+        self.closed = True
+
+    def request(self, *args, **kwargs):
+        return None
+
+    get = post = put = delete = request
+
 
 requests_stub = types.SimpleNamespace(
     exceptions=_Exc,
+    RequestException=_Exc.RequestException,
+    HTTPError=_Exc.HTTPError,
+    ConnectionError=_Exc.ConnectionError,
+    Timeout=_Exc.Timeout,
+    Response=type("Response", (), {}),
+    Session=_Session,
+    adapters=types.SimpleNamespace(HTTPAdapter=_HTTPAdapter),
     get=lambda *a, **k: None,
     post=lambda *a, **k: None,
     put=lambda *a, **k: None,
@@ -33,15 +33,14 @@ def test_request_get(monkeypatch):
         captured["timeout"] = timeout
         return DummyResp({"ok": True})
 
-    monkeypatch.setattr(requests, "get", fake_get, raising=False)
-
     client = BondMCPClient("KEY", base_url="http://example")
+    monkeypatch.setattr(client.session, "get", fake_get)
     resp = client.request("get", "/foo", params={"a": 1})
 
     assert resp == {"ok": True}
     assert captured["url"] == "http://example/foo"
     assert captured["params"] == {"a": 1}
-    assert captured["headers"]["X-API-Key"] == "KEY"
+    assert client.session.headers["X-API-Key"] == "KEY"
 
 
 def test_request_post(monkeypatch):
@@ -54,12 +53,11 @@ def test_request_post(monkeypatch):
         captured["timeout"] = timeout
         return DummyResp({"ok": True})
 
-    monkeypatch.setattr(requests, "post", fake_post, raising=False)
-
     client = BondMCPClient("KEY", base_url="http://example")
+    monkeypatch.setattr(client.session, "post", fake_post)
     resp = client.request("post", "/bar", data={"x": 2})
 
     assert resp == {"ok": True}
     assert captured["url"] == "http://example/bar"
     assert captured["json"] == {"x": 2}
-    assert captured["headers"]["X-API-Key"] == "KEY"
+    assert client.session.headers["X-API-Key"] == "KEY"
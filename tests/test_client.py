@@ -1,3 +1,4 @@
+import asyncio
 import json
 import sys
 from pathlib import Path
@@ -38,7 +39,7 @@ def test_request_success(monkeypatch):
         calls["url"] = url
         return DummyResponse(200, {"ok": True})
 
-    monkeypatch.setattr(bondmcp.client.requests, "get", fake_get)
+    monkeypatch.setattr(client.session, "get", fake_get)
     result = client.request("get", "/test")
     assert result == {"ok": True}
     assert calls["url"] == "https://example.com/test"
@@ -50,7 +51,7 @@ def test_request_http_error(monkeypatch):
     def fake_get(url, headers=None, params=None, timeout=None):
         return DummyResponse(404, {"error": {"message": "bad", "code": "404"}})
 
-    monkeypatch.setattr(bondmcp.client.requests, "get", fake_get)
+    monkeypatch.setattr(client.session, "get", fake_get)
     with pytest.raises(bondmcp.BondMCPAPIError) as exc:
         client.request("get", "/test")
     assert exc.value.status_code == 404
@@ -63,7 +64,7 @@ def test_request_network_error(monkeypatch):
     def fake_get(url, headers=None, params=None, timeout=None):
         raise requests.exceptions.ConnectionError
 
-    monkeypatch.setattr(bondmcp.client.requests, "get", fake_get)
+    monkeypatch.setattr(client.session, "get", fake_get)
     with pytest.raises(bondmcp.BondMCPNetworkError):
         client.request("get", "/test")
 
@@ -83,7 +84,7 @@ def test_request_retry_on_rate_limit(monkeypatch):
             return resp
         return DummyResponse(200, {"ok": True})
 
-    monkeypatch.setattr(requests, "get", fake_get, raising=False)
+    monkeypatch.setattr(client.session, "get", fake_get)
     result = client.request("get", "/test")
     assert result == {"ok": True}
     assert calls["count"] == 2
@@ -99,7 +100,76 @@ def test_request_retry_exhausts(monkeypatch):
         resp.headers = {"Retry-After": "0"}
         return resp
 
-    monkeypatch.setattr(requests, "get", fake_get, raising=False)
+    monkeypatch.setattr(client.session, "get", fake_get)
     with pytest.raises(bondmcp.BondMCPAPIError) as exc:
         client.request("get", "/test")
     assert exc.value.status_code == 429
+
+
+def test_session_is_pooled_and_closed():
+    with bondmcp.BondMCPClient(
+        "k", base_url="https://example.com", pool_maxsize=4, pool_block=True
+    ) as client:
+        session = client.session
+        assert client.session is session
+        adapter = session.get_adapter("https://example.com/test")
+        assert adapter._pool_maxsize == 4
+        assert adapter._pool_block is True
+        assert session.headers["X-API-Key"] == "k"
+    assert client._session is None
+
+
+def test_external_session_left_open():
+    session = requests.Session()
+    with bondmcp.BondMCPClient("k", session=session) as client:
+        assert client.session is session
+    assert client.session is session
+
+
+def test_async_client_resources():
+    pytest.importorskip("aiohttp")
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    received = []
+
+    async def ask(request):
+        received.append((request.headers["X-API-Key"], await request.json()))
+        if len(received) == 1:
+            return web.json_response(
+                {"error": {"message": "limit", "code": "429"}},
+                status=429,
+                headers={"Retry-After": "0"},
+            )
+        return web.json_response({"answer": "ok"})
+
+    async def api_keys(request):
+        return web.json_response(
+            {"error": {"message": "bad", "code": "not_found"}}, status=404
+        )
+
+    app = web.Application()
+    app.router.add_post("/ask", ask)
+    app.router.add_get("/api-keys", api_keys)
+
+    async def scenario():
+        server = TestServer(app)
+        await server.start_server()
+        base_url = str(server.make_url("")).rstrip("/")
+        try:
+            async with bondmcp.AsyncBondMCPClient(
+                "k", base_url=base_url, max_retries=1, retry_delay=0
+            ) as client:
+                assert await client.ask.query("q") == {"answer": "ok"}
+                with pytest.raises(bondmcp.BondMCPAPIError) as exc:
+                    await client.api_keys.list()
+                session = client.session
+            assert session.closed
+        finally:
+            await server.close()
+        return exc.value
+
+    error = asyncio.run(scenario())
+    assert received == [("k", {"query": "q"}), ("k", {"query": "q"})]
+    assert error.status_code == 404
+    assert error.code == "not_found"
@@ -0,0 +1,277 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+pytest.importorskip("aiohttp")
+
+from bondmcp_sdk import enhanced_client as ec
+
+
+class FakeClient(ec.EnhancedBondMCPClient):
+    """Client whose async_request is answered by ``handler(method, path, data)``"""
+
+    def __init__(self, handler, **kwargs):
+        super().__init__("k", **kwargs)
+        self.handler = handler
+        self.calls = []
+
+    async def async_request(self, method, path, data=None, params=None, **kwargs):
+        self.calls.append((method, path))
+        result = await self.handler(method, path, data)
+        return ec.APIResponse(data=result, status_code=200, headers={}, response_time=0.0)
+
+
+def test_bulk_caps_concurrency_and_keeps_input_order():
+    inflight = {"now": 0, "max": 0}
+
+    async def handler(method, path, data):
+        inflight["now"] += 1
+        inflight["max"] = max(inflight["max"], inflight["now"])
+        # Later items finish first
+        await asyncio.sleep(0.001 * (20 - data["n"]))
+        inflight["now"] -= 1
+        if data["n"] == 7:
+            raise ec.APIError("bad panel", 400)
+        return {"n": data["n"]}
+
+    client = FakeClient(handler)
+    requests = (ec.BulkRequest("POST", "/labs/interpret", data={"n": n}) for n in range(20))
+    results = asyncio.run(client.async_bulk(requests, concurrency=4))
+
+    assert inflight["max"] == 4
+    assert [result.index for result in results] == list(range(20))
+    failed = [result for result in results if not result.success]
+    assert [result.index for result in failed] == [7]
+    assert isinstance(failed[0].error, ec.APIError)
+    assert all(result.response.data == {"n": result.index} for result in results if result.success)
+
+
+def test_bulk_iter_reads_input_lazily():
+    pulled = []
+
+    def requests():
+        for n in range(1000):
+            pulled.append(n)
+            yield ("GET", f"/items/{n}")
+
+    async def handler(method, path, data):
+        await asyncio.sleep(0.01 * (int(path.rsplit("/", 1)[1]) + 1))
+        return {}
+
+    async def run():
+        client = FakeClient(handler)
+        results = client.async_bulk_iter(requests(), concurrency=3)
+        first = await results.__anext__()
+        await results.aclose()
+        return first
+
+    first = asyncio.run(run())
+    assert first.index == 0 and first.request == ec.BulkRequest("GET", "/items/0")
+    # Three started up front, one more when the first finished
+    assert len(pulled) == 4
+
+
+def test_bulk_interpret_and_invalid_concurrency():
+    async def handler(method, path, data):
+        return {"path": path, "data": data}
+
+    client = FakeClient(handler)
+    results = asyncio.run(
+        client.labs.async_bulk_interpret([{"glucose": 90}, {"glucose": 140}], patient_context="fasting")
+    )
+    assert [result.response.data for result in results] == [
+        {"path": "/labs/interpret", "data": {"lab_results": {"glucose": g}, "include_recommendations": True, "patient_context": "fasting"}}
+        for g in (90, 140)
+    ]
+
+    with pytest.raises(ValueError):
+        asyncio.run(client.async_bulk([("GET", "/health")], concurrency=0))
+
+
+def batch_client(handler):
+    return ec.enhance_client_with_integrations(FakeClient(handler))
+
+
+def test_batch_terminal_status_on_submit():
+    async def handler(method, path, data):
+        assert method == "POST", "terminal chunks must not be polled"
+        if data["batch_id"] == "b-0":
+            return {"status": "completed", "results": [r["n"] for r in data["lab_results"]]}
+        return {"status": "failed", "error": "boom"}
+
+    client = batch_client(handler)
+    summary = asyncio.run(
+        client.batch.process_labs([{"n": i} for i in range(4)], batch_id="b", chunk_size=2)
+    )
+    assert summary["status"] == "partial"
+    assert summary["results"] == [0, 1]
+    assert summary["errors"] == [{"chunk": 1, "batch_id": "b-1", "error": "boom"}]
+
+
+def test_batch_poll_error_is_retried():
+    polls = []
+
+    async def handler(method, path, data):
+        if method == "POST":
+            return {"batch_id": data["batch_id"], "status": "queued"}
+        polls.append(path)
+        if len(polls) == 1:
+            raise ec.APIError("unavailable", 503)
+        return {"status": "completed", "results": ["ok"]}
+
+    client = batch_client(handler)
+    summary = asyncio.run(
+        client.batch.process_labs([{"n": 1}], batch_id="b", poll_interval=0.001)
+    )
+    assert len(polls) == 2
+    assert summary["status"] == "completed"
+    assert summary["results"] == ["ok"]
+    assert summary["errors"] == []
+
+
+def test_batch_timeout_returns_resumable_summary():
+    async def handler(method, path, data):
+        if method == "POST":
+            return {"batch_id": data["batch_id"], "status": "queued"}
+        return {"status": "processing"}
+
+    client = batch_client(handler)
+    loop_time = []
+
+    async def run():
+        start = asyncio.get_running_loop().time()
+        summary = await client.batch.process_labs(
+            [{"n": i} for i in range(3)], batch_id="b", chunk_size=1,
+            poll_interval=0.05, max_poll_interval=10.0, timeout=0.2
+        )
+        loop_time.append(asyncio.get_running_loop().time() - start)
+        return summary
+
+    summary = asyncio.run(run())
+    assert summary["status"] == "timeout"
+    assert [chunk["batch_id"] for chunk in summary["chunks"]] == ["b-0", "b-1", "b-2"]
+    assert all(chunk["status"] == "processing" for chunk in summary["chunks"])
+    # The last sleep is cut short to the deadline rather than skipped or overrun
+    assert 0.2 <= loop_time[0] < 1.0
+
+
+class FakeResponse:
+    def __init__(self, status, headers=None, body=None):
+        self.status_code = status
+        self.headers = headers or {}
+        self.body = body if body is not None else {"message": f"status {status}"}
+        self.text = str(self.body)
+
+    def json(self):
+        return self.body
+
+
+def scripted_client(monkeypatch, statuses, **policy):
+    """Sync client whose session answers with ``statuses`` in turn; records sleeps and headers"""
+    client = ec.EnhancedBondMCPClient("k", retry_policy=ec.RetryPolicy(**policy))
+    responses = [status if isinstance(status, FakeResponse) else FakeResponse(status) for status in statuses]
+    sent, slept = [], []
+
+    def fake_request(**kwargs):
+        sent.append(dict(kwargs["headers"]))
+        return responses.pop(0)
+
+    monkeypatch.setattr(client.session, "request", fake_request, raising=False)
+    monkeypatch.setattr(ec.time, "sleep", slept.append)
+    return client, sent, slept
+
+
+@pytest.mark.parametrize("status, error", [(401, ec.AuthenticationError), (422, ec.ValidationError)])
+def test_retry_skips_auth_and_validation_errors(monkeypatch, status, error):
+    client, sent, slept = scripted_client(monkeypatch, [status, 200])
+    with pytest.raises(error):
+        client.request("GET", "/health")
+    assert len(sent) == 1 and slept == []
+
+
+def test_retry_after_is_honoured_up_to_max_delay(monkeypatch):
+    from email.utils import formatdate
+
+    later = formatdate(ec.time.time() + 120, usegmt=True)
+    client, sent, slept = scripted_client(
+        monkeypatch,
+        [FakeResponse(429, {"Retry-After": "2"}), FakeResponse(429, {"Retry-After": later}), 200],
+        max_delay=10.0
+    )
+    # Retrying before the API's Retry-After would only be refused again
+    with pytest.raises(ec.RateLimitError):
+        client.request("POST", "/ask", data={})
+    assert len(sent) == 2 and slept == [2.0]
+    assert ec.parse_retry_after(formatdate(ec.time.time() + 30, usegmt=True)) == pytest.approx(30, abs=2)
+    assert ec.parse_retry_after("soon") is None
+
+
+def test_post_without_key_not_retried_on_server_error(monkeypatch):
+    client, sent, slept = scripted_client(monkeypatch, [503, 200])
+    with pytest.raises(ec.APIError) as exc:
+        client.request("POST", "/ask", data={})
+    assert exc.value.status_code == 503
+    assert len(sent) == 1 and "Idempotency-Key" not in sent[0]
+
+
+def test_idempotency_key_is_stable_across_attempts(monkeypatch):
+    client, sent, slept = scripted_client(
+        monkeypatch, [503, 502, 200, 503, 200], base_delay=0, idempotency_keys=True
+    )
+    client.request("POST", "/ask", data={})
+    keys = [headers["Idempotency-Key"] for headers in sent]
+    assert len(keys) == 3 and len(set(keys)) == 1
+
+    sent.clear()
+    client.request("PUT", "/api-keys/1", data={}, idempotency_key="caller-key")
+    assert [headers["Idempotency-Key"] for headers in sent] == ["caller-key", "caller-key"]
+
+
+def test_exhausted_budget_stops_retries(monkeypatch):
+    client, sent, slept = scripted_client(
+        monkeypatch, [503, 503, 503, 503], base_delay=0, budget=ec.RetryBudget(ratio=0, capacity=1)
+    )
+    with pytest.raises(ec.APIError):
+        client.request("GET", "/health")
+    assert len(sent) == 2
+    with pytest.raises(ec.APIError):
+        client.request("GET", "/health")
+    assert len(sent) == 3
+
+
+def test_async_request_retries_with_the_same_key():
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    seen = []
+    statuses = [503, 429, 200]
+
+    async def ask(request):
+        seen.append(request.headers.get("Idempotency-Key"))
+        status = statuses.pop(0)
+        headers = {"Retry-After": "0"} if status == 429 else None
+        return web.json_response({"message": str(status)}, status=status, headers=headers)
+
+    app = web.Application()
+    app.router.add_post("/ask", ask)
+
+    async def run():
+        async with TestServer(app) as server:
+            client = ec.EnhancedBondMCPClient(
+                "k", base_url=str(server.make_url("")).rstrip("/"),
+                retry_policy=ec.RetryPolicy(base_delay=0, idempotency_keys=True)
+            )
+            try:
+                return await client.async_request("POST", "/ask", data={})
+            finally:
+                await client.aclose()
+
+    response = asyncio.run(run())
+    assert response.data == {"message": "200"}
+    assert len(seen) == 3 and len(set(seen)) == 1 and seen[0]
@@ -0,0 +1,1341 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+MCP_SERVER_DIR = ROOT / "mcp-server"
+
+if str(MCP_SERVER_DIR) not in sys.path:
+    sys.path.insert(0, str(MCP_SERVER_DIR))
+
+from jsonrpc import JSONRPCDispatcher, METHOD_NOT_FOUND, PARSE_ERROR
+from server import BondMCPServer
+from stdio_transport import StdioTransport
+
+
+class DummyWriter:
+    def __init__(self):
+        self.frames = []
+
+    def write(self, data):
+        self.frames.append(json.loads(data))
+
+    async def drain(self):
+        pass
+
+
+async def serve_lines(server, lines):
+    reader = asyncio.StreamReader()
+    for line in lines:
+        reader.feed_data((json.dumps(line) if not isinstance(line, str) else line).encode() + b"\n")
+    reader.feed_eof()
+    writer = DummyWriter()
+    await StdioTransport(JSONRPCDispatcher(server), reader, writer).serve()
+    return writer.frames
+
+
+def request(request_id, method, params=None):
+    message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+    if params is not None:
+        message["params"] = params
+    return message
+
+
+def test_stdio_initialize_and_list():
+    frames = asyncio.run(
+        serve_lines(
+            BondMCPServer(),
+            [
+                request(1, "initialize", {"protocolVersion": "2024-11-05"}),
+                {"jsonrpc": "2.0", "method": "notifications/initialized"},
+                request(2, "tools/list"),
+                request(3, "resources/list"),
+            ],
+        )
+    )
+    by_id = {frame["id"]: frame for frame in frames}
+
+    assert len(frames) == 3
+    assert by_id[1]["result"]["serverInfo"]["name"] == "bondmcp-server"
+    assert "health_question" in [t["name"] for t in by_id[2]["result"]["tools"]]
+    assert len(by_id[3]["result"]["resources"]) == 4
+
+
+def test_stdio_dispatches_requests_concurrently():
+    server = BondMCPServer()
+    release = asyncio.Event()
+    original_call_tool = server.call_tool
+
+    async def slow_call_tool(name, arguments):
+        if name == "health_question":
+            await release.wait()
+        return await original_call_tool(name, arguments)
+
+    server.call_tool = slow_call_tool
+
+    async def run():
+        reader = asyncio.StreamReader()
+        writer = DummyWriter()
+        transport = StdioTransport(JSONRPCDispatcher(server), reader, writer)
+        serving = asyncio.create_task(transport.serve())
+
+        slow = request(1, "tools/call", {"name": "health_question", "arguments": {"question": "hi"}})
+        reader.feed_data(json.dumps(slow).encode() + b"\n")
+        reader.feed_data(json.dumps(request(2, "resources/read", {"uri": "bondmcp://health/guidelines"})).encode() + b"\n")
+
+        while not writer.frames:
+            await asyncio.sleep(0)
+        release.set()
+        reader.feed_eof()
+        await serving
+        return writer.frames
+
+    frames = asyncio.run(run())
+    assert [frame["id"] for frame in frames] == [2, 1]
+    assert frames[1]["result"]["isError"] is False
+
+
+def test_stdio_protocol_errors():
+    frames = asyncio.run(
+        serve_lines(BondMCPServer(), ["{not json", request(7, "prompts/get")])
+    )
+    by_id = {frame["id"]: frame for frame in frames}
+
+    assert by_id[None]["error"]["code"] == PARSE_ERROR
+    assert by_id[7]["error"]["code"] == METHOD_NOT_FOUND
+
+
+def run_http(transport, scenario):
+    from aiohttp.test_utils import TestClient, TestServer
+
+    async def run():
+        async with TestClient(TestServer(transport.build_app())) as client:
+            return await scenario(client)
+
+    return asyncio.run(run())
+
+
+def test_http_json_and_sse_responses():
+    pytest.importorskip("aiohttp")
+    from http_transport import SESSION_HEADER, HTTPTransport
+
+    transport = HTTPTransport(JSONRPCDispatcher(BondMCPServer()))
+
+    async def scenario(client):
+        init = await client.post("/mcp", json=request(1, "initialize"))
+        session_id = init.headers[SESSION_HEADER]
+        assert (await init.json())["result"]["serverInfo"]["name"] == "bondmcp-server"
+
+        listed = await client.post(
+            "/mcp",
+            json=request(2, "tools/list"),
+            headers={SESSION_HEADER: session_id, "Accept": "application/json, text/event-stream"},
+        )
+        assert listed.headers["Content-Type"].startswith("text/event-stream")
+        body = await listed.text()
+        frame = json.loads(body.split("data: ", 1)[1])
+        assert frame["id"] == 2 and frame["result"]["tools"]
+
+        note = await client.post(
+            "/mcp",
+            json={"jsonrpc": "2.0", "method": "notifications/initialized"},
+            headers={SESSION_HEADER: session_id},
+        )
+        assert note.status == 202
+
+        unknown = await client.post(
+            "/mcp", json=request(3, "ping"), headers={SESSION_HEADER: "nope"}
+        )
+        assert unknown.status == 404
+
+        closed = await client.delete("/mcp", headers={SESSION_HEADER: session_id})
+        assert closed.status == 204
+        assert session_id not in transport.sessions
+
+    run_http(transport, scenario)
+
+
+def test_http_bounds_concurrency_and_sheds_overflow():
+    pytest.importorskip("aiohttp")
+    from http_transport import HTTPTransport
+
+    server = BondMCPServer()
+    release = asyncio.Event()
+    running = []
+
+    async def slow_call_tool(name, arguments):
+        running.append(name)
+        await release.wait()
+        return {"content": [], "isError": False}
+
+    server.call_tool = slow_call_tool
+    transport = HTTPTransport(JSONRPCDispatcher(server), max_concurrency=2, max_pending=3)
+    call = request(1, "tools/call", {"name": "health_question", "arguments": {"question": "q"}})
+
+    async def scenario(client):
+        inflight = [asyncio.create_task(client.post("/mcp", json=call)) for _ in range(3)]
+        while transport._pending < 3:
+            await asyncio.sleep(0.01)
+        assert len(running) == 2
+
+        shed = await client.post("/mcp", json=call)
+        assert shed.status == 503
+
+        release.set()
+        responses = await asyncio.gather(*inflight)
+        assert [r.status for r in responses] == [200, 200, 200]
+
+    run_http(transport, scenario)
+
+
+def test_http_session_send_never_blocks_and_idle_sessions_expire():
+    pytest.importorskip("aiohttp")
+    from http_transport import HTTPSession, HTTPTransport
+
+    async def run():
+        session = HTTPSession("s", queue_size=2)
+        notification = {"jsonrpc": "2.0", "method": "notifications/tools/list_changed"}
+        # No GET stream: dropped without queueing
+        await asyncio.wait_for(session.send(notification), 1)
+        assert session.outbound.qsize() == 0
+        # A stream that does not keep up: overflow is dropped, not awaited
+        session.listeners = 1
+        for _ in range(5):
+            await asyncio.wait_for(session.send(notification), 1)
+        return session.outbound.qsize(), session.dropped
+
+    assert asyncio.run(run()) == (2, 3)
+
+    transport = HTTPTransport(JSONRPCDispatcher(BondMCPServer()), session_ttl=60)
+    idle, active, streaming = (HTTPSession(name, 4) for name in ("idle", "active", "streaming"))
+    idle.last_active -= 120
+    streaming.last_active -= 120
+    streaming.listeners = 1
+    transport.sessions.update({s.session_id: s for s in (idle, active, streaming)})
+
+    assert transport.expire_idle_sessions() == 1
+    assert sorted(transport.sessions) == ["active", "streaming"]
+
+
+def test_catalog_is_built_once_and_versioned():
+    server = BondMCPServer()
+
+    async def run():
+        return (await server.list_tools(), await server.list_tools(), await server.get_capabilities())
+
+    first, second, capabilities = asyncio.run(run())
+    assert first is second
+    assert capabilities is server.catalog.capabilities
+    assert BondMCPServer().catalog.version == server.catalog.version
+
+    listed = json.loads(server.catalog.tools_result.data)
+    assert [t["name"] for t in listed["tools"]] == [t.name for t in first]
+    with pytest.raises(AttributeError):
+        first[0].name = "renamed"
+
+
+def test_http_catalog_etag_revalidation():
+    pytest.importorskip("aiohttp")
+    from http_transport import HTTPTransport
+
+    transport = HTTPTransport(JSONRPCDispatcher(BondMCPServer()))
+
+    async def scenario(client):
+        listed = await client.post("/mcp", json=request(1, "tools/list"))
+        etag = listed.headers["ETag"]
+        assert (await listed.json())["result"]["tools"]
+
+        cached = await client.post(
+            "/mcp", json=request(2, "tools/list"), headers={"If-None-Match": etag}
+        )
+        assert cached.status == 304
+
+    run_http(transport, scenario)
+
+
+def test_tool_registry_dispatch():
+    from server import UNKNOWN_TOOL_RESULT, MCPTool
+
+    server = BondMCPServer()
+    calls = []
+
+    async def echo(arguments):
+        calls.append(arguments)
+        return {"content": [{"type": "text", "text": arguments["text"]}], "isError": False}
+
+    version = server.catalog.version
+    server.register_tool(
+        MCPTool(name="echo", description="Echo", inputSchema={"type": "object"}), echo
+    )
+
+    async def run():
+        return (
+            await server.call_tool("echo", {"text": "hi"}),
+            await server.call_tool("missing", {}),
+            await server.list_tools(),
+        )
+
+    echoed, unknown, tools = asyncio.run(run())
+    assert echoed["content"][0]["text"] == "hi"
+    assert calls == [{"text": "hi"}]
+    assert unknown is UNKNOWN_TOOL_RESULT
+    assert tools[-1].name == "echo"
+    assert server.catalog.version != version
+    assert "echo" in server.tools and len(server.tools) == 5
+
+
+def test_tool_arguments_validated_against_schema():
+    from validation import SchemaValidationError, compile_schema
+
+    server = BondMCPServer()
+
+    async def run():
+        return (
+            await server.call_tool("health_risk_assessment", {"age": "fifty", "gender": "f"}),
+            await server.call_tool("health_question", {}),
+            await server.call_tool("nutrition_analysis", {"food_items": ["egg"], "meal_type": "brunch"}),
+            await server.call_tool("analyze_symptoms", {"symptoms": ["cough", 3]}),
+            await server.call_tool("health_risk_assessment", {"age": 40, "gender": "m"}),
+        )
+
+    bad_age, missing, bad_enum, bad_item, ok = asyncio.run(run())
+    assert bad_age["isError"] and "age: expected integer" in bad_age["content"][0]["text"]
+    assert missing["isError"] and "'question' is required" in missing["content"][0]["text"]
+    assert bad_enum["isError"] and "meal_type" in bad_enum["content"][0]["text"]
+    assert bad_item["isError"] and "symptoms[1]" in bad_item["content"][0]["text"]
+    assert ok["isError"] is False
+
+    schema = {"type": "object", "properties": {"n": {"type": "integer"}}}
+    assert compile_schema(schema) is compile_schema(dict(schema))
+    with pytest.raises(SchemaValidationError):
+        compile_schema(schema)({"n": True})
+
+
+def test_upstream_proxy_mode_reuses_pooled_connections():
+    pytest.importorskip("aiohttp")
+    from aiohttp.test_utils import TestServer
+
+    from stub_upstream import StubUpstream
+    from upstream import UpstreamClient
+
+    stub_api = StubUpstream()
+
+    async def run():
+        async with TestServer(stub_api.build_app()) as stub:
+            async with UpstreamClient(base_url=str(stub.make_url("")), api_key="KEY", pool_size=4) as upstream:
+                server = BondMCPServer(upstream=upstream)
+                answered = await server.call_tool("health_question", {"question": "Is coffee healthy?"})
+                analyzed = await server.call_tool("analyze_symptoms", {"symptoms": ["cough"]})
+                await server.call_tool("health_question", {"question": "And tea?"})
+        return answered, analyzed
+
+    answered, analyzed = asyncio.run(run())
+    method, path, body, headers = stub_api.requests[0]
+    assert (method, path, body) == ("POST", "/api/v1/ask", {"question": "Is coffee healthy?"})
+    assert headers["X-API-Key"] == "KEY"
+    assert answered == {"content": [{"type": "text", "text": "Stub consensus answer"}], "isError": False}
+    assert analyzed["content"][0]["text"] == "Stub symptom analysis"
+    assert len(stub_api.peers) == 1
+
+
+def test_upstream_failure_returns_tool_error():
+    pytest.importorskip("aiohttp")
+    from upstream import UpstreamClient
+
+    async def run():
+        async with UpstreamClient(base_url="http://127.0.0.1:9", timeout=2) as upstream:
+            return await BondMCPServer(upstream=upstream).call_tool("health_question", {"question": "q"})
+
+    result = asyncio.run(run())
+    assert result["isError"] is True
+    assert "BondMCP API request failed" in result["content"][0]["text"]
+
+
+def test_malformed_upstream_json_is_an_upstream_error():
+    pytest.importorskip("aiohttp")
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+    from upstream import UpstreamClient, UpstreamError
+
+    async def garbage(request):
+        return web.Response(text="<html>Bad gateway</html>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", garbage)
+
+    async def run():
+        async with TestServer(app) as stub:
+            async with UpstreamClient(base_url=str(stub.make_url("")).rstrip("/")) as upstream:
+                errors = []
+                for call in (upstream.request("POST", "/x", json={}), upstream.conditional_get("/y")):
+                    with pytest.raises(UpstreamError) as exc:
+                        await call
+                    errors.append(str(exc.value))
+                breakers = [upstream.breakers.get(path) for path in ("/x", "/y")]
+                result = await BondMCPServer(upstream=upstream).call_tool("analyze_symptoms", {"symptoms": ["cough"]})
+        return errors, breakers, result
+
+    errors, breakers, result = asyncio.run(run())
+    assert all(error.startswith("Malformed upstream response") for error in errors)
+    assert [(b.failures, b._probing) for b in breakers] == [(1, False), (1, False)]
+    assert result["isError"] is True
+
+
+def test_identical_inflight_calls_are_coalesced():
+    server = BondMCPServer()
+    release = asyncio.Event()
+    executions = []
+
+    async def slow_question(arguments):
+        executions.append(arguments)
+        await release.wait()
+        return {"content": [{"type": "text", "text": "answer"}], "isError": False}
+
+    from server import MCPTool
+
+    server.register_tool(
+        MCPTool(name="slow", description="Slow", inputSchema={"type": "object"}), slow_question
+    )
+
+    async def run():
+        calls = [
+            asyncio.create_task(server.call_tool("slow", {"a": 1, "b": 2})),
+            asyncio.create_task(server.call_tool("slow", {"b": 2, "a": 1})),
+            asyncio.create_task(server.call_tool("slow", {"a": 1, "b": 2})),
+            asyncio.create_task(server.call_tool("slow", {"a": 2})),
+        ]
+        while len(executions) < 2:
+            await asyncio.sleep(0)
+        # A cancelled duplicate must not take the shared call down with it
+        calls[2].cancel()
+        release.set()
+        return await asyncio.gather(*calls, return_exceptions=True)
+
+    first, second, cancelled, other = asyncio.run(run())
+    assert first is second and first["content"][0]["text"] == "answer"
+    assert isinstance(cancelled, asyncio.CancelledError)
+    assert other["isError"] is False
+    assert len(executions) == 2
+    assert server.coalescer.stats() == {"inflight": 0, "executed": 2, "coalesced": 2}
+
+
+def test_concurrent_resource_reads_are_coalesced():
+    server = BondMCPServer()
+
+    async def run():
+        uri = "bondmcp://health/medications"
+        return await asyncio.gather(*(server.get_resource(uri) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert all(result == results[0] for result in results)
+    assert server.coalescer.stats()["coalesced"] == 4
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_resource_cache_ttl_and_lru():
+    from cache import ResourceCache
+
+    clock = FakeClock()
+    cache = ResourceCache(max_entries=2, ttl=10, clock=clock)
+    server = BondMCPServer(resource_cache=cache)
+
+    async def read(uri):
+        return await server.get_resource(uri)
+
+    guidelines = "bondmcp://health/guidelines"
+    first = asyncio.run(read(guidelines))
+    assert json.loads(first["contents"][0]["text"])["type"] == "health_guidelines"
+    asyncio.run(read(guidelines))
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    clock.now = 11
+    asyncio.run(read(guidelines))
+    assert cache.stats()["misses"] == 2
+
+    asyncio.run(read("bondmcp://health/conditions"))
+    asyncio.run(read("bondmcp://health/medications"))
+    assert cache.get(guidelines) is None
+    assert cache.stats()["evictions"] == 1
+
+    missing = asyncio.run(read("bondmcp://health/unknown"))
+    assert "Resource not found" in missing["contents"][0]["text"]
+    assert len(cache) == 2
+    assert asyncio.run(read("https://example.com")) == {"error": "Invalid URI scheme"}
+
+
+def test_resource_revalidation_and_subscriptions():
+    pytest.importorskip("aiohttp")
+    from aiohttp.test_utils import TestServer
+
+    from cache import ResourceCache
+    from stub_upstream import StubUpstream
+    from upstream import UpstreamClient
+
+    clock = FakeClock()
+    stub_api = StubUpstream()
+    uri = "bondmcp://health/medications"
+
+    class Session:
+        def __init__(self):
+            self.sent = []
+
+        async def send(self, payload):
+            self.sent.append(payload)
+
+    async def run():
+        async with TestServer(stub_api.build_app()) as stub:
+            async with UpstreamClient(base_url=str(stub.make_url(""))) as upstream:
+                cache = ResourceCache(ttl=10, clock=clock)
+                server = BondMCPServer(upstream=upstream, resource_cache=cache)
+                dispatcher = JSONRPCDispatcher(server)
+                session = Session()
+                subscribed = await dispatcher.handle(
+                    request(1, "resources/subscribe", {"uri": uri}), session
+                )
+                assert subscribed["result"] == {}
+
+                first = await server.get_resource(uri)
+                clock.now = 11
+                await server.get_resource(uri)
+                assert cache.stats()["revalidations"] == 1
+
+                stub_api.resources["medications"]["data"] = "updated"
+                clock.now = 22
+                updated = await server.get_resource(uri)
+                await asyncio.sleep(0)
+
+                await server.invalidate_resource(uri)
+                return first, updated, session.sent
+
+    first, updated, sent = asyncio.run(run())
+    assert "Stub medications data" in first["contents"][0]["text"]
+    assert "updated" in updated["contents"][0]["text"]
+    conditional = [r for r in stub_api.requests if "If-None-Match" in r[3]]
+    assert len(conditional) == 2
+    assert [n["method"] for n in sent] == ["notifications/resources/updated"] * 2
+    assert sent[0]["params"] == {"uri": uri}
+
+
+def test_tool_deadline_times_out_and_propagates_upstream():
+    pytest.importorskip("aiohttp")
+    from aiohttp.test_utils import TestServer
+
+    from deadlines import DEADLINE_HEADER
+    from stub_upstream import StubUpstream
+    from upstream import UpstreamClient
+
+    stub_api = StubUpstream()
+
+    async def run():
+        async with TestServer(stub_api.build_app()) as stub:
+            async with UpstreamClient(base_url=str(stub.make_url(""))) as upstream:
+                server = BondMCPServer(upstream=upstream, tool_timeout=5)
+                answered = await server.call_tool("health_question", {"question": "fast"})
+                stub_api.latency = 1
+                server.tool_timeout = 0.1
+                expired = await server.call_tool("health_question", {"question": "slow"})
+                return answered, expired
+
+    answered, expired = asyncio.run(run())
+    assert answered["isError"] is False
+    assert 0 < int(stub_api.requests[0][3][DEADLINE_HEADER]) <= 5000
+    assert expired["isError"] is True
+    assert "timed out after 0.1s" in expired["content"][0]["text"]
+
+
+def test_cancelled_notification_cancels_running_call():
+    server = BondMCPServer()
+    cancelled = asyncio.Event()
+
+    async def hang(arguments):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    from server import MCPTool
+
+    server.register_tool(MCPTool(name="hang", description="Hang", inputSchema={"type": "object"}), hang)
+
+    async def run():
+        reader = asyncio.StreamReader()
+        writer = DummyWriter()
+        serving = asyncio.create_task(
+            StdioTransport(JSONRPCDispatcher(server), reader, writer).serve()
+        )
+        call = request("call-1", "tools/call", {"name": "hang", "arguments": {}})
+        reader.feed_data(json.dumps(call).encode() + b"\n")
+        await asyncio.sleep(0.01)
+        cancel = {
+            "jsonrpc": "2.0",
+            "method": "notifications/cancelled",
+            "params": {"requestId": "call-1", "reason": "user aborted"},
+        }
+        reader.feed_data(json.dumps(cancel).encode() + b"\n")
+        reader.feed_data(json.dumps(request(2, "ping")).encode() + b"\n")
+        reader.feed_eof()
+        await asyncio.wait_for(serving, 1)
+        return writer.frames
+
+    frames = asyncio.run(run())
+    assert cancelled.is_set()
+    assert [frame["id"] for frame in frames] == [2]
+
+
+def test_metrics_record_calls_without_arguments():
+    from metrics import MetricsServer
+
+    server = BondMCPServer()
+    secret = "patient has condition XYZ-123"
+
+    async def run():
+        await serve_lines(
+            server,
+            [
+                request(1, "tools/call", {"name": "health_question", "arguments": {"question": secret}}),
+                request(2, "tools/call", {"name": "missing", "arguments": {}}),
+                request(3, "resources/read", {"uri": "bondmcp://health/guidelines"}),
+                request(4, "resources/read", {"uri": "bondmcp://health/guidelines"}),
+            ],
+        )
+        metrics_server = MetricsServer(server.metrics.registry, port=0)
+        await metrics_server.start()
+        port = metrics_server._server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            scraped = await reader.read()
+            writer.close()
+        finally:
+            await metrics_server.stop()
+        return scraped.decode()
+
+    scraped = asyncio.run(run())
+    head, body = scraped.split("\r\n\r\n", 1)
+
+    assert head.startswith("HTTP/1.1 200")
+    assert 'bondmcp_tool_calls_total{tool="health_question"} 1' in body
+    assert 'bondmcp_tool_duration_seconds_bucket{tool="health_question",le="+Inf"} 1' in body
+    assert "bondmcp_unknown_tool_calls_total 1" in body
+    assert 'bondmcp_resource_reads_total{resource="bondmcp://health/guidelines"} 2' in body
+    assert "bondmcp_resource_cache_entries 1" in body
+    assert 'bondmcp_transport_requests_total{transport="stdio"} 4' in body
+    assert secret not in body
+
+
+def test_streaming_handler_sends_progress_before_result():
+    server = BondMCPServer()
+
+    async def countdown(arguments):
+        for n in range(arguments["n"], 0, -1):
+            yield {"type": "text", "text": str(n)}
+
+    from server import MCPTool
+
+    server.register_tool(MCPTool(name="countdown", description="Count down", inputSchema={"type": "object"}), countdown)
+    call = request(1, "tools/call", {"name": "countdown", "arguments": {"n": 2}, "_meta": {"progressToken": "tok"}})
+    frames = asyncio.run(serve_lines(server, [call, request(2, "tools/call", {"name": "countdown", "arguments": {"n": 1}})]))
+
+    progress = [frame["params"] for frame in frames if frame.get("method") == "notifications/progress"]
+    by_id = {frame["id"]: frame for frame in frames if "id" in frame}
+    assert [(p["progressToken"], p["progress"], p["message"]) for p in progress] == [("tok", 1, "2"), ("tok", 2, "1")]
+    assert frames.index(by_id[1]) > 1
+    assert by_id[1]["result"] == {"content": [{"type": "text", "text": "2"}, {"type": "text", "text": "1"}], "isError": False}
+    assert by_id[2]["result"]["content"] == [{"type": "text", "text": "1"}]
+
+
+def stream_config(tmp_path, endpoint):
+    """Default config with health_question streaming from ``endpoint``"""
+    from server import DEFAULT_CONFIG_PATH
+
+    config = json.loads(Path(DEFAULT_CONFIG_PATH).read_text())
+    for tool in config["tools"]:
+        if tool["name"] == "health_question":
+            tool["streamEndpoint"] = endpoint
+    path = tmp_path / "mcp-config.json"
+    path.write_text(json.dumps(config))
+    return str(path)
+
+
+def test_upstream_models_stream_ahead_of_consensus(tmp_path):
+    pytest.importorskip("aiohttp")
+    from aiohttp.test_utils import TestServer
+
+    from stub_upstream import STUB_MODELS, StubUpstream
+    from upstream import UpstreamClient
+
+    chunks = []
+    stub_api = StubUpstream()
+
+    async def progress(chunk):
+        chunks.append(chunk["text"])
+
+    async def run():
+        async with TestServer(stub_api.build_app()) as stub:
+            async with UpstreamClient(base_url=str(stub.make_url(""))) as upstream:
+                server = BondMCPServer(upstream=upstream, config_path=stream_config(tmp_path, "/api/v1/ask/stream"))
+                return await server.call_tool("health_question", {"question": "q"}, progress)
+
+    result = asyncio.run(run())
+    assert chunks == [f"[{model}] Stub answer from {model}" for model in STUB_MODELS]
+    assert result == {"content": [{"type": "text", "text": "Stub consensus answer"}], "isError": False}
+    assert [path for _, path, _, _ in stub_api.requests] == ["/api/v1/ask/stream"]
+
+
+def test_http_plain_json_progress_without_listener_does_not_block():
+    pytest.importorskip("aiohttp")
+    from http_transport import SESSION_HEADER, HTTPTransport
+    from server import MCPTool
+
+    server = BondMCPServer()
+
+    async def countdown(arguments):
+        for n in range(arguments["n"], 0, -1):
+            yield {"type": "text", "text": str(n)}
+
+    server.register_tool(MCPTool(name="countdown", description="Count down", inputSchema={"type": "object"}), countdown)
+    transport = HTTPTransport(JSONRPCDispatcher(server), session_queue_size=1)
+
+    async def scenario(client):
+        init = await client.post("/mcp", json=request(1, "initialize"))
+        headers = {SESSION_HEADER: init.headers[SESSION_HEADER]}
+        call = request(2, "tools/call", {"name": "countdown", "arguments": {"n": 3}, "_meta": {"progressToken": "tok"}})
+        results = []
+        for _ in range(3):
+            response = await asyncio.wait_for(client.post("/mcp", json=call, headers=headers), 5)
+            results.append((await response.json())["result"])
+        return results, transport.sessions[headers[SESSION_HEADER]].outbound.qsize()
+
+    results, queued = run_http(transport, scenario)
+    assert all(not result["isError"] and len(result["content"]) == 3 for result in results)
+    assert queued == 0
+
+
+def test_aggregate_metrics_sums_worker_pages():
+    from metrics import ServerMetrics
+    from supervisor import aggregate_metrics
+
+    first, second = ServerMetrics(), ServerMetrics()
+    first.for_tool("health_question").calls.inc()
+    first.for_tool("health_question").duration.observe(0.002)
+    second.for_tool("health_question").calls.inc(2)
+    second.for_tool("analyze_symptoms").calls.inc()
+    second.tools_in_flight.inc()
+
+    page = aggregate_metrics([first.registry.render(), second.registry.render()])
+    lines = page.splitlines()
+
+    assert 'bondmcp_tool_calls_total{tool="health_question"} 3' in lines
+    assert 'bondmcp_tool_calls_total{tool="analyze_symptoms"} 1' in lines
+    assert 'bondmcp_tool_duration_seconds_count{tool="health_question"} 1' in lines
+    assert "bondmcp_tool_calls_in_flight 1" in lines
+    assert lines.count("# TYPE bondmcp_tool_calls_total counter") == 1
+    # Samples stay grouped under their family's TYPE line
+    type_line = lines.index("# TYPE bondmcp_tool_calls_total counter")
+    assert lines[type_line + 2] == 'bondmcp_tool_calls_total{tool="analyze_symptoms"} 1'
+
+
+def test_supervisor_shares_port_and_restarts_workers():
+    pytest.importorskip("aiohttp")
+    import socket
+
+    if not hasattr(socket, "SO_REUSEPORT"):
+        pytest.skip("SO_REUSEPORT not available")
+    import aiohttp
+
+    from supervisor import Supervisor
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    async def initialize(url):
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(force_close=True)) as client:
+            async with client.post(url, json=request(1, "initialize", {})) as response:
+                return (await response.json())["result"]["serverInfo"]["name"]
+
+    async def run():
+        supervisor = Supervisor(2, port=port, drain_timeout=5)
+        url = f"http://127.0.0.1:{port}/mcp"
+        await supervisor.start()
+        try:
+            before = [worker.pid for worker in supervisor.workers]
+            names = await asyncio.gather(*(initialize(url) for _ in range(4)))
+            await supervisor.rolling_restart()
+            after = [worker.pid for worker in supervisor.workers]
+            names.append(await initialize(url))
+        finally:
+            await supervisor.stop()
+        return before, after, names
+
+    before, after, names = asyncio.run(run())
+    assert len(set(before)) == 2
+    assert not set(before) & set(after)
+    assert names == ["bondmcp-server"] * 5
+
+
+def test_startup_path_defers_unneeded_work():
+    import subprocess
+
+    probe = (
+        "import logging, sys\n"
+        "import server, stdio_transport\n"
+        "s = server.BondMCPServer()\n"
+        "assert not logging.getLogger().handlers, 'logging configured at import'\n"
+        "assert s._catalog is None, 'catalog built eagerly'\n"
+        "assert s._template_routes is None, 'URI templates compiled eagerly'\n"
+        "for name in ('hashlib', 'urllib.parse', 'aiohttp', 'http_transport', 'upstream', 'argparse',\n"
+        "             'cache', 'coalescing', 'scheduling', 'validation'):\n"
+        "    assert name not in sys.modules, name + ' imported eagerly'\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe], cwd=MCP_SERVER_DIR, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_circuit_breaker_state_machine():
+    from circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.state == CLOSED and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN and not breaker.allow()
+    assert breaker.retry_after() == 10
+
+    clock.now = 10
+    assert breaker.allow() and breaker.state == HALF_OPEN
+    assert not breaker.allow()  # one probe at a time
+    breaker.record_failure()
+    assert breaker.state == OPEN and not breaker.allow()
+
+    clock.now = 20
+    assert breaker.allow()
+    breaker.release()  # probe cancelled by its caller: another may go
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.failures == 0
+
+
+def test_open_circuit_fails_fast_with_last_good_fallback():
+    pytest.importorskip("aiohttp")
+    from aiohttp.test_utils import TestServer
+
+    from circuit import CircuitBreakers
+    from stub_upstream import StubUpstream
+    from upstream import UpstreamClient
+
+    clock = FakeClock()
+    stub_api = StubUpstream()
+
+    async def run():
+        async with TestServer(stub_api.build_app()) as stub:
+            breakers = CircuitBreakers(failure_threshold=2, reset_timeout=10, clock=clock)
+            async with UpstreamClient(base_url=str(stub.make_url("")), breakers=breakers) as upstream:
+                server = BondMCPServer(upstream=upstream)
+                ask = lambda question: server.call_tool("health_question", {"question": question})
+                results = {"good": await ask("known")}
+                stub_api.fail_status = 503
+                results["fallback"] = await ask("known")
+                results["failed"] = await ask("new")
+                sent = len(stub_api.requests)
+                results["fast"] = await ask("new")
+                results["fast_fallback"] = await ask("known")
+                results["short_circuited"] = len(stub_api.requests) - sent
+                stub_api.fail_status = 0
+                clock.now = 10
+                results["probe"] = await ask("new")
+                results["state"] = breakers.states()
+                results["metrics"] = server.metrics.registry.render()
+                return results
+
+    results = asyncio.run(run())
+    assert results["good"]["isError"] is False
+    assert results["fallback"]["content"] == results["good"]["content"]
+    assert results["fallback"]["_meta"] == {"bondmcp/fallback": "last-good"}
+    assert results["failed"]["isError"] is True
+    assert results["short_circuited"] == 0
+    assert results["fast"]["isError"] is True
+    assert results["fast"]["_meta"]["bondmcp/circuit"]["state"] == "open"
+    assert results["fast_fallback"]["content"] == results["good"]["content"]
+    assert results["probe"]["isError"] is False
+    assert results["state"] == {"/api/v1/ask": "closed"}
+    assert "bondmcp_upstream_rejected_total 2" in results["metrics"]
+
+
+def test_fair_scheduler_shares_capacity_between_sessions():
+    from scheduling import FairScheduler, Shed
+
+    class Session:
+        pass
+
+    noisy, quiet, vip = Session(), Session(), Session()
+    scheduler = FairScheduler(concurrency=1, session_queue=3, client_weights={"vip": 2})
+    scheduler.identify(vip, "vip")
+    order = []
+
+    async def call(session, label):
+        await scheduler.acquire(session)
+        order.append(label)
+        await asyncio.sleep(0)
+        scheduler.release()
+
+    async def run():
+        calls = [asyncio.create_task(call(noisy, f"n{i}")) for i in range(4)]
+        await asyncio.sleep(0)
+        with pytest.raises(Shed) as shed:
+            await scheduler.acquire(noisy)
+        assert shed.value.reason == "session_queue"
+        calls += [asyncio.create_task(call(quiet, "q")), asyncio.create_task(call(vip, "v0")), asyncio.create_task(call(vip, "v1"))]
+        await asyncio.gather(*calls)
+
+    asyncio.run(run())
+    # The quiet session and the weight-2 session overtake the noisy backlog
+    assert order == ["n0", "n1", "q", "v0", "v1", "n2", "n3"]
+    assert scheduler.running == 0 and scheduler.waiting == 0
+
+
+def test_session_rate_limit_sheds_with_retry_hint():
+    from scheduling import FairScheduler
+
+    clock = FakeClock()
+    server = BondMCPServer(scheduler=FairScheduler(session_rate=1, session_burst=2, clock=clock))
+
+    class Session:
+        async def send(self, payload):
+            pass
+
+    noisy, quiet = Session(), Session()
+    dispatcher = JSONRPCDispatcher(server)
+    call = request(1, "tools/call", {"name": "analyze_symptoms", "arguments": {"symptoms": ["cough"]}})
+
+    async def run():
+        results = [(await dispatcher.handle(call, noisy))["result"] for _ in range(3)]
+        results.append((await dispatcher.handle(call, quiet))["result"])
+        clock.now = 1.0
+        results.append((await dispatcher.handle(call, noisy))["result"])
+        return results
+
+    results = asyncio.run(run())
+    assert [r["isError"] for r in results] == [False, False, True, False, False]
+    assert results[2]["_meta"]["bondmcp/shed"] == {"reason": "session_rate", "retryAfter": 1.0}
+    assert 'bondmcp_requests_shed_total{reason="session_rate"} 1' in server.metrics.registry.render()
+
+
+def test_batch_requests_run_in_parallel():
+    from server import MCPTool
+
+    server = BondMCPServer()
+    both_started = asyncio.Event()
+    started = []
+
+    async def rendezvous(arguments):
+        started.append(arguments["n"])
+        if len(started) == 2:
+            both_started.set()
+        # Deadlocks unless both batch members run at once
+        await asyncio.wait_for(both_started.wait(), 1)
+        return {"content": [{"type": "text", "text": str(arguments["n"])}], "isError": False}
+
+    server.register_tool(MCPTool("rendezvous", "test", {"type": "object"}), rendezvous, coalesce=False)
+    batch = [
+        request(1, "tools/call", {"name": "rendezvous", "arguments": {"n": 1}}),
+        request(2, "tools/call", {"name": "rendezvous", "arguments": {"n": 2}}),
+        request(3, "resources/read", {"uri": "bondmcp://health/guidelines"}),
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        "bogus",
+    ]
+    frames = asyncio.run(serve_lines(server, [batch, [], [batch[3]]]))
+
+    # Lines are handled concurrently, so frames arrive in completion order
+    assert len(frames) == 2
+    responses = next(frame for frame in frames if isinstance(frame, list))
+    empty = next(frame for frame in frames if isinstance(frame, dict))
+    assert [r.get("id") for r in responses] == [1, 2, 3, None]
+    assert [r["result"]["content"][0]["text"] for r in responses[:2]] == ["1", "2"]
+    assert responses[2]["result"]["contents"][0]["uri"] == "bondmcp://health/guidelines"
+    assert responses[3]["error"]["code"] == -32600
+    assert empty["error"]["code"] == -32600
+
+
+def test_http_batch_returns_one_array():
+    pytest.importorskip("aiohttp")
+    from http_transport import HTTPTransport
+
+    transport = HTTPTransport(JSONRPCDispatcher(BondMCPServer()))
+    uris = ["bondmcp://health/guidelines", "bondmcp://health/nutrition"]
+
+    async def scenario(client):
+        response = await client.post(
+            "/mcp", json=[request(i, "resources/read", {"uri": uri}) for i, uri in enumerate(uris)]
+        )
+        return await response.json()
+
+    body = run_http(transport, scenario)
+    assert [item["result"]["contents"][0]["uri"] for item in body] == uris
+
+
+def test_config_hot_reload_swaps_catalog_and_notifies(tmp_path):
+    from server import DEFAULT_CONFIG_PATH
+
+    config = json.loads(Path(DEFAULT_CONFIG_PATH).read_text())
+    path = tmp_path / "mcp-config.json"
+    path.write_text(json.dumps(config))
+    server = BondMCPServer(config_path=str(path))
+    assert server.catalog.version == BondMCPServer().catalog.version
+
+    class Session:
+        def __init__(self):
+            self.sent = []
+
+        async def send(self, payload):
+            self.sent.append(payload["method"])
+
+    session = Session()
+    dispatcher = JSONRPCDispatcher(server)
+
+    async def run():
+        await dispatcher.handle(request(1, "initialize", {"clientInfo": {"name": "agent"}}), session)
+        before = server.catalog
+        config["tools"].append({
+            "name": "drug_interactions",
+            "description": "Check medication interactions",
+            "inputSchema": {"type": "object", "properties": {"drugs": {"type": "array"}}},
+            "endpoint": "/api/v1/medications/interactions",
+        })
+        del config["tools"][0]
+        path.write_text(json.dumps(config))
+        watcher = asyncio.ensure_future(server.watch_config(0.01))
+        try:
+            while not session.sent:
+                await asyncio.sleep(0.01)
+        finally:
+            watcher.cancel()
+        called = await server.call_tool("drug_interactions", {"drugs": ["a", "b"]})
+        removed = await server.call_tool("health_question", {"question": "q"})
+
+        path.write_text("{broken")
+        kept = await server.reload_config()
+        return before, called, removed, kept
+
+    before, called, removed, kept = asyncio.run(run())
+    assert session.sent == ["notifications/tools/list_changed"]
+    assert server.catalog is not before and server.catalog.version != before.version
+    assert [tool.name for tool in server.catalog.tools] == [
+        "analyze_symptoms", "nutrition_analysis", "health_risk_assessment", "drug_interactions"
+    ]
+    assert "/api/v1/medications/interactions" in called["content"][0]["text"]
+    assert removed["isError"] is True
+    assert kept is False and "drug_interactions" in server.tools
+
+
+def test_config_reload_not_held_up_by_unread_session(tmp_path):
+    from server import DEFAULT_CONFIG_PATH
+
+    config = json.loads(Path(DEFAULT_CONFIG_PATH).read_text())
+    path = tmp_path / "mcp-config.json"
+    path.write_text(json.dumps(config))
+    server = BondMCPServer(config_path=str(path))
+
+    class StuckSession:
+        async def send(self, payload):
+            await asyncio.Event().wait()
+
+    session = StuckSession()
+    dispatcher = JSONRPCDispatcher(server)
+
+    async def run():
+        await dispatcher.handle(request(1, "initialize"), session)
+        changed = []
+        for n in range(5):
+            config["tools"][0]["description"] = f"revision {n}"
+            path.write_text(json.dumps(config))
+            changed.append(await asyncio.wait_for(server.reload_config(), 1))
+        return changed
+
+    assert asyncio.run(run()) == [True] * 5
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_serialization_backends_are_interchangeable(backend):
+    import serialization
+    from jsonrpc import encode_message
+
+    if serialization.BACKENDS[backend] is None:
+        pytest.skip(f"{backend} not installed")
+    payload = {"jsonrpc": "2.0", "id": 1, "result": {"text": "café", "big": 2 ** 70, "items": [1.5, None]}}
+    try:
+        serialization.use(backend)
+        encoded = encode_message(payload)
+        frames = asyncio.run(serve_lines(BondMCPServer(), [request(2, "resources/read", {"uri": "bondmcp://health/nutrition"})]))
+    finally:
+        serialization.use("auto")
+
+    assert json.loads(encoded) == payload
+    assert b" " not in encoded and b"\n" not in encoded
+    text = frames[0]["result"]["contents"][0]["text"]
+    assert json.loads(text)["type"] == "nutrition" and "\n" not in text
+
+
+def test_resources_list_is_paginated_and_templates_listed():
+    server = BondMCPServer(resource_page_size=3)
+    dispatcher = JSONRPCDispatcher(server)
+
+    async def run():
+        first = await dispatcher.handle(request(1, "resources/list"))
+        cursor = json.loads(first["result"].data)["nextCursor"]
+        second = await dispatcher.handle(request(2, "resources/list", {"cursor": cursor}))
+        stale = await dispatcher.handle(request(3, "resources/list", {"cursor": "old:1"}))
+        templates = await dispatcher.handle(request(4, "resources/templates/list"))
+        return first, second, stale, templates
+
+    first, second, stale, templates = asyncio.run(run())
+    first_page, second_page = json.loads(first["result"].data), json.loads(second["result"].data)
+    assert len(first_page["resources"]) == 3 and "nextCursor" not in second_page
+    assert [r["uri"] for r in first_page["resources"] + second_page["resources"]] == [
+        r.uri for r in server.catalog.resources
+    ]
+    assert first["result"].etag != second["result"].etag
+    assert stale["error"]["code"] == -32602
+    listed = json.loads(templates["result"].data)["resourceTemplates"]
+    assert "bondmcp://health/medications/{id}" in [t["uriTemplate"] for t in listed]
+
+
+def test_resource_templates_and_cursor_reads_fetch_one_page():
+    pytest.importorskip("aiohttp")
+    from aiohttp.test_utils import TestServer
+
+    from stub_upstream import StubUpstream
+    from upstream import UpstreamClient
+
+    stub_api = StubUpstream()
+
+    async def run():
+        async with TestServer(stub_api.build_app()) as stub:
+            async with UpstreamClient(base_url=str(stub.make_url(""))) as upstream:
+                server = BondMCPServer(upstream=upstream)
+                read = lambda uri: server.get_resource(uri)
+                item = await read("bondmcp://health/medications/medications-3")
+                first = await read("bondmcp://health/medications")
+                cursor = json.loads(first["contents"][0]["text"])["nextCursor"]
+                second = await read(f"bondmcp://health/medications?cursor={cursor}")
+                missing = await read("bondmcp://health/medications/nope")
+                return item, first, second, missing, server.metrics.registry.render()
+
+    item, first, second, missing, metrics = asyncio.run(run())
+    assert json.loads(item["contents"][0]["text"])["id"] == "medications-3"
+    assert [i["id"] for i in json.loads(first["contents"][0]["text"])["items"]] == ["medications-0", "medications-1"]
+    assert [i["id"] for i in json.loads(second["contents"][0]["text"])["items"]] == ["medications-2", "medications-3"]
+    assert "Resource not found" in missing["contents"][0]["text"]
+    assert [r[1] for r in stub_api.requests] == [
+        "/api/v1/resources/medications/medications-3",
+        "/api/v1/resources/medications",
+        "/api/v1/resources/medications?cursor=2",
+        "/api/v1/resources/medications/nope",
+    ]
+    assert 'resource="bondmcp://health/medications/{id}"' in metrics
+
+
+def test_resource_template_in_development_mode():
+    result = asyncio.run(BondMCPServer().get_resource("bondmcp://health/conditions/asthma"))
+    body = json.loads(result["contents"][0]["text"])
+    assert body["id"] == "asthma" and "[DEVELOPMENT MODE]" in body["data"]
+
+
+def test_http_sse_request_shed_before_stream_opens():
+    pytest.importorskip("aiohttp")
+    from http_transport import HTTPTransport
+
+    server = BondMCPServer()
+    release = asyncio.Event()
+
+    async def slow_call_tool(name, arguments):
+        await release.wait()
+        return {"content": [], "isError": False}
+
+    server.call_tool = slow_call_tool
+    transport = HTTPTransport(JSONRPCDispatcher(server), max_concurrency=1, max_pending=1)
+    call = request(1, "tools/call", {"name": "health_question", "arguments": {"question": "q"}})
+    sse = {"Accept": "application/json, text/event-stream"}
+
+    async def scenario(client):
+        running = asyncio.create_task(client.post("/mcp", json=call, headers=sse))
+        while transport._pending < 1:
+            await asyncio.sleep(0.01)
+
+        shed = await client.post("/mcp", json=call, headers=sse)
+        assert shed.status == 503 and shed.headers["Retry-After"] == "1"
+
+        release.set()
+        response = await running
+        assert response.status == 200
+        frame = json.loads((await response.text()).split("data: ", 1)[1])
+        assert frame["result"]["isError"] is False
+
+    run_http(transport, scenario)
+    assert transport._pending == 0
+
+
+@pytest.mark.parametrize("endpoint", ["/api/v1/missing", "/api/v1/symptoms"])
+def test_stream_endpoint_falls_back_to_plain_endpoint(tmp_path, caplog, endpoint):
+    pytest.importorskip("aiohttp")
+    from aiohttp.test_utils import TestServer
+
+    from stub_upstream import StubUpstream
+    from upstream import UpstreamClient
+
+    stub_api = StubUpstream()
+    chunks = []
+
+    async def progress(chunk):
+        chunks.append(chunk)
+
+    async def run():
+        async with TestServer(stub_api.build_app()) as stub:
+            async with UpstreamClient(base_url=str(stub.make_url(""))) as upstream:
+                # A 404, or a plain JSON reply, means the endpoint does not stream
+                server = BondMCPServer(upstream=upstream, config_path=stream_config(tmp_path, endpoint))
+                return [await server.call_tool("health_question", {"question": "q"}, progress) for _ in range(2)]
+
+    results = asyncio.run(run())
+    assert results == [{"content": [{"type": "text", "text": "Stub consensus answer"}], "isError": False}] * 2
+    assert chunks == []
+    assert [path for _, path, _, _ in stub_api.requests][-2:] == ["/api/v1/ask", "/api/v1/ask"]
+    # Only the first call tries the stream endpoint
+    assert len([r for r in caplog.records if "does not stream" in r.getMessage()]) == 1
+
+
+def test_supervisor_cleans_up_failed_start_and_drains_worker_output(tmp_path):
+    from server import READY_LINE
+    from supervisor import Supervisor
+
+    marker = tmp_path / "wrote-everything"
+    # Reports ready, then prints far more than a pipe buffer holds
+    chatty = (
+        f"import sys, time\nprint({READY_LINE!r}, flush=True)\n"
+        f"sys.stdout.write('x' * 1000000); sys.stdout.flush()\n"
+        f"open({str(marker)!r}, 'w').close()\ntime.sleep(60)\n"
+    )
+
+    class ScriptedSupervisor(Supervisor):
+        def __init__(self, scripts, **kwargs):
+            super().__init__(len(scripts), **kwargs)
+            self.scripts = list(scripts)
+
+        def _command(self, metrics_port):
+            return [sys.executable, "-c", self.scripts.pop(0)]
+
+    async def failed_start():
+        supervisor = ScriptedSupervisor([chatty, "raise SystemExit(1)"], ready_timeout=5)
+        with pytest.raises(RuntimeError):
+            await supervisor.start()
+        return [worker.process.returncode for worker in supervisor.workers if worker is not None]
+
+    # The worker that did start is stopped rather than left running
+    codes = asyncio.run(failed_start())
+    assert len(codes) == 1 and codes[0] is not None
+
+    async def chatty_worker():
+        marker.unlink(missing_ok=True)
+        supervisor = ScriptedSupervisor([chatty], ready_timeout=5, drain_timeout=1)
+        await supervisor.start()
+        try:
+            for _ in range(500):
+                if marker.exists():
+                    return True
+                await asyncio.sleep(0.01)
+            return False
+        finally:
+            await supervisor.stop()
+
+    assert asyncio.run(chatty_worker())
+
+
+def test_unexpected_304_without_cached_copy_is_an_upstream_error():
+    pytest.importorskip("aiohttp")
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+    from upstream import UpstreamClient
+
+    async def not_modified(request):
+        return web.Response(status=304)
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", not_modified)
+
+    async def run():
+        async with TestServer(app) as stub:
+            async with UpstreamClient(base_url=str(stub.make_url("")).rstrip("/")) as upstream:
+                server = BondMCPServer(upstream=upstream)
+                result = await server.get_resource("bondmcp://health/guidelines")
+                return result, len(server.resource_cache)
+
+    result, cached = asyncio.run(run())
+    assert "304" in result["error"] and cached == 0
+
+
+def test_config_rejects_unknown_schema_types_and_validator_cache_is_bounded(monkeypatch):
+    import validation
+    from server import parse_config
+
+    def tool(schema):
+        return {"tools": [{"name": "t", "inputSchema": schema}]}
+
+    for schema in (
+        {"type": "obj"},
+        {"type": "object", "properties": {"n": {"type": "int"}}},
+        {"type": "array", "items": {"type": ["string", "date"]}},
+    ):
+        with pytest.raises(ValueError, match="unknown type"):
+            parse_config(tool(schema))
+    assert parse_config(tool({"type": "object", "properties": {"n": {"type": ["integer", "null"]}}})).tools
+
+    monkeypatch.setattr(validation, "CACHE_SIZE", 2)
+    monkeypatch.setattr(validation, "_cache", validation.OrderedDict())
+    first = validation.compile_schema({"const": 0})
+    validation.compile_schema({"const": 1})
+    assert validation.compile_schema({"const": 0}) is first
+    validation.compile_schema({"const": 2})
+    assert len(validation._cache) == 2
+    # {"const": 1} was least recently used and evicted; {"const": 0} survived
+    assert validation.compile_schema({"const": 0}) is first
+
+
+def test_stdio_overlong_line_answered_with_parse_error():
+    async def run():
+        reader = asyncio.StreamReader(limit=256)
+        writer = DummyWriter()
+        transport = StdioTransport(JSONRPCDispatcher(BondMCPServer()), reader, writer)
+        serving = asyncio.ensure_future(transport.serve())
+
+        reader.feed_data(json.dumps(request(1, "tools/list")).encode() + b"\n")
+        # Newline already buffered, past the limit
+        reader.feed_data(b'{"jsonrpc": "2.0", "id": 2, "params": "' + b"x" * 1000 + b'"}\n')
+        # Newline arrives only after several over-limit chunks
+        for _ in range(4):
+            reader.feed_data(b"y" * 300)
+            await asyncio.sleep(0)
+        reader.feed_data(b"y\n" + json.dumps(request(3, "prompts/get")).encode() + b"\n")
+        reader.feed_eof()
+        await asyncio.wait_for(serving, 1)
+        return writer.frames
+
+    frames = asyncio.run(run())
+    assert [frame["id"] for frame in frames if frame["id"] is not None] == [1, 3]
+    parse_errors = [frame for frame in frames if frame["id"] is None]
+    assert len(parse_errors) == 2
+    assert all(frame["error"]["code"] == PARSE_ERROR for frame in parse_errors)